@@ -5,38 +5,91 @@ A utility to copy Claude Code artifacts from local store into target projects.
 """
 
 import argparse
-import difflib
-import hashlib
+import atexit
+import contextlib
+import functools
 import json
 import logging
+import logging.handlers
+import os
+import queue
+import re
 import shutil
 import sys
-import tomllib
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Tuple, Optional, Dict, Any
+from typing import List, Tuple, Optional, Dict, Any, Iterator
 
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.tree import Tree
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
-from rich import box
 from rich_argparse import RichHelpFormatter
 
+# Panel, Table, Tree, Progress, Text and box are imported inside the functions
+# that render them, so --help and argument errors skip those imports. difflib
+# and subprocess are likewise imported where used.
+
 # Initialize Rich console
 console = Console()
 
+# Directory containing this script (pyproject.toml, metadata and store/)
+SCRIPT_DIR = Path(__file__).parent
+
+# Worker threads used to compare existing targets with their sources
+IDENTITY_CHECK_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Block size for byte-by-byte file comparison; most artifacts fit in one block
+COMPARE_BLOCK_SIZE = 1024 * 1024
+
+# Default number of worker threads used to copy artifacts (--max-concurrency)
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Files at least this large (and all directory artifacts) are copied on a
+# separate, smaller thread pool from the small-file majority
+LARGE_FILE_THRESHOLD = 1024 * 1024
+
+# Directory artifacts with more files than this are copied with robocopy
+# (Windows) or rsync (Unix) when available
+EXTERNAL_COPY_THRESHOLD = 100
+
+# Matches a .gitignore pattern line: captures the stripped text of every
+# line that is neither blank nor a comment. [^\S\n] is any whitespace but
+# the line separator, so \r (CRLF files) and other whitespace are stripped
+# exactly as str.strip() would
+GITIGNORE_PATTERN_RE = re.compile(r'(?m)^[^\S\n]*(?!#)(\S[^\n]*?)[^\S\n]*$')
+
+# Matches a single .gitignore line that has content (first non-blank
+# character is not '#')
+GITIGNORE_CONTENT_LINE_RE = re.compile(r'\s*[^#\s]')
+
+# Combined pattern count above which set comparison walks sorted lists
+# instead of building difference sets
+SORTED_DIFF_THRESHOLD = 10000
+
+# Operation count below which execution runs inline without a progress bar
+PROGRESS_MIN_OPERATIONS = 10
+
+# Minimum seconds between progress bar updates during execution
+PROGRESS_UPDATE_INTERVAL = 0.05
+
 
 # Utility functions for version and install date management
+@functools.lru_cache(maxsize=1)
 def get_version() -> str:
     """Read version from pyproject.toml.
 
+    The result is cached for the lifetime of the process, and tomllib is
+    only imported on first use so paths that never need the version skip it.
+
     Returns:
         Version string, or "unknown" if unable to read
     """
     try:
-        pyproject_path = Path(__file__).parent / "pyproject.toml"
+        import tomllib
+
+        pyproject_path = SCRIPT_DIR / "pyproject.toml"
         if pyproject_path.exists():
             with open(pyproject_path, "rb") as f:
                 data = tomllib.load(f)
@@ -52,7 +105,7 @@ def get_metadata_file_path() -> Path:
     Returns:
         Path to cc_setup_metadata.json in same directory as script
     """
-    return Path(__file__).parent / "cc_setup_metadata.json"
+    return SCRIPT_DIR / "cc_setup_metadata.json"
 
 
 def get_install_date() -> Optional[str]:
@@ -91,6 +144,204 @@ def set_install_date() -> None:
         pass
 
 
+# Utility functions for directory traversal
+def iter_files(directory: str) -> Iterator[os.DirEntry]:
+    """Recursively yield file entries under a directory using os.scandir.
+
+    File types come from the cached DirEntry data, so no extra stat call
+    is made per entry. Symlinks are skipped and unreadable directories
+    are silently ignored.
+
+    Args:
+        directory: Directory path to walk
+
+    Yields:
+        DirEntry for each regular file in the directory tree
+    """
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_symlink():
+                    continue
+                if entry.is_file(follow_symlinks=False):
+                    yield entry
+                elif entry.is_dir(follow_symlinks=False):
+                    yield from iter_files(entry.path)
+    except OSError:
+        pass
+
+
+def count_files(directory: str) -> int:
+    """Count files recursively in a directory.
+
+    Args:
+        directory: Directory path to count files in
+
+    Returns:
+        Total number of files in directory and subdirectories
+    """
+    return sum(1 for _ in iter_files(directory))
+
+
+def fast_copy(source: str, target: str, mode: Optional[int] = None) -> None:
+    """Copy file contents using the fastest kernel path available.
+
+    On Linux, os.copy_file_range lets the filesystem reflink or copy
+    server-side (btrfs, xfs, NFS). If it is unavailable or refused,
+    shutil.copyfile is used, which itself picks sendfile (Linux),
+    fcopyfile (macOS) or CopyFile2 (Windows). File metadata is not copied.
+
+    Args:
+        source: Source file path
+        target: Target file path
+        mode: Permission bits to give the target, or None to leave the default
+
+    Raises:
+        OSError: If the file cannot be copied
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(source, "rb") as fsrc:
+                source_stat = os.fstat(fsrc.fileno())
+                # One stat of the target (the source is already fstat'ed)
+                # guards against truncating the source when they're the same
+                try:
+                    if os.path.samestat(source_stat, os.stat(target)):
+                        raise shutil.SameFileError(f"{source!r} and {target!r} are the same file")
+                except FileNotFoundError:
+                    pass
+                with open(target, "wb") as fdst:
+                    remaining = source_stat.st_size
+                    while remaining > 0:
+                        copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                        if copied == 0:
+                            break
+                        remaining -= copied
+                    # A short copy is redone below, which sets the mode itself
+                    if remaining == 0 and mode is not None:
+                        os.fchmod(fdst.fileno(), mode)
+            if remaining == 0:
+                return
+            # copy_file_range stopped short (procfs, FUSE and some network
+            # filesystems report 0 early); redo the whole copy below
+        except shutil.SameFileError:
+            raise
+        except OSError:
+            # e.g. EXDEV/ENOSYS/EINVAL on older kernels or some filesystems
+            pass
+    shutil.copyfile(source, target)
+    if mode is not None:
+        os.chmod(target, mode)
+
+
+def write_file_atomic(path: Path, data: bytes) -> None:
+    """Write bytes to a file in one write and atomically swap it into place.
+
+    The data goes to a uniquely named temporary file next to the target,
+    which then replaces it with os.replace, so readers never see a
+    half-written file and concurrent runs never share a temporary file. A
+    symlinked target is resolved first so the link itself is kept. An
+    existing target's permission bits are preserved.
+
+    Args:
+        path: File path to write
+        data: Complete file contents
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    import tempfile
+
+    real_path = os.path.realpath(path)
+    directory, name = os.path.split(real_path)
+    tmp = tempfile.NamedTemporaryFile(dir=directory, prefix=f".{name}.", suffix=".tmp", delete=False)
+    tmp_path = tmp.name
+    try:
+        with tmp:
+            tmp.write(data)
+        if os.path.exists(real_path):
+            shutil.copymode(real_path, tmp_path)
+        else:
+            # NamedTemporaryFile creates the file owner-only
+            os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, real_path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
+
+def copy_tree(source: Path, target: Path, file_count: int) -> None:
+    """Copy a directory tree, delegating large trees to robocopy/rsync.
+
+    shutil.copytree copies one file at a time from Python, which is far
+    slower than the native tools for big trees. Small trees, missing tools
+    and tool failures all fall back to shutil.copytree, with each file
+    copied through fast_copy.
+
+    Args:
+        source: Source directory path
+        target: Target directory path
+        file_count: Number of files in the source tree
+
+    Raises:
+        OSError: If the directory cannot be copied
+    """
+    if file_count > EXTERNAL_COPY_THRESHOLD:
+        import subprocess
+
+        if sys.platform == 'win32':
+            if shutil.which('robocopy'):
+                result = subprocess.run(
+                    ['robocopy', str(source), str(target), '/E', '/NFL', '/NDL', '/NJH', '/NJS', '/NP'],
+                    stdin=subprocess.DEVNULL, capture_output=True
+                )
+                # robocopy exit codes below 8 indicate success
+                if result.returncode < 8:
+                    return
+        elif shutil.which('rsync'):
+            result = subprocess.run(
+                ['rsync', '-a', '--', f"{source}/", f"{target}/"],
+                stdin=subprocess.DEVNULL, capture_output=True
+            )
+            if result.returncode == 0:
+                return
+    # Per-file copies use the same kernel fast path as file artifacts
+    shutil.copytree(source, target, dirs_exist_ok=True, copy_function=fast_copy)
+
+
+def diff_sorted(left: List[str], right: List[str]) -> Tuple[List[str], List[str], int]:
+    """Compare two sorted lists of unique strings in a single merge walk.
+
+    Args:
+        left: Sorted list of unique strings
+        right: Sorted list of unique strings
+
+    Returns:
+        Tuple of (only in left, only in right, number in both), with both
+        lists in sorted order
+    """
+    only_left: List[str] = []
+    only_right: List[str] = []
+    common = 0
+    i = j = 0
+    while i < len(left) and j < len(right):
+        a, b = left[i], right[j]
+        if a == b:
+            common += 1
+            i += 1
+            j += 1
+        elif a < b:
+            only_left.append(a)
+            i += 1
+        else:
+            only_right.append(b)
+            j += 1
+    only_left.extend(left[i:])
+    only_right.extend(right[j:])
+    return only_left, only_right, common
+
+
 class OperationLogger:
     """Handles JSONL logging of cc_setup operations to target repositories."""
 
@@ -104,6 +355,9 @@ class OperationLogger:
         self.target_dir = target_dir
         self.logger = logger
         self.version = self._read_version()
+        # Serialized JSONL lines waiting to be written by flush()
+        self._buffer: List[str] = []
+        atexit.register(self.flush)
 
     def _read_version(self) -> str:
         """Read version from pyproject.toml.
@@ -116,37 +370,33 @@ class OperationLogger:
             self.logger.warning("Failed to read version from pyproject.toml")
         return version
 
-    def _serialize_path(self, obj: Any) -> Any:
-        """Convert Path objects to strings for JSON serialization.
+    @staticmethod
+    def _json_default(obj: Any) -> Any:
+        """Convert Path objects to strings during JSON encoding.
 
         Args:
-            obj: Object to serialize
+            obj: Object the JSON encoder cannot serialize natively
 
         Returns:
             Serializable version of the object
+
+        Raises:
+            TypeError: If the object is not a Path
         """
         if isinstance(obj, Path):
             return str(obj)
-        elif isinstance(obj, dict):
-            return {k: self._serialize_path(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [self._serialize_path(item) for item in obj]
-        return obj
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
     def log_operation(self, operation_data: Dict[str, Any]) -> None:
-        """Write operation data to JSONL log file.
+        """Queue operation data for the JSONL log file.
+
+        Entries are buffered in memory and written in one go by flush(),
+        which runs automatically at process exit.
 
         Args:
             operation_data: Dictionary containing operation details
         """
         try:
-            # Ensure .claude directory exists
-            claude_dir = self.target_dir / ".claude"
-            claude_dir.mkdir(parents=True, exist_ok=True)
-
-            # Path to JSONL log file
-            log_path = claude_dir / "cc_setup.log.jsonl"
-
             # Add timestamp and version to operation data
             log_entry = {
                 "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -154,15 +404,36 @@ class OperationLogger:
                 **operation_data
             }
 
-            # Serialize Path objects
-            log_entry = self._serialize_path(log_entry)
+            # One JSON object per line (Path objects converted by the encoder)
+            self._buffer.append(
+                json.dumps(log_entry, ensure_ascii=False, default=self._json_default) + "\n"
+            )
 
-            # Append to JSONL file (one JSON object per line)
-            with open(log_path, "a", encoding="utf-8") as f:
-                json.dump(log_entry, f, ensure_ascii=False)
-                f.write("\n")
+        except Exception as e:
+            # Don't fail the operation if logging fails
+            error_msg = f"Failed to write JSONL log: {e}"
+            self.logger.error(error_msg)
+            console.print(f"[yellow]⚠ Warning: {error_msg}[/yellow]")
 
-            self.logger.info(f"JSONL log entry written to {log_path}")
+    def flush(self) -> None:
+        """Append all buffered entries to the JSONL log file."""
+        if not self._buffer:
+            return
+
+        try:
+            # Ensure .claude directory exists
+            claude_dir = self.target_dir / ".claude"
+            claude_dir.mkdir(parents=True, exist_ok=True)
+
+            # Path to JSONL log file
+            log_path = claude_dir / "cc_setup.log.jsonl"
+
+            # Encode once and append the whole batch in a single binary write
+            with open(log_path, "ab") as f:
+                f.write("".join(self._buffer).encode("utf-8"))
+
+            self.logger.info(f"{len(self._buffer)} JSONL log entries written to {log_path}")
+            self._buffer.clear()
 
         except Exception as e:
             # Don't fail the operation if logging fails
@@ -175,13 +446,16 @@ class ArtifactDefinition:
     """Defines a single artifact to be copied."""
 
     def __init__(self, filename: str, source_path: Path, category: str,
-                 target_subdir: str, description: str = "", is_directory: bool = False):
+                 target_subdir: str, description: str = "", is_directory: bool = False,
+                 file_count: int = 1, dir_entry: Optional[os.DirEntry] = None):
         self.filename = filename
         self.source_path = source_path
         self.category = category
         self.target_subdir = target_subdir
         self.description = description
         self.is_directory = is_directory
+        self.file_count = file_count  # Number of files (1 for files, N for directories)
+        self.dir_entry = dir_entry  # scandir entry from discovery (caches the source stat)
 
 
 class ArtifactStore:
@@ -190,32 +464,41 @@ class ArtifactStore:
     def __init__(self, store_base_path: Path = None):
         if store_base_path is None:
             # Default to store/ in same directory as script
-            self.store_base_path = Path(__file__).parent / "store"
+            self.store_base_path = SCRIPT_DIR / "store"
         else:
             self.store_base_path = Path(store_base_path)
+        # Discovered artifacts per mode, so repeated lookups skip the store walk
+        self._cache: Dict[str, List[ArtifactDefinition]] = {}
 
     def get_artifacts(self, mode: str) -> List[ArtifactDefinition]:
-        """Get all artifacts for specified mode."""
-        return self._discover_artifacts(mode)
+        """Get all artifacts for specified mode (cached per mode)."""
+        if mode not in self._cache:
+            self._cache[mode] = list(self._iter_artifacts(mode))
+        return self._cache[mode]
 
-    def _discover_artifacts(self, mode: str) -> List[ArtifactDefinition]:
-        """Discover artifacts in store/{mode}/"""
+    def _iter_artifacts(self, mode: str) -> Iterator[ArtifactDefinition]:
+        """Discover artifacts in store/{mode}/, yielding them as they are found."""
         store_path = self.store_base_path / mode
-        artifacts = []
 
-        if not store_path.exists():
-            return artifacts
+        # One scandir of the mode directory tells which of settings.json and
+        # the category folders exist, and keeps their entries for later stats
+        try:
+            with os.scandir(store_path) as it:
+                mode_entries = {entry.name: entry for entry in it}
+        except OSError:
+            return
 
         # Discover settings.json (special case - not in subfolder)
-        settings_file = store_path / "settings.json"
-        if settings_file.exists():
-            artifacts.append(ArtifactDefinition(
+        settings_entry = mode_entries.get("settings.json")
+        if settings_entry is not None:
+            yield ArtifactDefinition(
                 filename="settings.json",
-                source_path=settings_file,
+                source_path=Path(settings_entry.path),
                 category="Settings",
                 target_subdir=".claude",
-                description="Claude Code configuration"
-            ))
+                description="Claude Code configuration",
+                dir_entry=settings_entry
+            )
 
         # Discover categorized artifacts
         categories = {
@@ -226,38 +509,51 @@ class ArtifactStore:
         }
 
         for category_dir, (target_subdir, category_name) in categories.items():
-            category_path = store_path / category_dir
-            if not category_path.exists():
+            category_entry = mode_entries.get(category_dir)
+            if category_entry is None or not category_entry.is_dir():
                 continue
+            category_path = store_path / category_dir
 
-            for artifact_file in sorted(category_path.iterdir()):
-                if artifact_file.is_file():
+            # Single scandir pass; DirEntry caches the file type, so no
+            # per-entry stat is needed for the is_file()/is_dir() checks.
+            # Entries stream in directory order - analyze_operations sorts.
+            subdir_entries = {}
+            with os.scandir(category_path) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        subdir_entries[entry.name] = entry
+                        continue
+                    if not entry.is_file():
+                        continue
+
+                    stem = os.path.splitext(entry.name)[0]
                     # Determine description based on file type
                     if category_dir == "hooks":
-                        desc = f"Hook: {artifact_file.stem}"
+                        desc = f"Hook: {stem}"
                     elif category_dir == "commands":
-                        desc = f"Slash command: /{artifact_file.stem}"
+                        desc = f"Slash command: /{stem}"
                     elif category_dir == "scripts":
-                        desc = f"Utility script: {artifact_file.name}"
+                        desc = f"Utility script: {entry.name}"
                     elif category_dir == "adws":
-                        desc = f"Agent Developer Workflow: {artifact_file.stem}"
+                        desc = f"Agent Developer Workflow: {stem}"
                     else:
-                        desc = artifact_file.name
+                        desc = entry.name
 
-                    artifacts.append(ArtifactDefinition(
-                        filename=artifact_file.name,
-                        source_path=artifact_file,
+                    yield ArtifactDefinition(
+                        filename=entry.name,
+                        source_path=Path(entry.path),
                         category=category_name,
                         target_subdir=target_subdir,
-                        description=desc
-                    ))
+                        description=desc,
+                        dir_entry=entry
+                    )
 
             # Special handling for adws category - discover subdirectories
             if category_dir == "adws":
                 adws_subdirs = ["adw_modules", "adw_tests", "adw_triggers"]
                 for subdir_name in adws_subdirs:
                     subdir_path = category_path / subdir_name
-                    if subdir_path.exists() and subdir_path.is_dir():
+                    if subdir_name in subdir_entries:
                         # Determine description for subdirectory
                         if subdir_name == "adw_modules":
                             desc = "ADW Modules Directory"
@@ -268,16 +564,16 @@ class ArtifactStore:
                         else:
                             desc = f"ADW Directory: {subdir_name}"
 
-                        artifacts.append(ArtifactDefinition(
+                        yield ArtifactDefinition(
                             filename=subdir_name,
                             source_path=subdir_path,
                             category=category_name,
                             target_subdir=target_subdir,
                             description=desc,
-                            is_directory=True
-                        ))
-
-        return artifacts
+                            is_directory=True,
+                            file_count=count_files(str(subdir_path)),
+                            dir_entry=subdir_entries[subdir_name]
+                        )
 
     def validate_store(self, mode: str) -> Tuple[bool, List[str]]:
         """Validate that store directory exists and has content."""
@@ -290,12 +586,40 @@ class ArtifactStore:
             return False, [f"Mode directory not found: {mode_path}"]
 
         # Check for at least some artifacts
-        artifact_count = len(self.get_artifacts(mode))
-        if artifact_count == 0:
+        if not self.has_artifacts(mode):
             return False, [f"No artifacts found in: {mode_path}"]
 
         return True, []
 
+    def has_artifacts(self, mode: str) -> bool:
+        """Check whether a mode has any artifacts.
+
+        Uses the cached discovery when available; otherwise stops at the
+        first artifact found instead of walking the whole store.
+
+        Args:
+            mode: Setup mode (e.g., 'basic', 'iso')
+
+        Returns:
+            True if at least one artifact exists for the mode
+        """
+        if mode in self._cache:
+            return bool(self._cache[mode])
+        return next(self._iter_artifacts(mode), None) is not None
+
+
+@functools.lru_cache(maxsize=1)
+def get_artifact_store() -> ArtifactStore:
+    """Get the shared store for the bundled store/ directory.
+
+    Shared so its per-mode discovery cache is reused by every caller in
+    the process (setup runs and --help-artifacts alike).
+
+    Returns:
+        ArtifactStore for the default store location
+    """
+    return ArtifactStore()
+
 
 class SetupConfig:
     """Configuration for the setup process."""
@@ -309,10 +633,13 @@ class SetupConfig:
         self.show_help_examples = args.help_examples
 
         # GitIgnore configuration
-        self.gitignore_lang = args.gitignore if hasattr(args, 'gitignore') else None
-        self.gitignore_execute = args.gitignore_execute if hasattr(args, 'gitignore_execute') else 'compare'
+        self.gitignore_lang = getattr(args, 'gitignore', None)
+        self.gitignore_execute = getattr(args, 'gitignore_execute', 'compare')
         # Comparison mode: 'diff' for unified diff, 'set' for set-based comparison
-        self.gitignore_compare_mode = args.gitignore_compare_mode if hasattr(args, 'gitignore_compare_mode') else 'diff'
+        self.gitignore_compare_mode = getattr(args, 'gitignore_compare_mode', 'diff')
+
+        # Number of worker threads used to copy artifacts in execute mode
+        self.max_concurrency = getattr(args, 'max_concurrency', DEFAULT_MAX_CONCURRENCY)
 
         # Statistics
         self.files_to_copy = 0
@@ -334,7 +661,8 @@ class FileOperation:
 
     def __init__(self, artifact: ArtifactDefinition, source_path: Path,
                  target_path: Path, exists: bool, is_identical: bool,
-                 will_copy: bool, will_overwrite: bool, file_count: int = 1):
+                 will_copy: bool, will_overwrite: bool, file_count: int = 1,
+                 source_size: int = 0, source_exists: Optional[bool] = None):
         self.artifact = artifact
         self.source_path = source_path
         self.target_path = target_path
@@ -343,11 +671,14 @@ class FileOperation:
         self.will_copy = will_copy
         self.will_overwrite = will_overwrite
         self.file_count = file_count  # Number of files (1 for files, N for directories)
+        self.source_size = source_size  # Source size in bytes (0 if missing or a directory)
+        # Known from analysis when given; checked here (once) otherwise
+        self.source_exists = source_path.exists() if source_exists is None else source_exists
         self.status = self._determine_status()
 
     def _determine_status(self) -> str:
         """Determine the status indicator."""
-        if not self.source_path.exists():
+        if not self.source_exists:
             return "✗ Missing"
         elif self.will_overwrite:
             return "⚠ Overwrite"
@@ -361,7 +692,7 @@ class FileOperation:
 
     def get_action(self, execute: bool) -> str:
         """Get the action description."""
-        if not self.source_path.exists():
+        if not self.source_exists:
             return "Skip (missing)"
         elif self.will_overwrite:
             return "Overwriting" if execute else "Will overwrite"
@@ -380,10 +711,29 @@ class CCSetup:
 
     def __init__(self, config: SetupConfig):
         self.config = config
-        self.artifact_store = ArtifactStore()
+        self.artifact_store = get_artifact_store()
         self.logger = self._setup_logging()
         self.operations: List[FileOperation] = []
         self.operation_logger = None  # Will be initialized after target_dir is validated
+        # Target directories already created during execution
+        self._created_dirs: set = set()
+        # Target paths that are dangling symlinks, replaced when copied
+        self._dangling_targets: set = set()
+        # Guards the copy/skip counters updated from worker threads
+        self._stats_lock = threading.Lock()
+        # Per-operation log lines from worker threads, written as one record
+        self._pending_log: List[str] = []
+        # Parsed .gitignore files: path -> (mtime_ns, size, lines, patterns)
+        self._gitignore_cache: Dict[str, Tuple[int, int, List[str], frozenset]] = {}
+        # Parsed gitignore templates: language -> (lines, patterns)
+        self._template_cache: Dict[str, Tuple[List[str], frozenset]] = {}
+        # Available gitignore languages, listed on first use
+        self._available_languages: Optional[List[str]] = None
+        # Template for the requested language, resolved once up front
+        self._resolved_template_path: Optional[Path] = (
+            self.get_gitignore_template_path(config.gitignore_lang)
+            if config.gitignore_lang else None
+        )
 
     def _setup_logging(self) -> logging.Logger:
         """Set up logging to file."""
@@ -393,11 +743,25 @@ class CCSetup:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         log_file = log_dir / f"cc_setup_{timestamp}.log"
 
+        # Log records are handed to a queue and written to the file by a
+        # background listener thread, so logging never blocks on disk I/O.
+        # delay=True defers creating the file until the first record.
+        file_handler = logging.FileHandler(log_file, delay=True)
+        file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+        log_queue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(log_queue, file_handler)
+        listener.start()
+        atexit.register(listener.stop)
+
+        # The queue handler only merges the message (and any traceback);
+        # timestamp and level are added by the file handler's formatter
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter('%(message)s'))
+
         logging.basicConfig(
             level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
             handlers=[
-                logging.FileHandler(log_file),
+                queue_handler,
             ]
         )
 
@@ -511,31 +875,13 @@ class CCSetup:
 
         return operation_data
 
-    def get_file_hash(self, file_path: Path) -> str:
-        """Calculate SHA-256 hash of file contents.
-
-        Args:
-            file_path: Path to file to hash
-
-        Returns:
-            Hexadecimal string of SHA-256 hash
-
-        Raises:
-            OSError: If file cannot be read
-        """
-        try:
-            sha256 = hashlib.sha256()
-            with open(file_path, 'rb') as f:
-                while chunk := f.read(8192):
-                    sha256.update(chunk)
-            return sha256.hexdigest()
-        except OSError as e:
-            self.logger.warning(f"Failed to hash {file_path}: {e}")
-            raise
-
     def files_are_identical(self, source: Path, target: Path) -> bool:
         """Check if two files have identical content.
 
+        Uses a byte-level comparison that stops at the first differing
+        block, and rejects files of different sizes without reading them.
+        Blocks are compared as bytes (a memcmp), with no hashing.
+
         Args:
             source: Source file path
             target: Target file path
@@ -547,15 +893,24 @@ class CCSetup:
             Returns False if either file cannot be read
         """
         try:
-            return self.get_file_hash(source) == self.get_file_hash(target)
+            with open(source, 'rb') as fsrc, open(target, 'rb') as fdst:
+                if os.fstat(fsrc.fileno()).st_size != os.fstat(fdst.fileno()).st_size:
+                    return False
+                while True:
+                    block = fsrc.read(COMPARE_BLOCK_SIZE)
+                    if block != fdst.read(COMPARE_BLOCK_SIZE):
+                        return False
+                    if not block:
+                        return True
         except OSError:
             return False
 
     def directories_are_identical(self, source: Path, target: Path) -> bool:
         """Check if two directories have identical content.
 
-        Recursively compares all files in both directories, checking both
-        structure (same files exist) and content (files are identical).
+        Recursively compares all files in both directories, checking
+        structure (same files exist), then sizes, and only then content
+        (files are identical).
 
         Args:
             source: Source directory path
@@ -568,24 +923,25 @@ class CCSetup:
             Returns False if either directory cannot be read or if they differ
         """
         try:
-            if not source.exists() or not target.exists():
+            if not os.path.isdir(source) or not os.path.isdir(target):
                 return False
-            if not source.is_dir() or not target.is_dir():
-                return False
-
-            # Get all files in both directories (relative paths)
-            source_files = {f.relative_to(source) for f in source.rglob('*') if f.is_file()}
-            target_files = {f.relative_to(target) for f in target.rglob('*') if f.is_file()}
 
-            # Check if same files exist
-            if source_files != target_files:
+            # Get all files in both directories (relative path -> size).
+            # Entry paths extend the root given to scandir, so slicing off
+            # the root prefix is enough (no os.path.relpath per file).
+            source_root = os.path.join(str(source), "")
+            target_root = os.path.join(str(target), "")
+            source_sizes = {e.path[len(source_root):]: e.stat().st_size for e in iter_files(str(source))}
+            target_sizes = {e.path[len(target_root):]: e.stat().st_size for e in iter_files(str(target))}
+
+            # Check if same files exist with the same sizes; any size
+            # mismatch settles it before a single file is read
+            if source_sizes != target_sizes:
                 return False
 
             # Check if all files have identical content
-            for rel_path in source_files:
-                source_file = source / rel_path
-                target_file = target / rel_path
-                if not self.files_are_identical(source_file, target_file):
+            for rel_path in source_sizes:
+                if not self.files_are_identical(source_root + rel_path, target_root + rel_path):
                     return False
 
             return True
@@ -604,9 +960,9 @@ class CCSetup:
             Total number of files in directory and subdirectories
         """
         try:
-            if not directory.exists() or not directory.is_dir():
+            if not directory.is_dir():
                 return 0
-            return len([f for f in directory.rglob('*') if f.is_file()])
+            return count_files(str(directory))
         except Exception as e:
             self.logger.warning(f"Failed to count files in {directory}: {e}")
             return 0
@@ -631,6 +987,9 @@ class CCSetup:
         Returns:
             List of language names that have templates
         """
+        if self._available_languages is not None:
+            return self._available_languages
+
         git_dir = self.artifact_store.store_base_path / "git"
         if not git_dir.exists():
             return []
@@ -641,52 +1000,96 @@ class CCSetup:
                 lang = file.name.replace(".gitignore_", "")
                 languages.append(lang)
 
-        return sorted(languages)
+        self._available_languages = sorted(languages)
+        return self._available_languages
 
-    def read_gitignore_lines(self, file_path: Path) -> List[str]:
-        """Read .gitignore file and return list of lines.
+    def _read_gitignore(self, file_path: Optional[Path]) -> Tuple[List[str], frozenset]:
+        """Read and parse a .gitignore file, reusing earlier results.
+
+        Results are cached per path and reused while the file's mtime and
+        size are unchanged, so repeated reads within a run cost one stat.
 
         Args:
             file_path: Path to .gitignore file
 
         Returns:
-            List of lines from the file (including empty lines and comments)
+            Tuple of (lines, patterns); empty if the file is missing or unreadable
         """
-        if not file_path.exists():
-            return []
+        if file_path is None:
+            return [], frozenset()
 
+        key = str(file_path)
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return [line.rstrip('\n\r') for line in f.readlines()]
+            st = os.stat(file_path)
+        except OSError:
+            self._gitignore_cache.pop(key, None)
+            return [], frozenset()
+
+        cached = self._gitignore_cache.get(key)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2], cached[3]
+
+        try:
+            with open(file_path, 'rb') as f:
+                text = f.read().decode('utf-8')
+            # Decode once and split on any newline style, as text mode would
+            lines = text.replace('\r\n', '\n').replace('\r', '\n').split('\n') if text else []
+            if lines and lines[-1] == '':
+                lines.pop()
         except Exception as e:
             self.logger.error(f"Failed to read {file_path}: {e}")
-            return []
+            return [], frozenset()
+
+        patterns = self.extract_gitignore_patterns(lines)
+        self._gitignore_cache[key] = (st.st_mtime_ns, st.st_size, lines, patterns)
+        return lines, patterns
+
+    def _get_template(self, lang: str) -> Tuple[List[str], frozenset]:
+        """Get the parsed gitignore template for a language.
+
+        Args:
+            lang: Language name (e.g., 'python', 'csharp')
 
-    def extract_gitignore_patterns(self, lines: List[str]) -> set:
+        Returns:
+            Tuple of (lines, patterns); empty if no template exists
+        """
+        if lang not in self._template_cache:
+            if lang == self.config.gitignore_lang:
+                template_path = self._resolved_template_path
+            else:
+                template_path = self.get_gitignore_template_path(lang)
+            self._template_cache[lang] = self._read_gitignore(template_path)
+        return self._template_cache[lang]
+
+    def read_gitignore_lines(self, file_path: Path) -> List[str]:
+        """Read .gitignore file and return list of lines.
+
+        Args:
+            file_path: Path to .gitignore file
+
+        Returns:
+            List of lines from the file (including empty lines and comments).
+            The list is shared with the read cache and must not be mutated.
+        """
+        return self._read_gitignore(file_path)[0]
+
+    def extract_gitignore_patterns(self, lines: List[str]) -> frozenset:
         """Extract meaningful patterns from .gitignore lines.
 
         Filters out empty lines and comment-only lines, returning only
         actual ignore patterns. This is useful for semantic comparison
-        where order doesn't matter.
+        where order doesn't matter. Filtering is done in a single
+        precompiled regex pass over the joined text. Patterns are interned
+        so comparisons between template and target sets usually match on
+        identity before falling back to string equality.
 
         Args:
             lines: List of lines from .gitignore file
 
         Returns:
-            Set of non-empty, non-comment patterns
+            Frozenset of non-empty, non-comment patterns
         """
-        patterns = set()
-        for line in lines:
-            stripped = line.strip()
-            # Skip empty lines
-            if not stripped:
-                continue
-            # Skip comment-only lines
-            if stripped.startswith('#'):
-                continue
-            # Add the pattern (with original spacing preserved)
-            patterns.add(stripped)
-        return patterns
+        return frozenset(map(sys.intern, GITIGNORE_PATTERN_RE.findall("\n".join(lines))))
 
     def validate_target_directory(self) -> bool:
         """Validate or create target directory."""
@@ -710,53 +1113,145 @@ class CCSetup:
 
         return True
 
+    @staticmethod
+    def _stat_or_none(path: Path) -> Optional[os.stat_result]:
+        """Stat a path, returning None if it does not exist or cannot be read."""
+        try:
+            return os.stat(path)
+        except (OSError, ValueError):
+            return None
+
+    def _source_stat(self, artifact: ArtifactDefinition) -> Optional[os.stat_result]:
+        """Stat an artifact's source, reusing the scandir entry from discovery."""
+        if artifact.dir_entry is None:
+            return self._stat_or_none(artifact.source_path)
+        try:
+            return artifact.dir_entry.stat()
+        except OSError:
+            return None
+
     def analyze_operations(self) -> None:
         """Analyze what operations would be performed."""
         artifacts = self.artifact_store.get_artifacts(self.config.mode)
-
-        for artifact in artifacts:
+        # Join target paths as strings (cheaper than chained Path "/")
+        target_dir_str = str(self.config.target_dir)
+        target_paths = [Path(os.path.join(target_dir_str, artifact.target_subdir, artifact.filename))
+                        for artifact in artifacts]
+
+        # One scandir per target subdirectory answers existence for every
+        # artifact in it; a target is only stat'ed when its size is needed,
+        # or when it is a symlink: like Path.exists(), a dangling link counts
+        # as missing so the artifact is still deployed. Entries are also
+        # indexed by casefolded name: on a case-insensitive filesystem
+        # (Windows, default macOS) a target that differs only in case is the
+        # same file and must not be treated as new.
+        subdir_entries: Dict[str, Tuple[Dict[str, os.DirEntry], Dict[str, os.DirEntry]]] = {}
+        for subdir in {artifact.target_subdir for artifact in artifacts}:
+            try:
+                with os.scandir(os.path.join(target_dir_str, subdir)) as it:
+                    entries = {entry.name: entry for entry in it}
+            except OSError:
+                entries = {}
+            subdir_entries[subdir] = (entries, {name.casefold(): entry for name, entry in entries.items()})
+        target_entries = []
+        for artifact, target_path in zip(artifacts, target_paths):
+            entries, folded_entries = subdir_entries[artifact.target_subdir]
+            entry = entries.get(artifact.filename)
+            if entry is None:
+                entry = folded_entries.get(artifact.filename.casefold())
+                # Only the filesystem knows whether a case variant is the same file
+                if entry is not None and not os.path.exists(target_path):
+                    entry = None
+            if entry is not None and entry.is_symlink():
+                try:
+                    entry.stat()
+                except OSError:
+                    self._dangling_targets.add(str(target_path))
+                    entry = None
+            target_entries.append(entry)
+        source_stats = [self._source_stat(artifact) for artifact in artifacts]
+        target_exists = [entry is not None for entry in target_entries]
+        source_exists = [st is not None for st in source_stats]
+
+        # Collect the source/target pairs that need a content comparison
+        checks = []
+        for index, artifact in enumerate(artifacts):
+            source_stat, target_entry = source_stats[index], target_entries[index]
+            if source_stat is None or target_entry is None:
+                continue
+            if artifact.is_directory:
+                if self.config.overwrite:
+                    # Existing directories are recopied under --overwrite
+                    # whatever their content, so skip the recursive compare
+                    continue
+                compare = self.directories_are_identical
+            else:
+                try:
+                    target_size = target_entry.stat().st_size
+                except OSError:
+                    continue
+                if source_stat.st_size != target_size:
+                    # Different sizes can't be identical - no need to read either file
+                    continue
+                compare = self.files_are_identical
+            checks.append((index, compare, artifact.source_path, target_paths[index]))
+
+        # Check if files/directories are identical. Comparisons are I/O bound
+        # (file reads release the GIL), so run them concurrently; a fresh
+        # target has nothing to compare and starts no threads.
+        identical_results = [False] * len(artifacts)
+        if checks:
+            workers = min(IDENTITY_CHECK_WORKERS, len(checks))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(compare, source, target)
+                           for _, compare, source, target in checks]
+                for (index, *_), future in zip(checks, futures):
+                    identical_results[index] = future.result()
+
+        for artifact, target_path, exists, source_ok, source_stat, is_identical in zip(
+                artifacts, target_paths, target_exists, source_exists, source_stats, identical_results):
             source_path = artifact.source_path
-            target_path = self.config.target_dir / artifact.target_subdir / artifact.filename
-
-            exists = target_path.exists()
-
-            # Check if files/directories are identical
-            is_identical = False
-            if exists and source_path.exists():
-                if artifact.is_directory:
-                    is_identical = self.directories_are_identical(source_path, target_path)
-                else:
-                    is_identical = self.files_are_identical(source_path, target_path)
 
             # For directories: copy if doesn't exist OR if overwrite is enabled
             # For files: don't copy if identical, even with --overwrite flag
             if artifact.is_directory:
-                will_copy = (not exists or self.config.overwrite) and source_path.exists()
-                will_overwrite = exists and self.config.overwrite and source_path.exists()
+                will_copy = (not exists or self.config.overwrite) and source_ok
+                will_overwrite = exists and self.config.overwrite and source_ok
             else:
-                will_copy = (not exists or (self.config.overwrite and not is_identical)) and source_path.exists()
-                will_overwrite = exists and self.config.overwrite and source_path.exists() and not is_identical
+                will_copy = (not exists or (self.config.overwrite and not is_identical)) and source_ok
+                will_overwrite = exists and self.config.overwrite and source_ok and not is_identical
 
-            # Count files for directories, 1 for regular files
-            file_count = 1
-            if artifact.is_directory and source_path.exists():
-                file_count = self.count_files_in_directory(source_path)
+            # Files in the artifact (counted once during discovery)
+            file_count = artifact.file_count if source_ok else 1
 
+            source_size = source_stat.st_size if source_ok and not artifact.is_directory else 0
             operation = FileOperation(artifact, source_path, target_path,
-                                     exists, is_identical, will_copy, will_overwrite, file_count)
+                                     exists, is_identical, will_copy, will_overwrite, file_count,
+                                     source_size, source_ok)
             self.operations.append(operation)
 
-            # Update statistics (count actual files for directories)
-            if will_copy and not will_overwrite:
-                self.config.files_to_copy += file_count
-            if exists:
-                self.config.files_exist += file_count
-                if is_identical:
-                    self.config.files_identical += file_count
-                else:
-                    self.config.files_different += file_count
-            if will_overwrite:
-                self.config.files_to_overwrite += file_count
+        # Update statistics in one pass (count actual files for directories)
+        stats = Counter()
+        for op in self.operations:
+            if op.will_copy and not op.will_overwrite:
+                stats["files_to_copy"] += op.file_count
+            if op.exists:
+                stats["files_exist"] += op.file_count
+                stats["files_identical" if op.is_identical else "files_different"] += op.file_count
+            if op.will_overwrite:
+                stats["files_to_overwrite"] += op.file_count
+        for name, count in stats.items():
+            setattr(self.config, name, getattr(self.config, name) + count)
+
+        # Discovery streams entries in directory order; order the (small)
+        # operations list here - by category as discovered, files before
+        # directories, then by name - for display, logging and execution
+        category_rank: Dict[str, int] = {}
+        for op in self.operations:
+            category_rank.setdefault(op.artifact.category, len(category_rank))
+        self.operations.sort(key=lambda op: (category_rank[op.artifact.category],
+                                             op.artifact.is_directory,
+                                             op.artifact.filename))
 
         self.logger.info(f"Analysis complete: {len(self.operations)} operations planned")
         self.logger.info(f"Files to copy: {self.config.files_to_copy}")
@@ -767,6 +1262,9 @@ class CCSetup:
 
     def display_header(self) -> None:
         """Display header panel."""
+        from rich import box
+        from rich.panel import Panel
+
         mode_str = "Basic Mode" if self.config.mode == "basic" else \
                    "Isolated Worktree Mode" if self.config.mode == "iso" else \
                    "Isolated Worktree Extended Mode (v1)"
@@ -784,6 +1282,8 @@ Store: [dim]{self.artifact_store.store_base_path}[/dim]"""
 
     def display_directory_tree(self) -> None:
         """Display directory structure to be created."""
+        from rich.tree import Tree
+
         tree = Tree(f"[bold cyan]{self.config.target_dir.name}/[/bold cyan]")
 
         claude_node = tree.add("[cyan].claude/[/cyan]")
@@ -802,6 +1302,9 @@ Store: [dim]{self.artifact_store.store_base_path}[/dim]"""
 
     def display_operations_table(self) -> None:
         """Display operations in a table."""
+        from rich import box
+        from rich.table import Table
+
         table = Table(title="\n📋 Artifacts Analysis", box=box.ROUNDED)
 
         table.add_column("Category", style="cyan", no_wrap=True)
@@ -809,9 +1312,14 @@ Store: [dim]{self.artifact_store.store_base_path}[/dim]"""
         table.add_column("Status", justify="center", no_wrap=True)
         table.add_column("Action", style="yellow", no_wrap=True)
 
+        # Build every row and log line in one pass; the log lines are
+        # written as a single record
+        log_lines = []
         for op in self.operations:
+            action = op.get_action(False)
+
             # Determine row style
-            if not op.source_path.exists():
+            if not op.source_exists:
                 style = "red dim"
             elif op.will_overwrite:
                 style = "red"
@@ -832,23 +1340,26 @@ Store: [dim]{self.artifact_store.store_base_path}[/dim]"""
                 op.artifact.category,
                 filename_display,
                 op.status,
-                op.get_action(False),
+                action,
                 style=style
             )
 
             # Log with file count if directory
-            log_msg = f"{op.artifact.category}: {op.artifact.filename}"
-            if op.artifact.is_directory and op.file_count > 1:
-                log_msg += f" ({op.file_count} files)"
-            log_msg += f" - {op.status} - {op.get_action(False)}"
+            log_msg = f"{op.artifact.category}: {filename_display} - {op.status} - {action}"
             if op.is_identical:
                 log_msg += " (identical)"
-            self.logger.info(log_msg)
+            log_lines.append(log_msg)
+
+        if log_lines:
+            self.logger.info("\n".join(log_lines))
 
         console.print(table)
 
     def display_summary(self) -> None:
         """Display summary panel."""
+        from rich import box
+        from rich.panel import Panel
+
         total_new = self.config.files_to_copy
         total_identical = self.config.files_identical
         total_different = self.config.files_different
@@ -877,66 +1388,166 @@ Store: [dim]{self.artifact_store.store_base_path}[/dim]"""
 
         self.logger.info("Summary displayed")
 
-    def execute_operations(self) -> None:
-        """Execute the file copy operations."""
-        if not self.config.execute:
-            return
+    def _seed_created_dirs(self) -> None:
+        """Record the target directory and its existing subdirectories.
 
-        console.print("\n[bold]Executing operations...[/bold]\n")
+        One os.scandir pass lets the first operations skip makedirs for
+        directories that are already present (e.g. .claude, scripts).
+        """
+        target_dir = str(self.config.target_dir)
+        self._created_dirs.add(target_dir)
+        try:
+            with os.scandir(target_dir) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        self._created_dirs.add(entry.path)
+        except OSError:
+            pass
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            console=console
-        ) as progress:
+    def _execute_one(self, op: FileOperation) -> str:
+        """Copy or skip a single operation.
 
-            task = progress.add_task("[cyan]Copying files...", total=len(self.operations))
+        Runs on a worker thread; shared counters are updated under a lock
+        and log lines are queued for execute_operations to write in one go.
 
-            for op in self.operations:
-                # Create target directory if needed
-                op.target_path.parent.mkdir(parents=True, exist_ok=True)
-
-                if op.will_copy:
-                    try:
-                        # Handle directory artifacts
-                        if op.artifact.is_directory:
-                            # For directories, use copytree
-                            if op.target_path.exists():
-                                # If overwrite is enabled and directory exists, remove it first
-                                if self.config.overwrite:
-                                    shutil.rmtree(op.target_path)
-                                    shutil.copytree(op.source_path, op.target_path)
-                                # If not overwriting, skip (will_copy should be False, but double-check)
-                            else:
-                                # Directory doesn't exist, copy it
-                                shutil.copytree(op.source_path, op.target_path)
-
-                            self.config.files_copied += op.file_count
-                            self.logger.info(f"Copied directory: {op.artifact.filename} ({op.file_count} files) -> {op.target_path}")
-                        else:
-                            # Handle file artifacts (existing logic)
-                            shutil.copy2(op.source_path, op.target_path)
+        Args:
+            op: File operation to execute
 
-                            # Set executable permissions for .sh files on Unix
-                            if op.artifact.filename.endswith('.sh') and sys.platform != 'win32':
-                                op.target_path.chmod(0o755)
+        Returns:
+            Outcome of the operation: "copied", "skipped" or "failed"
+        """
+        if op.will_copy:
+            try:
+                # Writing through a dangling symlink would follow it, so
+                # replace the link itself
+                if str(op.target_path) in self._dangling_targets:
+                    os.unlink(op.target_path)
+
+                # Handle directory artifacts
+                if op.artifact.is_directory:
+                    # analyze_operations already stat'ed the target: an existing
+                    # directory is only copied when overwriting, so clear it first
+                    if op.will_overwrite:
+                        shutil.rmtree(op.target_path)
+                    copy_tree(op.source_path, op.target_path, op.file_count)
+
+                    with self._stats_lock:
+                        self.config.files_copied += op.file_count
+                    self._pending_log.append(f"Copied directory: {op.artifact.filename} ({op.file_count} files) -> {op.target_path}")
+                else:
+                    # Handle file artifacts - copy contents only via the
+                    # kernel fast path, skipping copy2's metadata syscalls.
+                    # .sh files are made executable on Unix while still open.
+                    mode = 0o755 if op.artifact.filename.endswith('.sh') and sys.platform != 'win32' else None
+                    fast_copy(op.source_path, op.target_path, mode)
+
+                    with self._stats_lock:
+                        self.config.files_copied += op.file_count
+                    self._pending_log.append(f"Copied: {op.artifact.filename} -> {op.target_path}")
+                return "copied"
+
+            except Exception as e:
+                console.print(f"[red]✗ Failed to copy {op.artifact.filename}: {e}[/red]")
+                self.logger.error(f"Failed to copy {op.artifact.filename}: {e}")
+                return "failed"
+        else:
+            with self._stats_lock:
+                self.config.files_skipped += op.file_count
+            skip_msg = f"Skipped: {op.artifact.filename}"
+            if op.artifact.is_directory and op.file_count > 1:
+                skip_msg += f" ({op.file_count} files)"
+            self._pending_log.append(skip_msg)
+            return "skipped"
 
-                            self.config.files_copied += op.file_count
-                            self.logger.info(f"Copied: {op.artifact.filename} -> {op.target_path}")
+    def execute_operations(self) -> None:
+        """Execute the file copy operations.
 
-                    except Exception as e:
-                        console.print(f"[red]✗ Failed to copy {op.artifact.filename}: {e}[/red]")
-                        self.logger.error(f"Failed to copy {op.artifact.filename}: {e}")
-                else:
-                    self.config.files_skipped += op.file_count
-                    skip_msg = f"Skipped: {op.artifact.filename}"
-                    if op.artifact.is_directory and op.file_count > 1:
-                        skip_msg += f" ({op.file_count} files)"
-                    self.logger.info(skip_msg)
+        Operations are copied concurrently on at most --max-concurrency
+        worker threads; copies are I/O bound and release the GIL. Small
+        runs are copied inline with a line per operation instead.
+        """
+        if not self.config.execute:
+            return
 
-                progress.update(task, advance=1)
+        console.print("\n[bold]Executing operations...[/bold]\n")
+
+        # Create target directories up front (once per directory, and only
+        # where something will be copied) so the worker threads never race
+        # on mkdir
+        self._seed_created_dirs()
+        parent_dirs = {os.path.dirname(op.target_path) for op in self.operations if op.will_copy}
+        for parent_dir in parent_dirs:
+            if parent_dir not in self._created_dirs:
+                os.makedirs(parent_dir, exist_ok=True)
+                # makedirs also created (or found) every ancestor
+                directory = parent_dir
+                while directory not in self._created_dirs:
+                    self._created_dirs.add(directory)
+                    directory = os.path.dirname(directory)
+
+        if len(self.operations) < PROGRESS_MIN_OPERATIONS:
+            # Too few operations to be worth a live display or thread pools
+            # Failures already printed their own ✗ line
+            for op in self.operations:
+                outcome = self._execute_one(op)
+                if outcome == "copied":
+                    console.print(f"✓ {op.artifact.filename}")
+                elif outcome == "skipped":
+                    console.print(f"[dim]⊘ {op.artifact.filename} (skipped)[/dim]")
+        else:
+            from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
+
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+                console=console
+            ) as progress:
+
+                task = progress.add_task("[cyan]Copying files...", total=len(self.operations))
+
+                # Split into a small-file queue and a large queue (directories and
+                # big files) with separate pools, so a large copy can't hold up the
+                # many small ones. The pools share the --max-concurrency budget:
+                # large copies are throughput bound and get a quarter of it, small
+                # copies are latency bound and get the rest. With fewer than two
+                # workers, or only one kind of operation, a single pool is used.
+                max_concurrency = self.config.max_concurrency
+                small_ops = [op for op in self.operations
+                             if not op.artifact.is_directory and op.source_size < LARGE_FILE_THRESHOLD]
+                large_ops = [op for op in self.operations
+                             if op.artifact.is_directory or op.source_size >= LARGE_FILE_THRESHOLD]
+                if small_ops and large_ops and max_concurrency >= 2:
+                    large_workers = max(1, min(max_concurrency // 4, len(large_ops)))
+                    small_workers = min(max_concurrency - large_workers, len(small_ops))
+                    pools = [(large_workers, large_ops), (small_workers, small_ops)]
+                else:
+                    pools = [(min(max_concurrency, len(self.operations)), large_ops + small_ops)]
+
+                with contextlib.ExitStack() as stack:
+                    futures = []
+                    for workers, ops in pools:
+                        executor = stack.enter_context(ThreadPoolExecutor(max_workers=workers))
+                        futures += [executor.submit(self._execute_one, op) for op in ops]
+                    # Advance the bar in batches rather than once per copy
+                    pending = 0
+                    last_update = time.monotonic()
+                    for future in as_completed(futures):
+                        future.result()
+                        pending += 1
+                        now = time.monotonic()
+                        if now - last_update >= PROGRESS_UPDATE_INTERVAL:
+                            progress.advance(task, pending)
+                            pending = 0
+                            last_update = now
+                    if pending:
+                        progress.advance(task, pending)
+
+        # One log record for all operations instead of one per copy
+        if self._pending_log:
+            self.logger.info("\n".join(self._pending_log))
+            self._pending_log.clear()
 
         console.print(f"\n[green]✓ Operation complete![/green]")
         self.logger.info("Execution complete")
@@ -950,20 +1561,23 @@ Store: [dim]{self.artifact_store.store_base_path}[/dim]"""
         Returns:
             True if files are identical, False otherwise
         """
-        template_path = self.get_gitignore_template_path(self.config.gitignore_lang)
-        target_path = self.config.target_dir / ".gitignore"
+        from rich.text import Text
 
-        template_lines = self.read_gitignore_lines(template_path)
-        target_lines = self.read_gitignore_lines(target_path)
+        target_path = self.config.target_dir / ".gitignore"
 
-        # Extract patterns (filtering out comments and empty lines)
-        template_patterns = self.extract_gitignore_patterns(template_lines)
-        target_patterns = self.extract_gitignore_patterns(target_lines)
+        # Patterns (comments and empty lines filtered out), parsed once per file
+        template_patterns = self._get_template(self.config.gitignore_lang)[1]
+        target_patterns = self._read_gitignore(target_path)[1]
 
-        # Calculate set differences
-        missing_from_target = template_patterns - target_patterns
-        extra_in_target = target_patterns - template_patterns
-        common_patterns = template_patterns & target_patterns
+        # Calculate differences as sorted lists; very large pattern sets are
+        # sorted once and walked together rather than building difference sets
+        if len(template_patterns) + len(target_patterns) > SORTED_DIFF_THRESHOLD:
+            missing_from_target, extra_in_target, common_count = diff_sorted(
+                sorted(template_patterns), sorted(target_patterns))
+        else:
+            missing_from_target = sorted(template_patterns - target_patterns)
+            extra_in_target = sorted(target_patterns - template_patterns)
+            common_count = len(template_patterns) - len(missing_from_target)
 
         # Check if files are identical
         if not missing_from_target and not extra_in_target:
@@ -978,37 +1592,49 @@ Store: [dim]{self.artifact_store.store_base_path}[/dim]"""
         console.print(f"[cyan]Statistics:[/cyan]")
         console.print(f"  Template patterns: {len(template_patterns)}")
         console.print(f"  Target patterns: {len(target_patterns)}")
-        console.print(f"  Common patterns: {len(common_patterns)}")
+        console.print(f"  Common patterns: {common_count}")
         console.print(f"  Missing from target: {len(missing_from_target)}")
         console.print(f"  Extra in target: {len(extra_in_target)}")
         console.print()
 
+        # Build the pattern sections into one Text and render it once;
+        # patterns are appended as plain text so brackets in patterns like
+        # "*.py[cod]" aren't parsed as Rich markup
+        out = Text()
+
         # Display missing patterns (in template but not in target)
         if missing_from_target:
-            console.print(f"[bold green]Missing from Target[/bold green] ({len(missing_from_target)} patterns):")
-            console.print("[dim]These patterns are in the template but not in your .gitignore[/dim]")
-            for pattern in sorted(missing_from_target):
-                console.print(f"[green]  + {pattern}[/green]")
-            console.print()
+            out.append_text(Text.from_markup(
+                f"[bold green]Missing from Target[/bold green] ({len(missing_from_target)} patterns):\n"
+                "[dim]These patterns are in the template but not in your .gitignore[/dim]\n"))
+            for pattern in missing_from_target:
+                out.append(f"  + {pattern}\n", style="green")
+            out.append("\n")
 
         # Display extra patterns (in target but not in template)
         if extra_in_target:
-            console.print(f"[bold yellow]Extra in Target[/bold yellow] ({len(extra_in_target)} patterns):")
-            console.print("[dim]These are custom patterns not in the template[/dim]")
-            for pattern in sorted(extra_in_target):
-                console.print(f"[yellow]  ! {pattern}[/yellow]")
-            console.print()
+            out.append_text(Text.from_markup(
+                f"[bold yellow]Extra in Target[/bold yellow] ({len(extra_in_target)} patterns):\n"
+                "[dim]These are custom patterns not in the template[/dim]\n"))
+            for pattern in extra_in_target:
+                out.append(f"  ! {pattern}\n", style="yellow")
+            out.append("\n")
 
         # Display common patterns count
-        if common_patterns:
-            console.print(f"[bold cyan]Common Patterns[/bold cyan] ({len(common_patterns)} patterns):")
-            console.print("[dim]These patterns exist in both files[/dim]")
+        if common_count:
+            out.append_text(Text.from_markup(
+                f"[bold cyan]Common Patterns[/bold cyan] ({common_count} patterns):\n"
+                "[dim]These patterns exist in both files[/dim]\n"))
             # Just show count by default to avoid clutter
-            console.print(f"[cyan]  {len(common_patterns)} patterns in common[/cyan]")
-            console.print()
+            out.append(f"  {common_count} patterns in common\n", style="cyan")
+            out.append("\n")
+
+        out.rstrip()
+        console.print(out)
+        console.print()
 
         self.logger.info(f"GitIgnore set-based comparison: {len(missing_from_target)} missing, "
-                        f"{len(extra_in_target)} extra, {len(common_patterns)} common")
+                        f"{len(extra_in_target)} extra, {common_count} common")
         return False
 
     def compare_gitignore(self) -> bool:
@@ -1025,11 +1651,12 @@ Store: [dim]{self.artifact_store.store_base_path}[/dim]"""
             return self.compare_gitignore_set()
 
         # Default: unified diff comparison
+        import difflib
+
         self.logger.info("Using unified diff comparison mode")
-        template_path = self.get_gitignore_template_path(self.config.gitignore_lang)
         target_path = self.config.target_dir / ".gitignore"
 
-        template_lines = self.read_gitignore_lines(template_path)
+        template_lines = self._get_template(self.config.gitignore_lang)[0]
         target_lines = self.read_gitignore_lines(target_path)
 
         if not target_path.exists():
@@ -1069,23 +1696,26 @@ Store: [dim]{self.artifact_store.store_base_path}[/dim]"""
 
     def merge_gitignore(self) -> None:
         """Merge template .gitignore into target (preserves all existing lines)."""
-        template_path = self.get_gitignore_template_path(self.config.gitignore_lang)
+        from rich.text import Text
+
         target_path = self.config.target_dir / ".gitignore"
         backup_path = self.config.target_dir / ".gitignore.backup"
 
-        template_lines = self.read_gitignore_lines(template_path)
+        template_lines = self._get_template(self.config.gitignore_lang)[0]
         target_lines = self.read_gitignore_lines(target_path)
 
         # Convert to sets for comparison (excluding empty lines and comments for dedup)
-        def is_content_line(line):
-            stripped = line.strip()
-            return stripped and not stripped.startswith('#')
-
+        is_content_line = GITIGNORE_CONTENT_LINE_RE.match
         existing_content = {line for line in target_lines if is_content_line(line)}
-        template_content = {line for line in template_lines if is_content_line(line)}
 
-        # Find lines to add
-        lines_to_add = template_content - existing_content
+        # Find lines to add in one pass over the template, in template order
+        # (each line once), for both the merged file and the preview
+        lines_to_add: List[str] = []
+        seen = set(existing_content)
+        for line in template_lines:
+            if line not in seen and is_content_line(line):
+                lines_to_add.append(line)
+                seen.add(line)
 
         if not lines_to_add:
             console.print("[green]✓ Target .gitignore already contains all template patterns[/green]")
@@ -1102,16 +1732,13 @@ Store: [dim]{self.artifact_store.store_base_path}[/dim]"""
         # Add new patterns with a header
         if lines_to_add:
             merged_lines.append(f"# Added from {self.config.gitignore_lang} template")
-            for line in template_lines:
-                if is_content_line(line) and line in lines_to_add:
-                    merged_lines.append(line)
+            merged_lines.extend(lines_to_add)
 
         self.config.gitignore_lines_added = len(lines_to_add)
 
-        # Display preview
+        # Display preview (plain text, so brackets in patterns aren't markup)
         console.print(f"\n[bold]Lines to be added:[/bold] {len(lines_to_add)}")
-        for line in sorted(lines_to_add):
-            console.print(f"[green]+ {line}[/green]")
+        console.print(Text("\n".join(f"+ {line}" for line in lines_to_add), style="green"))
 
         if not self.config.execute:
             console.print("\n[yellow]⚠ This is a DRY RUN. Use --execute to perform merge.[/yellow]")
@@ -1122,15 +1749,17 @@ Store: [dim]{self.artifact_store.store_base_path}[/dim]"""
         try:
             # Create backup if target exists
             if target_path.exists():
-                shutil.copy2(target_path, backup_path)
+                self._backup_gitignore(target_path, backup_path)
                 console.print(f"\n[cyan]Backup created: {backup_path}[/cyan]")
                 self.logger.info(f"Backup created: {backup_path}")
 
-            # Write merged content
-            with open(target_path, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(merged_lines))
-                if merged_lines and not merged_lines[-1] == '':
-                    f.write('\n')
+            # Write merged content (encoded once, single write; platform
+            # line endings as text mode would have produced)
+            merged_text = os.linesep.join(merged_lines)
+            if merged_lines and not merged_lines[-1] == '':
+                merged_text += os.linesep
+            write_file_atomic(target_path, merged_text.encode('utf-8'))
+            self._gitignore_cache.pop(str(target_path), None)
 
             console.print(f"[green]✓ Merged {len(lines_to_add)} new patterns into {target_path}[/green]")
             self.logger.info(f"Merged {len(lines_to_add)} patterns into .gitignore")
@@ -1140,13 +1769,32 @@ Store: [dim]{self.artifact_store.store_base_path}[/dim]"""
             self.logger.error(f"Failed to merge .gitignore: {e}")
             raise
 
+    def _backup_gitignore(self, target_path: Path, backup_path: Path) -> None:
+        """Back up .gitignore, using a hard link when possible.
+
+        The backup sits next to the target, so a hard link is one link()
+        call with no data copied. This is safe because merge and replace
+        swap in a new file rather than rewriting the linked one. Falls back
+        to a full copy where hard links are unsupported.
+
+        Args:
+            target_path: Existing .gitignore file
+            backup_path: Backup file path (replaced if it exists)
+        """
+        if os.path.lexists(backup_path):
+            os.unlink(backup_path)
+        try:
+            os.link(target_path, backup_path)
+        except (OSError, NotImplementedError):
+            shutil.copy2(target_path, backup_path)
+
     def replace_gitignore(self) -> None:
         """Replace target .gitignore completely with template."""
-        template_path = self.get_gitignore_template_path(self.config.gitignore_lang)
+        template_path = self._resolved_template_path
         target_path = self.config.target_dir / ".gitignore"
         backup_path = self.config.target_dir / ".gitignore.backup"
 
-        template_lines = self.read_gitignore_lines(template_path)
+        template_lines = self._get_template(self.config.gitignore_lang)[0]
         target_lines = self.read_gitignore_lines(target_path)
 
         self.config.gitignore_lines_added = len(template_lines)
@@ -1172,12 +1820,14 @@ Store: [dim]{self.artifact_store.store_base_path}[/dim]"""
         try:
             # Create backup if target exists
             if target_path.exists():
-                shutil.copy2(target_path, backup_path)
+                self._backup_gitignore(target_path, backup_path)
                 console.print(f"\n[cyan]Backup created: {backup_path}[/cyan]")
                 self.logger.info(f"Backup created: {backup_path}")
 
-            # Copy template to target
-            shutil.copy2(template_path, target_path)
+            # Copy template to target. The file is swapped in rather than
+            # rewritten in place, which would also change a hard-linked backup
+            write_file_atomic(target_path, template_path.read_bytes())
+            self._gitignore_cache.pop(str(target_path), None)
 
             console.print(f"[green]✓ Replaced .gitignore with {self.config.gitignore_lang} template[/green]")
             self.logger.info(f"Replaced .gitignore with {self.config.gitignore_lang} template")
@@ -1189,6 +1839,9 @@ Store: [dim]{self.artifact_store.store_base_path}[/dim]"""
 
     def display_gitignore_header(self) -> None:
         """Display header for gitignore operations."""
+        from rich import box
+        from rich.panel import Panel
+
         operation_names = {
             'compare': 'COMPARE / DIFF',
             'merge': 'MERGE',
@@ -1198,7 +1851,7 @@ Store: [dim]{self.artifact_store.store_base_path}[/dim]"""
 
         exec_str = "[green]EXECUTE MODE[/green]" if self.config.execute else "[yellow]DRY RUN[/yellow]"
 
-        template_path = self.get_gitignore_template_path(self.config.gitignore_lang)
+        template_path = self._resolved_template_path
 
         header_text = f"""[bold]Claude Code Setup Tool - GitIgnore Management[/bold]
 
@@ -1218,6 +1871,9 @@ Template: [dim]{template_path}[/dim]"""
 
     def display_gitignore_summary(self) -> None:
         """Display summary of gitignore operation."""
+        from rich import box
+        from rich.panel import Panel
+
         backup_path = self.config.target_dir / ".gitignore.backup"
 
         if self.config.gitignore_execute == 'compare':
@@ -1254,7 +1910,7 @@ Template: [dim]{template_path}[/dim]"""
             self.display_gitignore_header()
 
             # Validate template exists
-            template_path = self.get_gitignore_template_path(self.config.gitignore_lang)
+            template_path = self._resolved_template_path
             if not template_path:
                 available = self.get_available_gitignore_languages()
                 console.print(f"\n[red]✗ Template not found for language: {self.config.gitignore_lang}[/red]")
@@ -1384,7 +2040,11 @@ Template: [dim]{template_path}[/dim]"""
 
 def show_help_artifacts():
     """Display detailed artifact information for both modes."""
-    artifact_store = ArtifactStore()
+    from rich import box
+    from rich.panel import Panel
+    from rich.table import Table
+
+    artifact_store = get_artifact_store()
 
     console.print(Panel("[bold cyan]Claude Code Setup - Available Artifacts[/bold cyan]",
                        box=box.DOUBLE))
@@ -1402,11 +2062,9 @@ def show_help_artifacts():
             console.print(f"[yellow]No artifacts found for {mode} mode[/yellow]")
             continue
 
-        # Group by category
-        by_category = {}
+        # Group by category (sorted once, when rendered)
+        by_category = defaultdict(list)
         for artifact in artifacts:
-            if artifact.category not in by_category:
-                by_category[artifact.category] = []
             by_category[artifact.category].append(artifact.filename)
 
         table = Table(box=box.ROUNDED, show_header=True, header_style="bold cyan")
@@ -1432,6 +2090,9 @@ def show_help_artifacts():
 
 def show_examples():
     """Display usage examples in a well-formatted way."""
+    from rich import box
+    from rich.panel import Panel
+
     console.print(Panel("[bold cyan]Claude Code Setup - Usage Examples[/bold cyan]",
                        box=box.DOUBLE))
 
@@ -1511,8 +2172,6 @@ class CustomArgumentParser(argparse.ArgumentParser):
         Args:
             message: Error message from argparse
         """
-        import re
-
         # Display usage
         self.print_usage(sys.stderr)
 
@@ -1542,6 +2201,9 @@ class CustomArgumentParser(argparse.ArgumentParser):
 
 def show_version() -> None:
     """Display version and install date information."""
+    from rich import box
+    from rich.panel import Panel
+
     version = get_version()
     install_date = get_install_date()
 
@@ -1597,6 +2259,14 @@ def main():
         help="Overwrite existing files (default: skip existing files)"
     )
 
+    parser.add_argument(
+        "--max-concurrency", "-mc",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        metavar="N",
+        help=f"Number of parallel copy threads in execute mode (default: {DEFAULT_MAX_CONCURRENCY})"
+    )
+
     parser.add_argument(
         "--version", "-v",
         action="store_true",
@@ -1653,6 +2323,9 @@ def main():
         show_examples()
         return 0
 
+    if args.max_concurrency < 1:
+        parser.error("--max-concurrency must be at least 1")
+
     # Validate required arguments
     if not args.target:
         parser.error("--target is required (unless using --version, --help-artifacts, or --help-examples)")
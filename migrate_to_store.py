@@ -4,13 +4,132 @@ One-time migration script to copy artifacts from d:\tac to local store.
 Creates a detailed log of all copied files in store/migration_log.txt
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import shutil
-from datetime import datetime
+import stat
+import sys
+import time
 
 SOURCE_BASE = Path(r"d:\tac")
 STORE_BASE = Path(__file__).parent / "store"
 LOG_FILE = STORE_BASE / "migration_log.txt"
+# Threads used for per-file copies (I/O bound, so more than the CPU count)
+COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+# adws subdirectories copied as whole trees
+ADWS_SUBDIRS = ["adw_modules", "adw_tests", "adw_triggers"]
+# Console lines collected before writing them out in one go
+STDOUT_BATCH_LINES = 64
+# Maximum seconds buffered console output may wait before being written
+STDOUT_FLUSH_INTERVAL = 0.1
+# Buffer for shutil's read/write copy path (fewer syscalls on slow or network targets)
+COPY_BUFSIZE = 1 << 20
+
+shutil.COPY_BUFSIZE = max(shutil.COPY_BUFSIZE, COPY_BUFSIZE)
+
+
+def fast_copy(src, dst):
+    """Copy a file with its metadata, letting the kernel move the data.
+
+    On Linux, os.copy_file_range copies inside the kernel (or reflinks on
+    copy-on-write filesystems) instead of through user-space buffers.
+    Falls back to shutil.copy2 where it is unavailable or refused.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                shutil.copystat(src, dst)
+                return dst
+            # copy_file_range stopped short (procfs, FUSE and some network
+            # filesystems report 0 early); redo the whole copy below
+        except OSError:
+            # e.g. EXDEV/ENOSYS/EINVAL on older kernels or some filesystems
+            pass
+    return shutil.copy2(src, dst)
+
+
+def needs_copy(src, dst) -> bool:
+    """Return True unless dst already matches src by size and mtime.
+
+    fast_copy preserves modification times, so on a re-run an unchanged
+    file is detected with two stat calls instead of a full copy.
+    """
+    try:
+        s = os.stat(src)
+        d = os.stat(dst)
+    except FileNotFoundError:
+        return True
+    return s.st_size != d.st_size or s.st_mtime_ns != d.st_mtime_ns
+
+
+def classify(path, logger=None):
+    """Return "file" or "dir" for path from a single stat, or None otherwise.
+
+    A path that exists but cannot be stat'ed (e.g. PermissionError) is
+    reported through logger, if given, and classified as "error" so the
+    caller can move on to the next entry.
+    """
+    try:
+        mode = os.stat(path).st_mode
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        if logger is not None:
+            logger.log_skip(path, f"Cannot access ({e.strerror or e})")
+        return "error"
+    if stat.S_ISREG(mode):
+        return "file"
+    if stat.S_ISDIR(mode):
+        return "dir"
+    return None
+
+
+def prune_tree(src, dst):
+    """Remove entries under dst that no longer have a counterpart under src."""
+    with os.scandir(dst) as it:
+        for entry in it:
+            src_path = os.path.join(src, entry.name)
+            if entry.is_dir(follow_symlinks=False):
+                if os.path.isdir(src_path):
+                    prune_tree(src_path, entry.path)
+                else:
+                    shutil.rmtree(entry.path)
+            elif not os.path.isfile(src_path):
+                os.unlink(entry.path)
+
+
+def copy_tree(src, dst):
+    """Bring dst in line with src, copying only files that changed.
+
+    Entries missing from src are removed from dst, so the result matches a
+    fresh copy without deleting and rewriting unchanged files.
+
+    Returns:
+        Tuple of (files copied, files left unchanged).
+    """
+    copied = 0
+    unchanged = 0
+
+    def copy_if_changed(s, d):
+        nonlocal copied, unchanged
+        if not needs_copy(s, d):
+            unchanged += 1
+            return d
+        copied += 1
+        return fast_copy(s, d)
+
+    if os.path.isdir(dst):
+        prune_tree(src, dst)
+    shutil.copytree(src, dst, copy_function=copy_if_changed, dirs_exist_ok=True)
+    return copied, unchanged
 
 
 class MigrationLogger:
@@ -19,64 +138,143 @@ class MigrationLogger:
     def __init__(self, log_file: Path):
         self.log_file = log_file
         self.log_file.parent.mkdir(parents=True, exist_ok=True)
-        self.entries = []
+        # Entries are streamed to the log as they happen; the large buffer
+        # coalesces them into few writes
+        self._stream = open(self.log_file, 'w', encoding='utf-8', buffering=1 << 20)
         self.files_copied = 0
         self.files_skipped = 0
+        self.files_unchanged = 0
+        # Last formatted timestamp and the second it was formatted for
+        self._ts_second = None
+        self._ts_text = ""
+        # Console lines waiting to be written, and when output was last written
+        self._stdout_buf = []
+        self._stdout_flushed = time.monotonic()
+
+    def _timestamp(self) -> str:
+        """Return the local time as text, formatting it at most once per second."""
+        second = int(time.time())
+        if second != self._ts_second:
+            self._ts_second = second
+            self._ts_text = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+        return self._ts_text
+
+    def _emit(self, text: str):
+        """Queue a console line, writing the queue out in batches."""
+        self._stdout_buf.append(text)
+        if (len(self._stdout_buf) >= STDOUT_BATCH_LINES
+                or time.monotonic() - self._stdout_flushed >= STDOUT_FLUSH_INTERVAL):
+            self._flush_stdout()
+
+    def _flush_stdout(self):
+        """Write any queued console lines."""
+        if self._stdout_buf:
+            sys.stdout.write("\n".join(self._stdout_buf) + "\n")
+            sys.stdout.flush()
+            self._stdout_buf.clear()
+        self._stdout_flushed = time.monotonic()
 
     def log_copy(self, source: Path, destination: Path, success: bool = True):
         """Log a file copy operation."""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = self._timestamp()
         status = "COPIED" if success else "FAILED"
         entry = f"[{timestamp}] {status}: {source} -> {destination}"
-        self.entries.append(entry)
-        print(entry)
+        self._stream.write(f"{entry}\n")
+        self._emit(entry)
 
         if success:
             self.files_copied += 1
 
     def log_skip(self, source: Path, reason: str):
         """Log a skipped file."""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = self._timestamp()
         entry = f"[{timestamp}] SKIPPED: {source} - {reason}"
-        self.entries.append(entry)
-        print(f"  {reason}: {source}")
+        self._stream.write(f"{entry}\n")
+        self._emit(f"  {reason}: {source}")
         self.files_skipped += 1
 
+    def log_unchanged(self, source: Path):
+        """Log a file left alone because the destination already matches it."""
+        timestamp = self._timestamp()
+        entry = f"[{timestamp}] UNCHANGED: {source}"
+        self._stream.write(f"{entry}\n")
+        self._emit(f"  Unchanged: {source}")
+        self.files_unchanged += 1
+
     def log_info(self, message: str):
         """Log an informational message."""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = self._timestamp()
         entry = f"[{timestamp}] INFO: {message}"
-        self.entries.append(entry)
-        print(message)
+        self._stream.write(f"{entry}\n")
+        self._emit(message)
 
     def log_section(self, title: str):
         """Log a section header."""
         separator = "=" * 80
-        self.entries.append("")
-        self.entries.append(separator)
-        self.entries.append(title)
-        self.entries.append(separator)
-        print(f"\n{separator}")
-        print(title)
-        print(separator)
-
-    def write_log(self):
-        """Write all log entries to file."""
-        with open(self.log_file, 'w', encoding='utf-8') as f:
-            f.write("\n".join(self.entries))
-            f.write("\n\n")
-            f.write("=" * 80 + "\n")
-            f.write("MIGRATION SUMMARY\n")
-            f.write("=" * 80 + "\n")
-            f.write(f"Files copied: {self.files_copied}\n")
-            f.write(f"Files skipped: {self.files_skipped}\n")
-            f.write(f"Total processed: {self.files_copied + self.files_skipped}\n")
-
+        self._stream.write(f"\n{separator}\n{title}\n{separator}\n")
+        self._emit(f"\n{separator}\n{title}\n{separator}")
+
+    def close(self):
+        """Write the summary footer and close the log file."""
+        f = self._stream
+        f.write("\n")
+        f.write("=" * 80 + "\n")
+        f.write("MIGRATION SUMMARY\n")
+        f.write("=" * 80 + "\n")
+        f.write(f"Files copied: {self.files_copied}\n")
+        f.write(f"Files unchanged: {self.files_unchanged}\n")
+        f.write(f"Files skipped: {self.files_skipped}\n")
+        f.write(f"Total processed: {self.files_copied + self.files_unchanged + self.files_skipped}\n")
+        f.close()
+
+        self._flush_stdout()
         print(f"\n✓ Migration log written to: {self.log_file}")
 
 
-def migrate_mode(source_repo: str, target_mode: str, logger: MigrationLogger, source_base: Path = None):
-    """Migrate artifacts from source repo to target mode."""
+def migrate_subdirs(source_dir: Path, target_dir: Path, logger: MigrationLogger, pool: ThreadPoolExecutor):
+    """Sync the adws subdirectories from source_dir into target_dir.
+
+    Each subdirectory is copied as a task on pool; results are logged in
+    ADWS_SUBDIRS order once all of them finish.
+    """
+    jobs = []
+    for subdir_name in ADWS_SUBDIRS:
+        subdir_source = source_dir / subdir_name
+        subdir_target = target_dir / subdir_name
+        kind = classify(subdir_source, logger)
+        if kind == "dir":
+            future = pool.submit(copy_tree, subdir_source, subdir_target)
+        else:
+            future = None
+        jobs.append((subdir_name, subdir_source, subdir_target, kind, future))
+
+    for subdir_name, subdir_source, subdir_target, kind, future in jobs:
+        if future is None:
+            # Unreadable entries were already reported by classify
+            if kind != "error":
+                logger.log_skip(subdir_source, "Directory not found")
+            continue
+        try:
+            file_count, unchanged = future.result()
+            logger.log_copy(subdir_source, subdir_target)
+            logger.log_info(f"  Copied {file_count} files in {subdir_name}/")
+            if unchanged:
+                logger.log_info(f"  Unchanged {unchanged} files in {subdir_name}/")
+        except Exception as e:
+            logger.log_info(f"ERROR: Failed to copy directory {subdir_source}: {e}")
+
+
+def migrate_mode(source_repo: str, target_mode: str, logger: MigrationLogger, source_base: Path = None,
+                 pool: ThreadPoolExecutor = None):
+    """Migrate artifacts from source repo to target mode.
+
+    Copies run on pool, which callers migrating several modes can share;
+    a private pool is used when none is given.
+    """
+    if pool is None:
+        with ThreadPoolExecutor(max_workers=COPY_WORKERS) as pool:
+            return migrate_mode(source_repo, target_mode, logger, source_base, pool)
+
     logger.log_section(f"MIGRATING {target_mode.upper()} MODE FROM {source_repo}")
 
     if source_base is None:
@@ -102,8 +300,11 @@ def migrate_mode(source_repo: str, target_mode: str, logger: MigrationLogger, so
 
     if settings_src.exists():
         try:
-            shutil.copy2(settings_src, settings_dst)
-            logger.log_copy(settings_src, settings_dst)
+            if needs_copy(settings_src, settings_dst):
+                fast_copy(settings_src, settings_dst)
+                logger.log_copy(settings_src, settings_dst)
+            else:
+                logger.log_unchanged(settings_src)
         except Exception as e:
             logger.log_info(f"ERROR: Failed to copy settings.json: {e}")
     else:
@@ -128,20 +329,39 @@ def migrate_mode(source_repo: str, target_mode: str, logger: MigrationLogger, so
 
         target_path.mkdir(parents=True, exist_ok=True)
 
-        # Copy all files (not directories)
+        # Copy all files (not directories); scandir entries carry their
+        # file type, so classifying them needs no extra stat per entry.
+        # Copies run concurrently and are logged afterwards in directory order;
+        # files whose size and mtime already match are left alone.
+        # Paths inside the loop stay plain strings (no Path per entry).
         files_in_category = 0
-        for item in source_path.iterdir():
-            if item.is_file():
-                dst = target_path / item.name
-                try:
-                    shutil.copy2(item, dst)
-                    logger.log_copy(item, dst)
-                    files_in_category += 1
-                except Exception as e:
-                    logger.log_info(f"ERROR: Failed to copy {item}: {e}")
-            elif item.is_dir():
+        results = []
+        target_dir = str(target_path)
+        with os.scandir(source_path) as it:
+            for entry in it:
+                item = entry.path
+                if entry.is_file():
+                    dst = os.path.join(target_dir, entry.name)
+                    future = pool.submit(fast_copy, item, dst) if needs_copy(item, dst) else None
+                    results.append((item, dst, future))
+                elif entry.is_dir():
+                    results.append((item, None, None))
+
+        for item, dst, future in results:
+            if dst is None:
                 # Skip directories for most categories, but handle adws specially
                 logger.log_skip(item, "Skipping directory")
+                continue
+            if future is None:
+                logger.log_unchanged(item)
+                files_in_category += 1
+                continue
+            try:
+                future.result()
+                logger.log_copy(item, dst)
+                files_in_category += 1
+            except Exception as e:
+                logger.log_info(f"ERROR: Failed to copy {item}: {e}")
 
         if files_in_category == 0:
             logger.log_info(f"  No files found in {source_subdir}")
@@ -149,25 +369,7 @@ def migrate_mode(source_repo: str, target_mode: str, logger: MigrationLogger, so
         # Special handling for adws category - copy subdirectories
         if source_subdir == "adws":
             logger.log_info(f"\nMigrating adws subdirectories...")
-            adws_subdirs = ["adw_modules", "adw_tests", "adw_triggers"]
-            for subdir_name in adws_subdirs:
-                subdir_source = source_path / subdir_name
-                subdir_target = target_path / subdir_name
-
-                if subdir_source.exists() and subdir_source.is_dir():
-                    try:
-                        # Remove target if it exists to ensure clean copy
-                        if subdir_target.exists():
-                            shutil.rmtree(subdir_target)
-                        shutil.copytree(subdir_source, subdir_target)
-                        logger.log_copy(subdir_source, subdir_target)
-                        # Count files in the directory
-                        file_count = len([f for f in subdir_target.rglob('*') if f.is_file()])
-                        logger.log_info(f"  Copied {file_count} files in {subdir_name}/")
-                    except Exception as e:
-                        logger.log_info(f"ERROR: Failed to copy directory {subdir_source}: {e}")
-                else:
-                    logger.log_skip(subdir_source, "Directory not found")
+            migrate_subdirs(source_path, target_path, logger, pool)
 
 
 def main():
@@ -187,104 +389,111 @@ def main():
     logger.log_section("MIGRATION STARTED")
     logger.log_info(f"Source base: {SOURCE_BASE}")
     logger.log_info(f"Store base: {STORE_BASE}")
-    logger.log_info(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-
-    # Migrate basic mode
-    migrate_mode("tac-6", "basic", logger)
-
-    # Migrate iso mode
-    migrate_mode("tac-7", "iso", logger)
-
-    # Migrate iso_v* modes
-    # Pattern: iso_v* modes inherit settings, commands, hooks, scripts from iso
-    # but get their adws from an external source directory.
-    # To add a new iso_v* mode:
-    #   1. Add entry to iso_versions dict below: "iso_vN": Path(r"path/to/adws")
-    #   2. Add "iso_vN" to cc_setup.py argument parser choices
-    #   3. Run this migration script
-    iso_versions = {
-        "iso_v1": Path(r"d:\python\scipap\adws"),
-        # "iso_v2": Path(r"d:\python\other_project\adws"),  # Example for future versions
-    }
-
-    iso_base = STORE_BASE / "iso"
-    for version_name, adws_source in iso_versions.items():
-        logger.log_section(f"MIGRATING {version_name.upper()} MODE")
-        version_target = STORE_BASE / version_name
-
-        if not adws_source.exists():
-            logger.log_info(f"WARNING: Source directory not found: {adws_source}")
-            logger.log_info(f"Skipping {version_name} mode migration")
-            continue
-
-        version_target.mkdir(parents=True, exist_ok=True)
-        logger.log_info(f"Created target directory: {version_target}")
-
-        # Copy base artifacts from iso mode (settings, commands, hooks, scripts)
-        logger.log_info("\nCopying base artifacts from iso mode...")
-        base_artifacts = ["settings.json", "commands", "hooks", "scripts"]
-        for artifact in base_artifacts:
-            src = iso_base / artifact
-            dst = version_target / artifact
-            if src.exists():
-                try:
-                    if src.is_file():
-                        shutil.copy2(src, dst)
-                    else:
-                        if dst.exists():
-                            shutil.rmtree(dst)
-                        shutil.copytree(src, dst)
-                    logger.log_copy(src, dst)
-                except Exception as e:
-                    logger.log_info(f"ERROR: Failed to copy {src}: {e}")
-            else:
-                logger.log_skip(src, "Not found in iso mode")
-
-        # Create adws directory in target
-        adws_target = version_target / "adws"
-        adws_target.mkdir(parents=True, exist_ok=True)
-
-        # Copy all .py files from source adws directory
-        logger.log_info(f"\nMigrating adws Python files from {adws_source}...")
-        for item in adws_source.iterdir():
-            if item.is_file() and item.suffix == ".py":
-                dst = adws_target / item.name
+    logger.log_info(f"Timestamp: {logger._timestamp()}")
+
+    # One copy pool shared by every mode; leaving the block waits for any
+    # outstanding copies and shuts it down, also when migration fails
+    with ThreadPoolExecutor(max_workers=COPY_WORKERS) as pool:
+        # Migrate basic mode
+        migrate_mode("tac-6", "basic", logger, pool=pool)
+
+        # Migrate iso mode
+        migrate_mode("tac-7", "iso", logger, pool=pool)
+
+        # Migrate iso_v* modes
+        # Pattern: iso_v* modes inherit settings, commands, hooks, scripts from iso
+        # but get their adws from an external source directory.
+        # To add a new iso_v* mode:
+        #   1. Add entry to iso_versions dict below: "iso_vN": Path(r"path/to/adws")
+        #   2. Add "iso_vN" to cc_setup.py argument parser choices
+        #   3. Run this migration script
+        iso_versions = {
+            "iso_v1": Path(r"d:\python\scipap\adws"),
+            # "iso_v2": Path(r"d:\python\other_project\adws"),  # Example for future versions
+        }
+
+        iso_base = STORE_BASE / "iso"
+        for version_name, adws_source in iso_versions.items():
+            logger.log_section(f"MIGRATING {version_name.upper()} MODE")
+            version_target = STORE_BASE / version_name
+
+            if not adws_source.exists():
+                logger.log_info(f"WARNING: Source directory not found: {adws_source}")
+                logger.log_info(f"Skipping {version_name} mode migration")
+                continue
+
+            version_target.mkdir(parents=True, exist_ok=True)
+            logger.log_info(f"Created target directory: {version_target}")
+
+            # Copy base artifacts from iso mode (settings, commands, hooks, scripts).
+            # They are copied rather than hard-linked: a shared inode would let
+            # an in-place edit in one store tree silently change the other.
+            logger.log_info("\nCopying base artifacts from iso mode...")
+            base_artifacts = ["settings.json", "commands", "hooks", "scripts"]
+            for artifact in base_artifacts:
+                src = iso_base / artifact
+                dst = version_target / artifact
+                kind = classify(src, logger)
+                if kind == "error":
+                    # Already reported by classify
+                    continue
+                if kind is not None:
+                    try:
+                        if kind == "file":
+                            if not needs_copy(src, dst):
+                                logger.log_unchanged(src)
+                                continue
+                            fast_copy(src, dst)
+                        else:
+                            copy_tree(src, dst)
+                        logger.log_copy(src, dst)
+                    except Exception as e:
+                        logger.log_info(f"ERROR: Failed to copy {src}: {e}")
+                else:
+                    logger.log_skip(src, "Not found in iso mode")
+
+            # Create adws directory in target
+            adws_target = version_target / "adws"
+            adws_target.mkdir(parents=True, exist_ok=True)
+
+            # Copy all .py files from source adws directory
+            logger.log_info(f"\nMigrating adws Python files from {adws_source}...")
+            results = []
+            adws_target_dir = str(adws_target)
+            with os.scandir(adws_source) as it:
+                for entry in it:
+                    if entry.name.endswith(".py") and entry.is_file():
+                        item = entry.path
+                        dst = os.path.join(adws_target_dir, entry.name)
+                        future = pool.submit(fast_copy, item, dst) if needs_copy(item, dst) else None
+                        results.append((item, dst, future))
+
+            for item, dst, future in results:
+                if future is None:
+                    logger.log_unchanged(item)
+                    continue
                 try:
-                    shutil.copy2(item, dst)
+                    future.result()
                     logger.log_copy(item, dst)
                 except Exception as e:
                     logger.log_info(f"ERROR: Failed to copy {item}: {e}")
 
-        # Copy subdirectories (adw_modules, adw_tests, adw_triggers)
-        logger.log_info("\nMigrating adws subdirectories...")
-        adws_subdirs = ["adw_modules", "adw_tests", "adw_triggers"]
-        for subdir_name in adws_subdirs:
-            subdir_source = adws_source / subdir_name
-            subdir_target = adws_target / subdir_name
-
-            if subdir_source.exists() and subdir_source.is_dir():
-                try:
-                    if subdir_target.exists():
-                        shutil.rmtree(subdir_target)
-                    shutil.copytree(subdir_source, subdir_target)
-                    logger.log_copy(subdir_source, subdir_target)
-                    file_count = len([f for f in subdir_target.rglob('*') if f.is_file()])
-                    logger.log_info(f"  Copied {file_count} files in {subdir_name}/")
-                except Exception as e:
-                    logger.log_info(f"ERROR: Failed to copy directory {subdir_source}: {e}")
-            else:
-                logger.log_skip(subdir_source, "Directory not found")
+            # Copy subdirectories (adw_modules, adw_tests, adw_triggers)
+            logger.log_info("\nMigrating adws subdirectories...")
+            migrate_subdirs(adws_source, adws_target, logger, pool)
 
     # Write final log
     logger.log_section("MIGRATION COMPLETE")
     logger.log_info(f"Total files copied: {logger.files_copied}")
+    logger.log_info(f"Total files unchanged: {logger.files_unchanged}")
     logger.log_info(f"Total files skipped: {logger.files_skipped}")
-    logger.write_log()
+    logger.close()
 
     print("\n" + "=" * 80)
     print("SUMMARY")
     print("=" * 80)
     print(f"✓ Files copied: {logger.files_copied}")
+    print(f"✓ Files unchanged: {logger.files_unchanged}")
     print(f"⚠ Files skipped: {logger.files_skipped}")
     print(f"📝 Log file: {LOG_FILE}")
     print("\n✓ Migration complete!")
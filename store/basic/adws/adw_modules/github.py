@@ -13,6 +13,7 @@ This module contains all GitHub-related operations including:
 - Issue status management
 """
 
+import functools
 import subprocess
 import sys
 import os
@@ -54,12 +55,23 @@ def get_github_env() -> Optional[dict]:
 
 def get_repo_url() -> str:
     """Get GitHub repository URL from git remote."""
+    return _get_repo_url(os.getcwd())
+
+
+@functools.lru_cache(maxsize=8)
+def _get_repo_url(cwd: str) -> str:
+    """Look up the origin URL for a working directory once per process.
+
+    Every GitHub call resolves the repository first; caching saves a git
+    subprocess on each comment posted during a workflow.
+    """
     try:
         result = subprocess.run(
             ["git", "remote", "get-url", "origin"],
             capture_output=True,
             text=True,
             check=True,
+            cwd=cwd,
         )
         return result.stdout.strip()
     except subprocess.CalledProcessError:
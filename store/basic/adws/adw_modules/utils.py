@@ -11,6 +11,9 @@ from typing import Any, TypeVar, Type, Union, Dict
 
 T = TypeVar('T')
 
+# Markdown code block around JSON: ```json\n...\n``` or ```\n...\n```
+CODE_BLOCK_PATTERN = re.compile(r'```(?:json)?\s*\n(.*?)\n```', re.DOTALL)
+
 
 def make_adw_id() -> str:
     """Generate a short 8-character UUID for ADW tracking."""
@@ -105,9 +108,7 @@ def parse_json(text: str, target_type: Type[T] = None) -> Union[T, Any]:
         ValueError: If JSON cannot be parsed from the text
     """
     # Try to extract JSON from markdown code blocks
-    # Pattern matches ```json\n...\n``` or ```\n...\n```
-    code_block_pattern = r'```(?:json)?\s*\n(.*?)\n```'
-    match = re.search(code_block_pattern, text, re.DOTALL)
+    match = CODE_BLOCK_PATTERN.search(text)
     
     if match:
         json_str = match.group(1).strip()
@@ -420,19 +420,18 @@ def main():
     load_dotenv()
 
     # Check for --skip-resolution flag
-    skip_resolution = "--skip-resolution" in sys.argv
-    if skip_resolution:
-        sys.argv.remove("--skip-resolution")
+    skip_resolution = "--skip-resolution" in sys.argv[1:]
+    args = [arg for arg in sys.argv[1:] if arg != "--skip-resolution"]
 
     # Parse command line args
     # adw-id is REQUIRED for review to find the correct state and spec
-    if len(sys.argv) < 3:
+    if len(args) < 2:
         print("Usage: uv run adw_review.py <issue-number> <adw-id> [--skip-resolution]")
         print("\nError: adw-id is required to locate the spec file and state")
         sys.exit(1)
 
-    issue_number = sys.argv[1]
-    adw_id = sys.argv[2]
+    issue_number = args[0]
+    adw_id = args[1]
 
     # Try to load existing state
     temp_logger = setup_logger(adw_id, "adw_review")
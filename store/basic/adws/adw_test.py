@@ -100,25 +100,22 @@ def parse_args(
     """Parse command line arguments.
     Returns (issue_number, adw_id, skip_e2e) where issue_number and adw_id may be None.
     """
-    skip_e2e = False
-
     # Check for --skip-e2e flag in args
-    if "--skip-e2e" in sys.argv:
-        skip_e2e = True
-        sys.argv.remove("--skip-e2e")
+    skip_e2e = "--skip-e2e" in sys.argv[1:]
+    args = [arg for arg in sys.argv[1:] if arg != "--skip-e2e"]
 
     # If we have state from stdin, we might not need issue number from args
     if state:
         # In piped mode, we might have no args at all
-        if len(sys.argv) >= 2:
+        if len(args) >= 1:
             # If an issue number is provided, use it
-            return sys.argv[1], None, skip_e2e
+            return args[0], None, skip_e2e
         else:
             # Otherwise, we'll get issue from state
             return None, None, skip_e2e
 
     # Standalone mode - need at least issue number
-    if len(sys.argv) < 2:
+    if len(args) < 1:
         usage_msg = [
             "Usage:",
             "  Standalone: uv run adw_test.py <issue-number> [adw-id] [--skip-e2e]",
@@ -137,8 +134,8 @@ def parse_args(
                 print(msg)
         sys.exit(1)
 
-    issue_number = sys.argv[1]
-    adw_id = sys.argv[2] if len(sys.argv) > 2 else None
+    issue_number = args[0]
+    adw_id = args[1] if len(args) > 1 else None
 
     return issue_number, adw_id, skip_e2e
 
@@ -0,0 +1,7 @@
+"""Shared pytest configuration for the ADW tests."""
+
+import os
+import sys
+
+# Add parent directory to path so tests can import adw_modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -10,18 +10,11 @@ Run with coverage: uv run pytest store/basic/adws/adw_tests/test_unit_modules.py
 """
 
 import json
-import os
-import sys
-import tempfile
 from datetime import datetime
-from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import pytest
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from adw_modules.data_types import (
     ADWStateData,
     AgentPromptRequest,
@@ -42,130 +35,87 @@ from adw_modules.utils import make_adw_id, parse_json, get_safe_subprocess_env,
 from adw_modules.state import ADWState
 
 
-class TestDataTypes:
-    """Tests for data_types.py Pydantic models."""
-
-    def test_github_user_basic(self):
-        """Test GitHubUser model creation."""
-        user = GitHubUser(login="testuser")
-        assert user.login == "testuser"
-        assert user.is_bot is False
-        assert user.name is None
-
-    def test_github_user_with_all_fields(self):
-        """Test GitHubUser with all fields populated."""
-        user = GitHubUser(
-            id="12345",
-            login="botuser",
-            name="Bot User",
-            is_bot=True,
-        )
-        assert user.id == "12345"
-        assert user.login == "botuser"
-        assert user.name == "Bot User"
-        assert user.is_bot is True
-
-    def test_github_label(self):
-        """Test GitHubLabel model."""
-        label = GitHubLabel(
-            id="1",
-            name="bug",
-            color="ff0000",
-            description="Bug report",
-        )
-        assert label.name == "bug"
-        assert label.color == "ff0000"
-
-    def test_github_milestone(self):
-        """Test GitHubMilestone model."""
-        milestone = GitHubMilestone(
-            id="1",
-            number=1,
-            title="v1.0",
-            description="First release",
-            state="open",
-        )
-        assert milestone.title == "v1.0"
-        assert milestone.state == "open"
-
-    def test_github_comment(self):
-        """Test GitHubComment model with alias fields."""
-        comment = GitHubComment(
+# Shared timestamps for the GitHub model tests
+CREATED_AT = datetime(2024, 1, 1)
+UPDATED_AT = datetime(2024, 1, 2)
+COMMENTED_AT = datetime(2024, 1, 1, 12, 0, 0)
+
+# (model class, constructor kwargs, expected attribute values) per model
+MODEL_CASES = [
+    pytest.param(
+        GitHubUser,
+        dict(login="testuser"),
+        dict(login="testuser", is_bot=False, name=None),
+        id="github_user_basic",
+    ),
+    pytest.param(
+        GitHubUser,
+        dict(id="12345", login="botuser", name="Bot User", is_bot=True),
+        dict(id="12345", login="botuser", name="Bot User", is_bot=True),
+        id="github_user_with_all_fields",
+    ),
+    pytest.param(
+        GitHubLabel,
+        dict(id="1", name="bug", color="ff0000", description="Bug report"),
+        dict(name="bug", color="ff0000"),
+        id="github_label",
+    ),
+    pytest.param(
+        GitHubMilestone,
+        dict(id="1", number=1, title="v1.0", description="First release", state="open"),
+        dict(title="v1.0", state="open"),
+        id="github_milestone",
+    ),
+    pytest.param(
+        GitHubComment,
+        dict(
             id="1",
             author=GitHubUser(login="commenter"),
             body="This is a comment",
-            createdAt=datetime(2024, 1, 1, 12, 0, 0),
-        )
-        assert comment.body == "This is a comment"
-        assert comment.created_at == datetime(2024, 1, 1, 12, 0, 0)
-
-    def test_github_issue_list_item(self):
-        """Test GitHubIssueListItem model."""
-        issue = GitHubIssueListItem(
+            createdAt=COMMENTED_AT,
+        ),
+        dict(body="This is a comment", created_at=COMMENTED_AT),
+        id="github_comment",
+    ),
+    pytest.param(
+        GitHubIssueListItem,
+        dict(
             number=123,
             title="Test Issue",
             body="Issue body",
-            createdAt=datetime(2024, 1, 1),
-            updatedAt=datetime(2024, 1, 2),
-        )
-        assert issue.number == 123
-        assert issue.title == "Test Issue"
-        assert issue.labels == []
-
-    def test_github_issue_full(self):
-        """Test full GitHubIssue model."""
-        issue = GitHubIssue(
-            number=456,
-            title="Full Issue",
-            body="Full body",
-            state="open",
-            author=GitHubUser(login="author"),
-            createdAt=datetime(2024, 1, 1),
-            updatedAt=datetime(2024, 1, 2),
-            url="https://github.com/test/repo/issues/456",
-        )
-        assert issue.number == 456
-        assert issue.state == "open"
-        assert issue.author.login == "author"
-        assert issue.assignees == []
-        assert issue.comments == []
-
-    def test_agent_prompt_request(self):
-        """Test AgentPromptRequest model."""
-        request = AgentPromptRequest(
+            createdAt=CREATED_AT,
+            updatedAt=UPDATED_AT,
+        ),
+        dict(number=123, title="Test Issue", labels=[]),
+        id="github_issue_list_item",
+    ),
+    pytest.param(
+        AgentPromptRequest,
+        dict(
             prompt="Test prompt",
             adw_id="abc12345",
             agent_name="planner",
             model="sonnet",
             output_file="output.jsonl",
-        )
-        assert request.prompt == "Test prompt"
-        assert request.model == "sonnet"
-        assert request.dangerously_skip_permissions is False
-
-    def test_agent_prompt_request_opus(self):
-        """Test AgentPromptRequest with opus model."""
-        request = AgentPromptRequest(
-            prompt="Complex task",
-            adw_id="def67890",
-            model="opus",
-            output_file="output.jsonl",
-        )
-        assert request.model == "opus"
-
-    def test_agent_prompt_response(self):
-        """Test AgentPromptResponse model."""
-        response = AgentPromptResponse(
-            output="Task completed",
-            success=True,
-            session_id="session-123",
-        )
-        assert response.success is True
-        assert response.session_id == "session-123"
-
-    def test_claude_code_result_message(self):
-        """Test ClaudeCodeResultMessage model."""
-        result = ClaudeCodeResultMessage(
+        ),
+        dict(prompt="Test prompt", model="sonnet", dangerously_skip_permissions=False),
+        id="agent_prompt_request",
+    ),
+    pytest.param(
+        AgentPromptRequest,
+        dict(prompt="Complex task", adw_id="def67890", model="opus", output_file="output.jsonl"),
+        dict(model="opus"),
+        id="agent_prompt_request_opus",
+    ),
+    pytest.param(
+        AgentPromptResponse,
+        dict(output="Task completed", success=True, session_id="session-123"),
+        dict(success=True, session_id="session-123"),
+        id="agent_prompt_response",
+    ),
+    pytest.param(
+        ClaudeCodeResultMessage,
+        dict(
             type="result",
             subtype="success",
             is_error=False,
@@ -175,21 +125,96 @@ class TestDataTypes:
             result="Success",
             session_id="sess-abc",
             total_cost_usd=0.05,
-        )
-        assert result.is_error is False
-        assert result.num_turns == 3
-        assert result.total_cost_usd == 0.05
-
-    def test_test_result(self):
-        """Test TestResult model."""
-        result = TestResult(
+        ),
+        dict(is_error=False, num_turns=3, total_cost_usd=0.05),
+        id="claude_code_result_message",
+    ),
+    pytest.param(
+        TestResult,
+        dict(
             test_name="test_login",
             passed=True,
             execution_command="pytest test_auth.py::test_login",
             test_purpose="Verify user login works",
+        ),
+        dict(passed=True, error=None),
+        id="test_result",
+    ),
+    pytest.param(
+        ADWStateData,
+        dict(
+            adw_id="test1234",
+            issue_number="123",
+            branch_name="feat-123-test",
+            plan_file="plan.md",
+            issue_class="/feature",
+        ),
+        dict(adw_id="test1234", issue_class="/feature"),
+        id="adw_state_data",
+    ),
+    pytest.param(
+        ADWStateData,
+        dict(adw_id="minimal1"),
+        dict(adw_id="minimal1", issue_number=None, branch_name=None),
+        id="adw_state_data_minimal",
+    ),
+    pytest.param(
+        ReviewIssue,
+        dict(
+            review_issue_number=1,
+            screenshot_path="review_img/error.png",
+            issue_description="Button misaligned",
+            issue_resolution="Adjust CSS margin",
+            issue_severity="tech_debt",
+        ),
+        dict(issue_severity="tech_debt", screenshot_url=None),
+        id="review_issue",
+    ),
+    pytest.param(
+        ReviewResult,
+        dict(
+            success=True,
+            review_summary="Implementation matches spec. All features working.",
+            review_issues=[],
+            screenshots=["ui.png"],
+        ),
+        dict(success=True, review_issues=[]),
+        id="review_result",
+    ),
+]
+
+
+class TestDataTypes:
+    """Tests for data_types.py Pydantic models."""
+
+    @pytest.mark.parametrize("model_cls,kwargs,expected", MODEL_CASES)
+    def test_model(self, model_cls, kwargs, expected):
+        """Test model creation and field values."""
+        obj = model_cls(**kwargs)
+        for name, value in expected.items():
+            actual = getattr(obj, name)
+            if value is None or isinstance(value, bool):
+                assert actual is value, name
+            else:
+                assert actual == value, name
+
+    def test_github_issue_full(self):
+        """Test full GitHubIssue model."""
+        issue = GitHubIssue(
+            number=456,
+            title="Full Issue",
+            body="Full body",
+            state="open",
+            author=GitHubUser(login="author"),
+            createdAt=CREATED_AT,
+            updatedAt=UPDATED_AT,
+            url="https://github.com/test/repo/issues/456",
         )
-        assert result.passed is True
-        assert result.error is None
+        assert issue.number == 456
+        assert issue.state == "open"
+        assert issue.author.login == "author"
+        assert issue.assignees == []
+        assert issue.comments == []
 
     def test_test_result_failed(self):
         """Test TestResult model for failed test."""
@@ -225,48 +250,6 @@ class TestDataTypes:
         assert result.passed is False
         assert result.error == "Element not found"
 
-    def test_adw_state_data(self):
-        """Test ADWStateData model."""
-        state = ADWStateData(
-            adw_id="test1234",
-            issue_number="123",
-            branch_name="feat-123-test",
-            plan_file="plan.md",
-            issue_class="/feature",
-        )
-        assert state.adw_id == "test1234"
-        assert state.issue_class == "/feature"
-
-    def test_adw_state_data_minimal(self):
-        """Test ADWStateData with minimal fields."""
-        state = ADWStateData(adw_id="minimal1")
-        assert state.adw_id == "minimal1"
-        assert state.issue_number is None
-        assert state.branch_name is None
-
-    def test_review_issue(self):
-        """Test ReviewIssue model."""
-        issue = ReviewIssue(
-            review_issue_number=1,
-            screenshot_path="review_img/error.png",
-            issue_description="Button misaligned",
-            issue_resolution="Adjust CSS margin",
-            issue_severity="tech_debt",
-        )
-        assert issue.issue_severity == "tech_debt"
-        assert issue.screenshot_url is None
-
-    def test_review_result(self):
-        """Test ReviewResult model."""
-        result = ReviewResult(
-            success=True,
-            review_summary="Implementation matches spec. All features working.",
-            review_issues=[],
-            screenshots=["ui.png"],
-        )
-        assert result.success is True
-        assert len(result.review_issues) == 0
-
 
 class TestUtils:
     """Tests for utils.py functions."""
@@ -333,43 +316,45 @@ That's all.
         assert result.test_name == "test1"
         assert result.passed is True
 
-    def test_get_safe_subprocess_env(self):
+    def test_get_safe_subprocess_env(self, monkeypatch):
         """Test get_safe_subprocess_env returns filtered env."""
-        with patch.dict(os.environ, {
-            "ANTHROPIC_API_KEY": "test-key",
-            "PATH": "/usr/bin",
-            "HOME": "/home/test",
-            "SECRET_KEY": "should-not-appear",
-        }, clear=True):
-            env = get_safe_subprocess_env()
-            assert "ANTHROPIC_API_KEY" in env
-            assert "PATH" in env
-            assert "HOME" in env
-            assert "SECRET_KEY" not in env
-            assert env["PYTHONUNBUFFERED"] == "1"
-
-    def test_check_claude_auth_with_api_key(self):
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+        monkeypatch.setenv("PATH", "/usr/bin")
+        monkeypatch.setenv("HOME", "/home/test")
+        monkeypatch.setenv("SECRET_KEY", "should-not-appear")
+        env = get_safe_subprocess_env()
+        assert "ANTHROPIC_API_KEY" in env
+        assert "PATH" in env
+        assert "HOME" in env
+        assert "SECRET_KEY" not in env
+        assert env["PYTHONUNBUFFERED"] == "1"
+
+    def test_check_claude_auth_with_api_key(self, monkeypatch):
         """Test check_claude_auth_available detects API key."""
-        with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "sk-ant-test-key-12345"}):
-            available, mode = check_claude_auth_available()
-            assert available is True
-            assert mode == "api_key"
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-ant-test-key-12345")
+        available, mode = check_claude_auth_available()
+        assert available is True
+        assert mode == "api_key"
 
-    def test_check_claude_auth_without_api_key(self):
+    def test_check_claude_auth_without_api_key(self, monkeypatch):
         """Test check_claude_auth_available without API key."""
-        env = os.environ.copy()
-        env.pop("ANTHROPIC_API_KEY", None)
-        with patch.dict(os.environ, env, clear=True):
-            available, mode = check_claude_auth_available()
-            # Result depends on whether Claude CLI is installed
-            assert mode in ["api_key", "oauth", "none"]
-
-    def test_check_claude_auth_empty_api_key(self):
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        available, mode = check_claude_auth_available()
+        # Result depends on whether Claude CLI is installed
+        assert mode in ["api_key", "oauth", "none"]
+
+    def test_check_claude_auth_empty_api_key(self, monkeypatch):
         """Test check_claude_auth_available with empty API key."""
-        with patch.dict(os.environ, {"ANTHROPIC_API_KEY": ""}):
-            available, mode = check_claude_auth_available()
-            # With empty key, should try OAuth or return none
-            assert mode in ["oauth", "none"]
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "")
+        available, mode = check_claude_auth_available()
+        # With empty key, should try OAuth or return none
+        assert mode in ["oauth", "none"]
+
+
+@pytest.fixture(scope="class")
+def class_tmp(tmp_path_factory):
+    """Temporary directory shared by a test class; tests use their own subpaths."""
+    return tmp_path_factory.mktemp("adwstate")
 
 
 class TestADWState:
@@ -408,27 +393,26 @@ class TestADWState:
         assert state.get("missing_key") is None
         assert state.get("missing_key", "default") == "default"
 
-    def test_save_and_load(self):
+    def test_save_and_load(self, class_tmp):
         """Test saving and loading state from file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Patch the project root detection
-            with patch.object(ADWState, 'get_state_path') as mock_path:
-                state_file = Path(tmpdir) / "agents" / "test1234" / "adw_state.json"
-                mock_path.return_value = str(state_file)
-
-                # Create and save state
-                state = ADWState("test1234")
-                state.update(issue_number="789", branch_name="fix-789")
-                state.save()
-
-                # Verify file exists
-                assert state_file.exists()
-
-                # Verify content
-                with open(state_file) as f:
-                    data = json.load(f)
-                assert data["adw_id"] == "test1234"
-                assert data["issue_number"] == "789"
+        # Patch the project root detection
+        with patch.object(ADWState, 'get_state_path') as mock_path:
+            state_file = class_tmp / "agents" / "test1234" / "adw_state.json"
+            mock_path.return_value = str(state_file)
+
+            # Create and save state
+            state = ADWState("test1234")
+            state.update(issue_number="789", branch_name="fix-789")
+            state.save()
+
+            # Verify file exists
+            assert state_file.exists()
+
+            # Verify content
+            with open(state_file) as f:
+                data = json.load(f)
+            assert data["adw_id"] == "test1234"
+            assert data["issue_number"] == "789"
 
     def test_to_stdout(self, capsys):
         """Test ADWState.to_stdout outputs JSON."""
@@ -23,6 +23,10 @@ Usage:
     # Force skip auth checks (for unit tests only)
     ADW_SKIP_AUTH=1 uv run pytest ...
 
+    # Run the Claude CLI integration tests in parallel (pytest-xdist);
+    # they are independent and dominated by model latency
+    uv run pytest store/basic/adws/adw_tests/test_workflow_integration.py -n 4
+
 Environment Variables:
     ANTHROPIC_API_KEY: Required for API mode
     ADW_AUTH_MODE: Force specific auth mode (api_key, claude_max, or auto)
@@ -30,11 +34,13 @@ Environment Variables:
     CLAUDE_CODE_PATH: Path to Claude Code CLI (default: claude)
 """
 
+import functools
 import json
 import os
+import shutil
 import subprocess
-import sys
 import tempfile
+import uuid
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
@@ -43,13 +49,22 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from dotenv import load_dotenv
 
 load_dotenv()
 
+from adw_modules.agent import (
+    SLASH_COMMAND_MODEL_MAP,
+    check_claude_installed,
+    get_model_for_slash_command,
+    prompt_claude_code,
+)
+from adw_modules.data_types import AgentPromptRequest, AgentPromptResponse
+from adw_modules.utils import get_safe_subprocess_env, make_adw_id
+
+# Seconds allowed for `claude --version`; a cold Node.js start can take a few
+CLI_PROBE_TIMEOUT = 5
+
 
 # =============================================================================
 # Auth Mode Detection and Configuration
@@ -75,16 +90,27 @@ class AuthConfig:
 def detect_claude_cli() -> Tuple[bool, str]:
     """Detect if Claude Code CLI is installed and get its path."""
     claude_path = os.getenv("CLAUDE_CODE_PATH", "claude")
+    return _probe_claude_cli(claude_path), claude_path
+
+
+@functools.lru_cache(maxsize=8)
+def _probe_claude_cli(claude_path: str) -> bool:
+    """Run `claude --version` once per CLI path and report whether it works."""
+    # Resolve in-process first so a missing CLI never costs a failed spawn
+    resolved = shutil.which(claude_path)
+    if resolved is None:
+        return False
     try:
         result = subprocess.run(
-            [claude_path, "--version"],
-            capture_output=True,
-            text=True,
-            timeout=10
+            [resolved, "--version"],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=CLI_PROBE_TIMEOUT
         )
-        return result.returncode == 0, claude_path
+        return result.returncode == 0
     except (FileNotFoundError, subprocess.TimeoutExpired):
-        return False, claude_path
+        return False
 
 
 def detect_api_key_auth() -> bool:
@@ -93,62 +119,51 @@ def detect_api_key_auth() -> bool:
     return bool(api_key and len(api_key) > 10)
 
 
-def detect_claude_max_auth() -> bool:
+def detect_claude_max_auth(cli_installed: bool) -> bool:
     """Check if Claude Max (OAuth) authentication is available.
 
     This checks if the user is logged in via `claude auth status` or similar.
     Claude Max users don't need an API key - they authenticate via OAuth.
-    """
-    claude_path = os.getenv("CLAUDE_CODE_PATH", "claude")
-    try:
-        # Try to check auth status - this varies by Claude Code version
-        # Method 1: Check if we can run a simple command without API key
-        env = os.environ.copy()
-        env.pop("ANTHROPIC_API_KEY", None)  # Remove API key to test OAuth
 
-        result = subprocess.run(
-            [claude_path, "--version"],
-            capture_output=True,
-            text=True,
-            env=env,
-            timeout=10
-        )
+    Args:
+        cli_installed: Whether detect_claude_cli() found a working CLI
+    """
+    if not cli_installed:
+        return False
 
-        if result.returncode != 0:
-            return False
-
-        # Method 2: Try a minimal prompt to see if auth works
-        # This is more reliable but slower
-        # For now, we'll check if there's a Claude config file indicating login
-        config_paths = [
-            Path.home() / ".claude" / "config.json",
-            Path.home() / ".config" / "claude" / "config.json",
-        ]
-
-        for config_path in config_paths:
-            if config_path.exists():
-                try:
-                    with open(config_path) as f:
-                        config = json.load(f)
-                        # Check for OAuth tokens or session info
-                        if config.get("oauth_token") or config.get("session"):
-                            return True
-                except (json.JSONDecodeError, KeyError):
-                    pass
-
-        # Fallback: assume Claude Max if CLI is installed but no API key
-        # This allows testing even without explicit OAuth detection
-        return True
+    # A minimal prompt would be more reliable but slower, so check for a
+    # Claude config file indicating login
+    config_paths = [
+        Path.home() / ".claude" / "config.json",
+        Path.home() / ".config" / "claude" / "config.json",
+    ]
 
-    except (FileNotFoundError, subprocess.TimeoutExpired):
-        return False
+    for config_path in config_paths:
+        try:
+            with open(config_path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            continue
+        # Only parse configs that can contain OAuth tokens or session info
+        if b'"oauth_token"' not in data and b'"session"' not in data:
+            continue
+        try:
+            config = json.loads(data)
+        except json.JSONDecodeError:
+            continue
+        if config.get("oauth_token") or config.get("session"):
+            return True
+
+    # Fallback: assume Claude Max if CLI is installed but no API key
+    # This allows testing even without explicit OAuth detection
+    return True
 
 
 def get_auth_config() -> AuthConfig:
     """Get the current authentication configuration."""
     cli_installed, cli_path = detect_claude_cli()
     api_key_available = detect_api_key_auth()
-    claude_max_available = detect_claude_max_auth() if cli_installed else False
+    claude_max_available = detect_claude_max_auth(cli_installed)
 
     # Determine mode based on environment or detection
     forced_mode = os.getenv("ADW_AUTH_MODE", "auto").lower()
@@ -174,8 +189,14 @@ def get_auth_config() -> AuthConfig:
     )
 
 
-# Global auth config - computed once at module load
-AUTH_CONFIG = get_auth_config()
+@functools.lru_cache(maxsize=1)
+def load_auth_config() -> AuthConfig:
+    """Return the auth config, detecting it on first use only.
+
+    Detection spawns the Claude CLI, so it is deferred until a test or skip
+    condition actually needs it rather than running at import.
+    """
+    return get_auth_config()
 
 
 # =============================================================================
@@ -185,16 +206,24 @@ AUTH_CONFIG = get_auth_config()
 @pytest.fixture
 def auth_config():
     """Provide auth configuration to tests."""
-    return AUTH_CONFIG
+    return load_auth_config()
 
 
-@pytest.fixture
-def temp_output_dir():
-    """Create a temporary directory for test outputs."""
+@pytest.fixture(scope="session")
+def session_output_dir():
+    """Create one temporary directory shared by the whole test session."""
     with tempfile.TemporaryDirectory() as tmpdir:
         yield tmpdir
 
 
+@pytest.fixture
+def temp_output_dir(session_output_dir):
+    """Create a per-test directory for test outputs inside the session one."""
+    path = os.path.join(session_output_dir, uuid.uuid4().hex)
+    os.makedirs(path)
+    return path
+
+
 @pytest.fixture
 def mock_env_api_key():
     """Mock environment with API key."""
@@ -208,9 +237,8 @@ def mock_env_api_key():
 @pytest.fixture
 def mock_env_no_api_key():
     """Mock environment without API key (Claude Max mode)."""
-    env = os.environ.copy()
-    env.pop("ANTHROPIC_API_KEY", None)
-    with patch.dict(os.environ, env, clear=True):
+    with patch.dict(os.environ):
+        os.environ.pop("ANTHROPIC_API_KEY", None)
         yield
 
 
@@ -218,23 +246,25 @@ def mock_env_no_api_key():
 # Skip Decorators
 # =============================================================================
 
+# Conditions are strings so pytest evaluates them lazily, per test
+
 requires_cli = pytest.mark.skipif(
-    not AUTH_CONFIG.claude_cli_installed,
+    "not load_auth_config().claude_cli_installed",
     reason="Claude Code CLI not installed"
 )
 
 requires_api_key = pytest.mark.skipif(
-    not AUTH_CONFIG.api_key_available,
+    "not load_auth_config().api_key_available",
     reason="ANTHROPIC_API_KEY not set"
 )
 
 requires_claude_max = pytest.mark.skipif(
-    not AUTH_CONFIG.claude_max_available,
+    "not load_auth_config().claude_max_available",
     reason="Claude Max authentication not available"
 )
 
 requires_any_auth = pytest.mark.skipif(
-    AUTH_CONFIG.mode == AuthMode.NONE,
+    "load_auth_config().mode == AuthMode.NONE",
     reason="No authentication available (need API key or Claude Max)"
 )
 
@@ -361,8 +391,6 @@ class TestAgentModule:
 
     def test_get_model_for_slash_command(self):
         """Test model selection for slash commands."""
-        from adw_modules.agent import get_model_for_slash_command
-
         # Commands that should use opus
         assert get_model_for_slash_command("/implement") == "opus"
         assert get_model_for_slash_command("/review") == "opus"
@@ -380,16 +408,12 @@ class TestAgentModule:
     @requires_cli
     def test_check_claude_installed(self):
         """Test Claude CLI installation check."""
-        from adw_modules.agent import check_claude_installed
-
         result = check_claude_installed()
         # If CLI is installed (as indicated by requires_cli), should return None
         assert result is None
 
     def test_agent_prompt_request_creation(self):
         """Test AgentPromptRequest model creation."""
-        from adw_modules.data_types import AgentPromptRequest
-
         request = AgentPromptRequest(
             prompt="Test prompt",
             adw_id="test1234",
@@ -403,8 +427,6 @@ class TestAgentModule:
 
     def test_agent_prompt_response_creation(self):
         """Test AgentPromptResponse model creation."""
-        from adw_modules.data_types import AgentPromptResponse
-
         response = AgentPromptResponse(
             output="Test output",
             success=True,
@@ -425,10 +447,6 @@ class TestClaudeCodeExecution:
     @requires_any_auth
     def test_simple_prompt_execution(self, temp_output_dir):
         """Test executing a simple prompt through Claude Code."""
-        from adw_modules.agent import prompt_claude_code
-        from adw_modules.data_types import AgentPromptRequest
-        from adw_modules.utils import make_adw_id
-
         adw_id = make_adw_id()
         output_file = os.path.join(temp_output_dir, "test_output.jsonl")
 
@@ -452,10 +470,6 @@ class TestClaudeCodeExecution:
     @requires_api_key
     def test_prompt_with_api_key(self, temp_output_dir):
         """Test Claude Code execution with API key authentication."""
-        from adw_modules.agent import prompt_claude_code
-        from adw_modules.data_types import AgentPromptRequest
-        from adw_modules.utils import make_adw_id
-
         adw_id = make_adw_id()
         output_file = os.path.join(temp_output_dir, "api_key_test.jsonl")
 
@@ -477,10 +491,6 @@ class TestClaudeCodeExecution:
     @requires_claude_max
     def test_prompt_with_claude_max(self, temp_output_dir, mock_env_no_api_key):
         """Test Claude Code execution with Claude Max authentication."""
-        from adw_modules.agent import prompt_claude_code
-        from adw_modules.data_types import AgentPromptRequest
-        from adw_modules.utils import make_adw_id
-
         adw_id = make_adw_id()
         output_file = os.path.join(temp_output_dir, "claude_max_test.jsonl")
 
@@ -505,6 +515,20 @@ class TestClaudeCodeExecution:
 # Test: Workflow Scripts Structure
 # =============================================================================
 
+@functools.lru_cache(maxsize=32)
+def _script_meta(path: str) -> Tuple[str, bool, bool]:
+    """Read a workflow script once and extract what the structure tests check.
+
+    Returns:
+        Tuple of (first line, has main() function, has __main__ guard)
+    """
+    content = Path(path).read_text()
+    first_line = content.split("\n", 1)[0]
+    has_main = "def main()" in content
+    has_guard = 'if __name__ == "__main__"' in content
+    return first_line, has_main, has_guard
+
+
 class TestWorkflowScriptsStructure:
     """Tests verifying workflow scripts have correct structure."""
 
@@ -537,11 +561,10 @@ class TestWorkflowScriptsStructure:
 
         for script in self.WORKFLOW_SCRIPTS:
             script_path = adws_dir / script
-            with open(script_path) as f:
-                first_line = f.readline()
-                # Should have uv shebang
-                assert "uv run" in first_line or "python" in first_line, \
-                    f"{script} missing proper shebang"
+            first_line, _, _ = _script_meta(str(script_path))
+            # Should have uv shebang
+            assert "uv run" in first_line or "python" in first_line, \
+                f"{script} missing proper shebang"
 
     def test_workflow_scripts_have_main(self):
         """Verify workflow scripts have main() function."""
@@ -549,10 +572,9 @@ class TestWorkflowScriptsStructure:
 
         for script in self.WORKFLOW_SCRIPTS:
             script_path = adws_dir / script
-            content = script_path.read_text()
-            assert "def main()" in content, f"{script} missing main() function"
-            assert 'if __name__ == "__main__"' in content, \
-                f"{script} missing __main__ guard"
+            _, has_main, has_guard = _script_meta(str(script_path))
+            assert has_main, f"{script} missing main() function"
+            assert has_guard, f"{script} missing __main__ guard"
 
 
 # =============================================================================
@@ -564,8 +586,6 @@ class TestEnvironmentHandling:
 
     def test_get_safe_subprocess_env_includes_api_key(self):
         """Test that safe env includes ANTHROPIC_API_KEY when set."""
-        from adw_modules.utils import get_safe_subprocess_env
-
         with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"}):
             env = get_safe_subprocess_env()
             assert "ANTHROPIC_API_KEY" in env
@@ -573,8 +593,6 @@ class TestEnvironmentHandling:
 
     def test_get_safe_subprocess_env_excludes_sensitive(self):
         """Test that safe env excludes non-whitelisted vars."""
-        from adw_modules.utils import get_safe_subprocess_env
-
         with patch.dict(os.environ, {
             "ANTHROPIC_API_KEY": "test-key",
             "SECRET_DATABASE_PASSWORD": "secret123",
@@ -586,8 +604,6 @@ class TestEnvironmentHandling:
 
     def test_get_safe_subprocess_env_without_api_key(self):
         """Test safe env when ANTHROPIC_API_KEY is not set."""
-        from adw_modules.utils import get_safe_subprocess_env
-
         env_copy = os.environ.copy()
         env_copy.pop("ANTHROPIC_API_KEY", None)
 
@@ -606,8 +622,6 @@ class TestModelSelection:
 
     def test_slash_command_model_mapping(self):
         """Test the slash command to model mapping."""
-        from adw_modules.agent import SLASH_COMMAND_MODEL_MAP
-
         # Verify mapping exists and has expected commands
         assert "/implement" in SLASH_COMMAND_MODEL_MAP
         assert "/classify_issue" in SLASH_COMMAND_MODEL_MAP
@@ -625,10 +639,6 @@ class TestModelSelection:
     @requires_any_auth
     def test_model_parameter_passed_to_cli(self, temp_output_dir):
         """Test that model parameter is correctly passed to Claude CLI."""
-        from adw_modules.agent import prompt_claude_code
-        from adw_modules.data_types import AgentPromptRequest
-        from adw_modules.utils import make_adw_id
-
         adw_id = make_adw_id()
 
         # Test with sonnet
@@ -655,11 +665,12 @@ def print_auth_status():
     print("\n" + "=" * 60)
     print("ADW Workflow Test Suite - Authentication Status")
     print("=" * 60)
-    print(f"Claude CLI installed: {AUTH_CONFIG.claude_cli_installed}")
-    print(f"Claude CLI path: {AUTH_CONFIG.claude_cli_path}")
-    print(f"API key available: {AUTH_CONFIG.api_key_available}")
-    print(f"Claude Max available: {AUTH_CONFIG.claude_max_available}")
-    print(f"Active auth mode: {AUTH_CONFIG.mode.value}")
+    auth_config = load_auth_config()
+    print(f"Claude CLI installed: {auth_config.claude_cli_installed}")
+    print(f"Claude CLI path: {auth_config.claude_cli_path}")
+    print(f"API key available: {auth_config.api_key_available}")
+    print(f"Claude Max available: {auth_config.claude_max_available}")
+    print(f"Active auth mode: {auth_config.mode.value}")
     print("=" * 60 + "\n")
 
 
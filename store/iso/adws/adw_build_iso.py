@@ -44,22 +44,15 @@ from adw_modules.worktree_ops import validate_worktree
 
 
 
-def main():
-    """Main entry point."""
+def run(issue_number: str, adw_id: str):
+    """Run the isolated build phase for an issue.
+
+    Can be called in-process by composite workflows; failures exit via
+    sys.exit just as when the script is run directly.
+    """
     # Load environment variables
     load_dotenv()
     
-    # Parse command line args
-    # INTENTIONAL: adw-id is REQUIRED - we need it to find the worktree
-    if len(sys.argv) < 3:
-        print("Usage: uv run adw_build_iso.py <issue-number> <adw-id>")
-        print("\nError: adw-id is required to locate the worktree and plan file")
-        print("Run adw_plan_iso.py or adw_patch_iso.py first to create the worktree")
-        sys.exit(1)
-    
-    issue_number = sys.argv[1]
-    adw_id = sys.argv[2]
-    
     # Try to load existing state
     temp_logger = setup_logger(adw_id, "adw_build_iso")
     state = ADWState.load(adw_id, temp_logger)
@@ -249,5 +242,21 @@ def main():
     )
 
 
+def main():
+    """Main entry point."""
+    # Parse command line args
+    # INTENTIONAL: adw-id is REQUIRED - we need it to find the worktree
+    if len(sys.argv) < 3:
+        print("Usage: uv run adw_build_iso.py <issue-number> <adw-id>")
+        print("\nError: adw-id is required to locate the worktree and plan file")
+        print("Run adw_plan_iso.py or adw_patch_iso.py first to create the worktree")
+        sys.exit(1)
+    
+    issue_number = sys.argv[1]
+    adw_id = sys.argv[2]
+
+    run(issue_number, adw_id)
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -13,12 +13,14 @@ This module contains all GitHub-related operations including:
 - Issue status management
 """
 
+import functools
 import subprocess
 import sys
 import os
 import json
 from typing import Dict, List, Optional
 from .data_types import GitHubIssue, GitHubIssueListItem, GitHubComment
+from .utils import swallow_errors
 
 # Bot identifier to prevent webhook loops and filter bot comments
 ADW_BOT_IDENTIFIER = "[ADW-AGENTS]"
@@ -54,12 +56,23 @@ def get_github_env() -> Optional[dict]:
 
 def get_repo_url() -> str:
     """Get GitHub repository URL from git remote."""
+    return _get_repo_url(os.getcwd())
+
+
+@functools.lru_cache(maxsize=8)
+def _get_repo_url(cwd: str) -> str:
+    """Look up the origin URL for a working directory once per process.
+
+    Every GitHub call resolves the repository first; caching saves a git
+    subprocess on each comment posted during a workflow.
+    """
     try:
         result = subprocess.run(
             ["git", "remote", "get-url", "origin"],
             capture_output=True,
             text=True,
             check=True,
+            cwd=cwd,
         )
         return result.stdout.strip()
     except subprocess.CalledProcessError:
@@ -161,6 +174,10 @@ def make_issue_comment(issue_id: str, comment: str) -> None:
         raise
 
 
+# make_issue_comment for status messages whose failure must not stop a workflow
+safe_make_issue_comment = swallow_errors(make_issue_comment)
+
+
 def mark_issue_in_progress(issue_id: str) -> None:
     """Mark issue as in progress by adding label and comment."""
     # Get repo information from git remote
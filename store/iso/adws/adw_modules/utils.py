@@ -1,5 +1,6 @@
 """Utility functions for ADW system."""
 
+import functools
 import json
 import logging
 import os
@@ -7,10 +8,31 @@ import re
 import sys
 import uuid
 from datetime import datetime
-from typing import Any, TypeVar, Type, Union, Dict, Optional
+from typing import Any, Callable, TypeVar, Type, Union, Dict, Optional
 
 T = TypeVar('T')
 
+# Markdown code block around JSON: ```json\n...\n``` or ```\n...\n```
+CODE_BLOCK_PATTERN = re.compile(r'```(?:json)?\s*\n(.*?)\n```', re.DOTALL)
+
+
+def swallow_errors(func: Callable[..., T]) -> Callable[..., Optional[T]]:
+    """Wrap a best-effort call so failures print a warning instead of raising.
+
+    For calls such as status comments whose failure must not stop a
+    workflow; the wrapped function returns None when func raises.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs) -> Optional[T]:
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            print(f"WARNING: {func.__name__} failed: {e}")
+            return None
+
+    return wrapper
+
 
 def make_adw_id() -> str:
     """Generate a short 8-character UUID for ADW tracking."""
@@ -105,9 +127,7 @@ def parse_json(text: str, target_type: Type[T] = None) -> Union[T, Any]:
         ValueError: If JSON cannot be parsed from the text
     """
     # Try to extract JSON from markdown code blocks
-    # Pattern matches ```json\n...\n``` or ```\n...\n```
-    code_block_pattern = r'```(?:json)?\s*\n(.*?)\n```'
-    match = re.search(code_block_pattern, text, re.DOTALL)
+    match = CODE_BLOCK_PATTERN.search(text)
     
     if match:
         json_str = match.group(1).strip()
@@ -6,70 +6,57 @@
 """
 ADW Plan Build Iso - Compositional workflow for isolated planning and building
 
-Usage: uv run adw_plan_build_iso.py <issue-number> [adw-id]
+Usage: uv run adw_plan_build_iso.py <issue-number> [adw-id] [--isolate]
 
 This script runs:
 1. adw_plan_iso.py - Planning phase (isolated)
 2. adw_build_iso.py - Implementation phase (isolated)
 
 The scripts are chained together via persistent state (adw_state.json).
+Phases run in-process; --isolate runs each one as a separate `uv run`.
 """
 
-import subprocess
 import sys
 import os
 
 # Add the parent directory to Python path to import modules
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from adw_modules.workflow_ops import ensure_adw_id
+from adw_modules.workflow_ops import ensure_adw_id, prepare_phase_env, run_phase
 
 
 def main():
     """Main entry point."""
-    if len(sys.argv) < 2:
-        print("Usage: uv run adw_plan_build_iso.py <issue-number> [adw-id]")
+    isolate = "--isolate" in sys.argv[1:]
+    args = [arg for arg in sys.argv[1:] if arg != "--isolate"]
+
+    if len(args) < 1:
+        print("Usage: uv run adw_plan_build_iso.py <issue-number> [adw-id] [--isolate]")
         print("\nThis runs the isolated plan and build workflow:")
         print("  1. Plan (isolated)")
         print("  2. Build (isolated)")
         sys.exit(1)
 
-    issue_number = sys.argv[1]
-    adw_id = sys.argv[2] if len(sys.argv) > 2 else None
+    issue_number = args[0]
+    adw_id = args[1] if len(args) > 1 else None
 
     # Ensure ADW ID exists with initialized state
     adw_id = ensure_adw_id(issue_number, adw_id)
     print(f"Using ADW ID: {adw_id}")
 
-    # Get the directory where this script is located
-    script_dir = os.path.dirname(os.path.abspath(__file__))
+    # Isolated phases share one environment instead of each resolving its own
+    phase_python = (
+        prepare_phase_env(adw_id, ["adw_plan_iso.py", "adw_build_iso.py"]) if isolate else None
+    )
 
     # Run isolated plan with the ADW ID
-    plan_cmd = [
-        "uv",
-        "run",
-        os.path.join(script_dir, "adw_plan_iso.py"),
-        issue_number,
-        adw_id,
-    ]
     print(f"\n=== ISOLATED PLAN PHASE ===")
-    print(f"Running: {' '.join(plan_cmd)}")
-    plan = subprocess.run(plan_cmd)
-    if plan.returncode != 0:
+    if run_phase("adw_plan_iso.py", issue_number, adw_id, isolate, phase_python) != 0:
         print("Isolated plan phase failed")
         sys.exit(1)
 
     # Run isolated build with the ADW ID
-    build_cmd = [
-        "uv",
-        "run",
-        os.path.join(script_dir, "adw_build_iso.py"),
-        issue_number,
-        adw_id,
-    ]
     print(f"\n=== ISOLATED BUILD PHASE ===")
-    print(f"Running: {' '.join(build_cmd)}")
-    build = subprocess.run(build_cmd)
-    if build.returncode != 0:
+    if run_phase("adw_build_iso.py", issue_number, adw_id, isolate, phase_python) != 0:
         print("Isolated build phase failed")
         sys.exit(1)
 
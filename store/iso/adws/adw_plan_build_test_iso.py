@@ -6,7 +6,7 @@
 """
 ADW Plan Build Test Iso - Compositional workflow for isolated planning, building, and testing
 
-Usage: uv run adw_plan_build_test_iso.py <issue-number> [adw-id] [--skip-e2e]
+Usage: uv run adw_plan_build_test_iso.py <issue-number> [adw-id] [--skip-e2e] [--isolate] [--restart] [--exec-tail]
 
 This script runs:
 1. adw_plan_iso.py - Planning phase (isolated)
@@ -14,89 +14,92 @@ This script runs:
 3. adw_test_iso.py - Testing phase (isolated)
 
 The scripts are chained together via persistent state (adw_state.json).
+Phases run in-process; --isolate runs each one as a separate `uv run`.
+Phases completed by an interrupted run are skipped; --restart runs them all.
+With --exec-tail the test phase replaces this process instead of running
+under it; it reports its own results and is not checkpointed.
 """
 
-import subprocess
 import sys
 import os
 
 # Add the parent directory to Python path to import modules
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from adw_modules.workflow_ops import ensure_adw_id
+from adw_modules.workflow_ops import (
+    clear_checkpoint,
+    ensure_adw_id,
+    exec_phase,
+    load_checkpoint,
+    prepare_phase_env,
+    run_phase,
+    save_checkpoint,
+)
+
+# Phases in the order they run: (name, script)
+PHASES = (
+    ("plan", "adw_plan_iso.py"),
+    ("build", "adw_build_iso.py"),
+    ("test", "adw_test_iso.py"),
+)
 
 
 def main():
     """Main entry point."""
-    # Check for --skip-e2e flag
-    skip_e2e = "--skip-e2e" in sys.argv
-    if skip_e2e:
-        sys.argv.remove("--skip-e2e")
-    
-    if len(sys.argv) < 2:
-        print("Usage: uv run adw_plan_build_test_iso.py <issue-number> [adw-id] [--skip-e2e]")
+    # Check for flags
+    skip_e2e = "--skip-e2e" in sys.argv[1:]
+    isolate = "--isolate" in sys.argv[1:]
+    restart = "--restart" in sys.argv[1:]
+    exec_tail = "--exec-tail" in sys.argv[1:]
+    args = [
+        arg
+        for arg in sys.argv[1:]
+        if arg not in ("--skip-e2e", "--isolate", "--restart", "--exec-tail")
+    ]
+
+    if len(args) < 1:
+        print("Usage: uv run adw_plan_build_test_iso.py <issue-number> [adw-id] [--skip-e2e] [--isolate] [--restart] [--exec-tail]")
         print("\nThis runs the isolated plan, build, and test workflow:")
         print("  1. Plan (isolated)")
         print("  2. Build (isolated)")
         print("  3. Test (isolated)")
         sys.exit(1)
 
-    issue_number = sys.argv[1]
-    adw_id = sys.argv[2] if len(sys.argv) > 2 else None
+    issue_number = args[0]
+    adw_id = args[1] if len(args) > 1 else None
 
     # Ensure ADW ID exists with initialized state
     adw_id = ensure_adw_id(issue_number, adw_id)
     print(f"Using ADW ID: {adw_id}")
 
-    # Get the directory where this script is located
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-
-    # Run isolated plan with the ADW ID
-    plan_cmd = [
-        "uv",
-        "run",
-        os.path.join(script_dir, "adw_plan_iso.py"),
-        issue_number,
-        adw_id,
-    ]
-    print(f"\n=== ISOLATED PLAN PHASE ===")
-    print(f"Running: {' '.join(plan_cmd)}")
-    plan = subprocess.run(plan_cmd)
-    if plan.returncode != 0:
-        print("Isolated plan phase failed")
-        sys.exit(1)
-
-    # Run isolated build with the ADW ID
-    build_cmd = [
-        "uv",
-        "run",
-        os.path.join(script_dir, "adw_build_iso.py"),
-        issue_number,
-        adw_id,
-    ]
-    print(f"\n=== ISOLATED BUILD PHASE ===")
-    print(f"Running: {' '.join(build_cmd)}")
-    build = subprocess.run(build_cmd)
-    if build.returncode != 0:
-        print("Isolated build phase failed")
-        sys.exit(1)
-
-    # Run isolated test with the ADW ID
-    test_cmd = [
-        "uv",
-        "run",
-        os.path.join(script_dir, "adw_test_iso.py"),
-        issue_number,
-        adw_id,
-    ]
-    if skip_e2e:
-        test_cmd.append("--skip-e2e")
-    
-    print(f"\n=== ISOLATED TEST PHASE ===")
-    print(f"Running: {' '.join(test_cmd)}")
-    test = subprocess.run(test_cmd)
-    if test.returncode != 0:
-        print("Isolated test phase failed")
-        sys.exit(1)
+    # Phases completed by an earlier, interrupted run are skipped
+    if restart:
+        clear_checkpoint(adw_id)
+    completed = load_checkpoint(adw_id)
+
+    # Isolated phases share one environment instead of each resolving its own
+    phase_python = (
+        prepare_phase_env(adw_id, [script_name for _, script_name in PHASES]) if isolate else None
+    )
+
+    # Options passed to a phase's run()
+    phase_opts = {"test": {"skip_e2e": skip_e2e}}
+
+    # Run each isolated phase with the ADW ID
+    for name, script_name in PHASES:
+        print(f"\n=== ISOLATED {name.upper()} PHASE ===")
+        if name in completed:
+            print(f"↷ Skipping {name.capitalize()} (already completed at {completed[name]})")
+            continue
+        if exec_tail and name == PHASES[-1][0]:
+            # Nothing follows the last phase, so it takes over this process
+            exec_phase(script_name, issue_number, adw_id, phase_python, **phase_opts.get(name, {}))
+        returncode = run_phase(
+            script_name, issue_number, adw_id, isolate, phase_python, **phase_opts.get(name, {})
+        )
+        if returncode != 0:
+            print(f"Isolated {name} phase failed")
+            sys.exit(1)
+        save_checkpoint(adw_id, name)
 
     print(f"\n=== ISOLATED WORKFLOW COMPLETED ===")
     print(f"ADW ID: {adw_id}")
@@ -29,16 +29,11 @@ from adw_modules.workflow_ops import ensure_adw_id
 def main():
     """Main entry point."""
     # Check for flags
-    skip_e2e = "--skip-e2e" in sys.argv
-    skip_resolution = "--skip-resolution" in sys.argv
+    skip_e2e = "--skip-e2e" in sys.argv[1:]
+    skip_resolution = "--skip-resolution" in sys.argv[1:]
+    args = [arg for arg in sys.argv[1:] if arg not in ("--skip-e2e", "--skip-resolution")]
     
-    # Remove flags from argv
-    if skip_e2e:
-        sys.argv.remove("--skip-e2e")
-    if skip_resolution:
-        sys.argv.remove("--skip-resolution")
-    
-    if len(sys.argv) < 2:
+    if len(args) < 1:
         print("Usage: uv run adw_plan_build_test_review_iso.py <issue-number> [adw-id] [--skip-e2e] [--skip-resolution]")
         print("\nThis runs the isolated plan, build, test, and review workflow:")
         print("  1. Plan (isolated)")
@@ -47,8 +42,8 @@ def main():
         print("  4. Review (isolated)")
         sys.exit(1)
 
-    issue_number = sys.argv[1]
-    adw_id = sys.argv[2] if len(sys.argv) > 2 else None
+    issue_number = args[0]
+    adw_id = args[1] if len(args) > 1 else None
 
     # Ensure ADW ID exists with initialized state
     adw_id = ensure_adw_id(issue_number, adw_id)
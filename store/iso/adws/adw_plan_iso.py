@@ -63,19 +63,15 @@ from adw_modules.worktree_ops import (
 
 
 
-def main():
-    """Main entry point."""
+def run(issue_number: str, adw_id: Optional[str] = None):
+    """Run the isolated planning phase for an issue.
+
+    Can be called in-process by composite workflows; failures exit via
+    sys.exit just as when the script is run directly.
+    """
     # Load environment variables
     load_dotenv()
 
-    # Parse command line args
-    if len(sys.argv) < 2:
-        print("Usage: uv run adw_plan_iso.py <issue-number> [adw-id]")
-        sys.exit(1)
-
-    issue_number = sys.argv[1]
-    adw_id = sys.argv[2] if len(sys.argv) > 2 else None
-
     # Ensure ADW ID exists with initialized state
     temp_logger = setup_logger(adw_id, "adw_plan_iso") if adw_id else None
     adw_id = ensure_adw_id(issue_number, adw_id, temp_logger)
@@ -334,5 +330,18 @@ def main():
     )
 
 
+def main():
+    """Main entry point."""
+    # Parse command line args
+    if len(sys.argv) < 2:
+        print("Usage: uv run adw_plan_iso.py <issue-number> [adw-id]")
+        sys.exit(1)
+
+    issue_number = sys.argv[1]
+    adw_id = sys.argv[2] if len(sys.argv) > 2 else None
+
+    run(issue_number, adw_id)
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -312,27 +312,15 @@ def build_review_summary(review_result: ReviewResult) -> str:
     return "\n".join(summary_parts)
 
 
-def main():
-    """Main entry point."""
+def run(issue_number: str, adw_id: str, skip_resolution: bool = False):
+    """Run the isolated review phase for an issue.
+
+    Can be called in-process by composite workflows; failures exit via
+    sys.exit just as when the script is run directly.
+    """
     # Load environment variables
     load_dotenv()
     
-    # Check for --skip-resolution flag
-    skip_resolution = "--skip-resolution" in sys.argv
-    if skip_resolution:
-        sys.argv.remove("--skip-resolution")
-    
-    # Parse command line args
-    # INTENTIONAL: adw-id is REQUIRED - we need it to find the worktree
-    if len(sys.argv) < 3:
-        print("Usage: uv run adw_review_iso.py <issue-number> <adw-id> [--skip-resolution]")
-        print("\nError: adw-id is required to locate the worktree")
-        print("Run adw_plan_iso.py or adw_patch_iso.py first to create the worktree")
-        sys.exit(1)
-    
-    issue_number = sys.argv[1]
-    adw_id = sys.argv[2]
-    
     # Try to load existing state
     temp_logger = setup_logger(adw_id, "adw_review_iso")
     state = ADWState.load(adw_id, temp_logger)
@@ -531,5 +519,25 @@ def main():
     )
 
 
+def main():
+    """Main entry point."""
+    # Check for --skip-resolution flag
+    skip_resolution = "--skip-resolution" in sys.argv[1:]
+    args = [arg for arg in sys.argv[1:] if arg != "--skip-resolution"]
+    
+    # Parse command line args
+    # INTENTIONAL: adw-id is REQUIRED - we need it to find the worktree
+    if len(args) < 2:
+        print("Usage: uv run adw_review_iso.py <issue-number> <adw-id> [--skip-resolution]")
+        print("\nError: adw-id is required to locate the worktree")
+        print("Run adw_plan_iso.py or adw_patch_iso.py first to create the worktree")
+        sys.exit(1)
+    
+    issue_number = args[0]
+    adw_id = args[1]
+
+    run(issue_number, adw_id, skip_resolution)
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -6,7 +6,7 @@
 """
 ADW SDLC Iso - Complete Software Development Life Cycle workflow with isolation
 
-Usage: uv run adw_sdlc_iso.py <issue-number> [adw-id] [--skip-e2e] [--skip-resolution]
+Usage: uv run adw_sdlc_iso.py <issue-number> [adw-id] [--skip-e2e] [--skip-resolution] [--isolate] [--restart]
 
 This script runs the complete ADW SDLC pipeline in isolation:
 1. adw_plan_iso.py - Planning phase (isolated)
@@ -17,31 +17,50 @@ This script runs the complete ADW SDLC pipeline in isolation:
 
 The scripts are chained together via persistent state (adw_state.json).
 Each phase runs in its own git worktree with dedicated ports.
+Phases run in-process; --isolate runs each one as a separate `uv run`.
+Phases completed by an interrupted run are skipped; --restart runs them all.
 """
 
-import subprocess
 import sys
 import os
 
 # Add the parent directory to Python path to import modules
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from adw_modules.workflow_ops import ensure_adw_id
+from adw_modules.workflow_ops import (
+    PhaseDAG,
+    clear_checkpoint,
+    ensure_adw_id,
+    load_checkpoint,
+    prepare_phase_env,
+    run_phase,
+    save_checkpoint,
+)
+
+# Phases in the order they are added to the graph:
+# (name, banner, script, phases it depends on)
+PHASES = (
+    ("plan", "PLAN", "adw_plan_iso.py", ()),
+    ("build", "BUILD", "adw_build_iso.py", ("plan",)),
+    ("test", "TEST", "adw_test_iso.py", ("build",)),
+    ("review", "REVIEW", "adw_review_iso.py", ("build",)),
+    ("document", "DOCUMENTATION", "adw_document_iso.py", ("test", "review")),
+)
 
 
 def main():
     """Main entry point."""
     # Check for flags
-    skip_e2e = "--skip-e2e" in sys.argv
-    skip_resolution = "--skip-resolution" in sys.argv
-    
-    # Remove flags from argv
-    if skip_e2e:
-        sys.argv.remove("--skip-e2e")
-    if skip_resolution:
-        sys.argv.remove("--skip-resolution")
-    
-    if len(sys.argv) < 2:
-        print("Usage: uv run adw_sdlc_iso.py <issue-number> [adw-id] [--skip-e2e] [--skip-resolution]")
+    skip_e2e = "--skip-e2e" in sys.argv[1:]
+    skip_resolution = "--skip-resolution" in sys.argv[1:]
+    isolate = "--isolate" in sys.argv[1:]
+    restart = "--restart" in sys.argv[1:]
+    args = [
+        arg for arg in sys.argv[1:]
+        if arg not in ("--skip-e2e", "--skip-resolution", "--isolate", "--restart")
+    ]
+
+    if len(args) < 1:
+        print("Usage: uv run adw_sdlc_iso.py <issue-number> [adw-id] [--skip-e2e] [--skip-resolution] [--isolate] [--restart]")
         print("\nThis runs the complete isolated Software Development Life Cycle:")
         print("  1. Plan (isolated)")
         print("  2. Build (isolated)")
@@ -50,95 +69,61 @@ def main():
         print("  5. Document (isolated)")
         sys.exit(1)
 
-    issue_number = sys.argv[1]
-    adw_id = sys.argv[2] if len(sys.argv) > 2 else None
+    issue_number = args[0]
+    adw_id = args[1] if len(args) > 1 else None
 
     # Ensure ADW ID exists with initialized state
     adw_id = ensure_adw_id(issue_number, adw_id)
     print(f"Using ADW ID: {adw_id}")
 
-    # Get the directory where this script is located
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-
-    # Run isolated plan with the ADW ID
-    plan_cmd = [
-        "uv",
-        "run",
-        os.path.join(script_dir, "adw_plan_iso.py"),
-        issue_number,
-        adw_id,
-    ]
-    print(f"\n=== ISOLATED PLAN PHASE ===")
-    print(f"Running: {' '.join(plan_cmd)}")
-    plan = subprocess.run(plan_cmd)
-    if plan.returncode != 0:
-        print("Isolated plan phase failed")
-        sys.exit(1)
-
-    # Run isolated build with the ADW ID
-    build_cmd = [
-        "uv",
-        "run",
-        os.path.join(script_dir, "adw_build_iso.py"),
-        issue_number,
-        adw_id,
-    ]
-    print(f"\n=== ISOLATED BUILD PHASE ===")
-    print(f"Running: {' '.join(build_cmd)}")
-    build = subprocess.run(build_cmd)
-    if build.returncode != 0:
-        print("Isolated build phase failed")
-        sys.exit(1)
-
-    # Run isolated test with the ADW ID
-    test_cmd = [
-        "uv",
-        "run",
-        os.path.join(script_dir, "adw_test_iso.py"),
-        issue_number,
-        adw_id,
-        "--skip-e2e",  # Always skip E2E tests in SDLC workflows
-    ]
-    
-    print(f"\n=== ISOLATED TEST PHASE ===")
-    print(f"Running: {' '.join(test_cmd)}")
-    test = subprocess.run(test_cmd)
-    if test.returncode != 0:
-        print("Isolated test phase failed")
-        # Note: Continue anyway as some tests might be flaky
-        print("WARNING: Test phase failed but continuing with review")
-
-    # Run isolated review with the ADW ID
-    review_cmd = [
-        "uv",
-        "run",
-        os.path.join(script_dir, "adw_review_iso.py"),
-        issue_number,
-        adw_id,
-    ]
-    if skip_resolution:
-        review_cmd.append("--skip-resolution")
-    
-    print(f"\n=== ISOLATED REVIEW PHASE ===")
-    print(f"Running: {' '.join(review_cmd)}")
-    review = subprocess.run(review_cmd)
-    if review.returncode != 0:
-        print("Isolated review phase failed")
-        sys.exit(1)
-
-    # Run isolated documentation with the ADW ID
-    document_cmd = [
-        "uv",
-        "run",
-        os.path.join(script_dir, "adw_document_iso.py"),
-        issue_number,
-        adw_id,
-    ]
-    print(f"\n=== ISOLATED DOCUMENTATION PHASE ===")
-    print(f"Running: {' '.join(document_cmd)}")
-    document = subprocess.run(document_cmd)
-    if document.returncode != 0:
-        print("Isolated documentation phase failed")
+    # Isolated phases share one environment instead of each resolving its own
+    phase_python = (
+        prepare_phase_env(adw_id, [script_name for _, _, script_name, _ in PHASES]) if isolate else None
+    )
+
+    # Phases completed by an earlier, interrupted run are skipped
+    if restart:
+        clear_checkpoint(adw_id)
+    completed = load_checkpoint(adw_id)
+
+    def phase(name: str, banner: str, script_name: str, **opts):
+        def run() -> int:
+            print(f"\n=== ISOLATED {banner} PHASE ===")
+            if name in completed:
+                print(f"↷ Skipping {name.capitalize()} (already completed at {completed[name]})")
+                return 0
+            returncode = run_phase(script_name, issue_number, adw_id, isolate, phase_python, **opts)
+            if returncode == 0:
+                save_checkpoint(adw_id, name)
+            elif name == "test":
+                print("WARNING: Isolated test phase failed but the workflow continued")
+            else:
+                print(f"Isolated {banner.lower()} phase failed")
+            return returncode
+        return run
+
+    # Options passed to a phase's run(); E2E tests are always skipped in
+    # SDLC workflows
+    phase_opts = {
+        "test": {"skip_e2e": True},
+        "review": {"skip_resolution": skip_resolution},
+    }
+
+    # Phases run one after another; test and review share the worktree and
+    # state, and both commit and push. Test failures do not stop the
+    # workflow as some tests might be flaky.
+    dag = PhaseDAG()
+    for name, banner, script_name, deps in PHASES:
+        dag.add(
+            name,
+            phase(name, banner, script_name, **phase_opts.get(name, {})),
+            deps=deps,
+            allow_failure=name == "test",
+        )
+    results = dag.run()
+
+    # Failures were reported as they happened
+    if any(results.get(name) != 0 for name, _, _, _ in PHASES if name != "test"):
         sys.exit(1)
 
     print(f"\n=== ISOLATED SDLC COMPLETED ===")
@@ -30,22 +30,17 @@ import os
 # Add the parent directory to Python path to import modules
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from adw_modules.workflow_ops import ensure_adw_id
-from adw_modules.github import make_issue_comment
+from adw_modules.github import safe_make_issue_comment
 
 
 def main():
     """Main entry point."""
     # Check for flags
-    skip_e2e = "--skip-e2e" in sys.argv
-    skip_resolution = "--skip-resolution" in sys.argv
+    skip_e2e = "--skip-e2e" in sys.argv[1:]
+    skip_resolution = "--skip-resolution" in sys.argv[1:]
+    args = [arg for arg in sys.argv[1:] if arg not in ("--skip-e2e", "--skip-resolution")]
 
-    # Remove flags from argv
-    if skip_e2e:
-        sys.argv.remove("--skip-e2e")
-    if skip_resolution:
-        sys.argv.remove("--skip-resolution")
-
-    if len(sys.argv) < 2:
+    if len(args) < 1:
         print(
             "Usage: uv run adw_sdlc_zte_iso.py <issue-number> [adw-id] [--skip-e2e] [--skip-resolution]"
         )
@@ -60,29 +55,26 @@ def main():
         print("\n⚠️  WARNING: This will automatically merge to main if all phases pass!")
         sys.exit(1)
 
-    issue_number = sys.argv[1]
-    adw_id = sys.argv[2] if len(sys.argv) > 2 else None
+    issue_number = args[0]
+    adw_id = args[1] if len(args) > 1 else None
 
     # Ensure ADW ID exists with initialized state
     adw_id = ensure_adw_id(issue_number, adw_id)
     print(f"Using ADW ID: {adw_id}")
 
     # Post initial ZTE message
-    try:
-        make_issue_comment(
-            issue_number,
-            f"{adw_id}_ops: 🚀 **Starting Zero Touch Execution (ZTE)**\n\n"
-            "This workflow will automatically:\n"
-            "1. ✍️ Plan the implementation\n"
-            "2. 🔨 Build the solution\n"
-            "3. 🧪 Test the code\n"
-            "4. 👀 Review the implementation\n"
-            "5. 📚 Generate documentation\n"
-            "6. 🚢 **Ship to production** (approve & merge PR)\n\n"
-            "⚠️ Code will be automatically merged if all phases pass!",
-        )
-    except Exception as e:
-        print(f"Warning: Failed to post initial comment: {e}")
+    safe_make_issue_comment(
+        issue_number,
+        f"{adw_id}_ops: 🚀 **Starting Zero Touch Execution (ZTE)**\n\n"
+        "This workflow will automatically:\n"
+        "1. ✍️ Plan the implementation\n"
+        "2. 🔨 Build the solution\n"
+        "3. 🧪 Test the code\n"
+        "4. 👀 Review the implementation\n"
+        "5. 📚 Generate documentation\n"
+        "6. 🚢 **Ship to production** (approve & merge PR)\n\n"
+        "⚠️ Code will be automatically merged if all phases pass!",
+    )
 
     # Get the directory where this script is located
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -133,15 +125,12 @@ def main():
     if test.returncode != 0:
         print("Isolated test phase failed")
         # For ZTE, we should stop if tests fail
-        try:
-            make_issue_comment(
-                issue_number,
-                f"{adw_id}_ops: ❌ **ZTE Aborted** - Test phase failed\n\n"
-                "Automatic shipping cancelled due to test failures.\n"
-                "Please fix the tests and run the workflow again.",
-            )
-        except:
-            pass
+        safe_make_issue_comment(
+            issue_number,
+            f"{adw_id}_ops: ❌ **ZTE Aborted** - Test phase failed\n\n"
+            "Automatic shipping cancelled due to test failures.\n"
+            "Please fix the tests and run the workflow again.",
+        )
         sys.exit(1)
 
     # Run isolated review with the ADW ID
@@ -160,15 +149,12 @@ def main():
     review = subprocess.run(review_cmd)
     if review.returncode != 0:
         print("Isolated review phase failed")
-        try:
-            make_issue_comment(
-                issue_number,
-                f"{adw_id}_ops: ❌ **ZTE Aborted** - Review phase failed\n\n"
-                "Automatic shipping cancelled due to review failures.\n"
-                "Please address the review issues and run the workflow again.",
-            )
-        except:
-            pass
+        safe_make_issue_comment(
+            issue_number,
+            f"{adw_id}_ops: ❌ **ZTE Aborted** - Review phase failed\n\n"
+            "Automatic shipping cancelled due to review failures.\n"
+            "Please address the review issues and run the workflow again.",
+        )
         sys.exit(1)
 
     # Run isolated documentation with the ADW ID
@@ -200,15 +186,12 @@ def main():
     ship = subprocess.run(ship_cmd)
     if ship.returncode != 0:
         print("Isolated ship phase failed")
-        try:
-            make_issue_comment(
-                issue_number,
-                f"{adw_id}_ops: ❌ **ZTE Failed** - Ship phase failed\n\n"
-                "Could not automatically approve and merge the PR.\n"
-                "Please check the ship logs and merge manually if needed.",
-            )
-        except:
-            pass
+        safe_make_issue_comment(
+            issue_number,
+            f"{adw_id}_ops: ❌ **ZTE Failed** - Ship phase failed\n\n"
+            "Could not automatically approve and merge the PR.\n"
+            "Please check the ship logs and merge manually if needed.",
+        )
         sys.exit(1)
 
     print(f"\n=== 🎉 ZERO TOUCH EXECUTION COMPLETED ===")
@@ -218,20 +201,17 @@ def main():
     print(f"\nWorktree location: trees/{adw_id}/")
     print(f"To clean up: ./scripts/purge_tree.sh {adw_id}")
 
-    try:
-        make_issue_comment(
-            issue_number,
-            f"{adw_id}_ops: 🎉 **Zero Touch Execution Complete!**\n\n"
-            "✅ Plan phase completed\n"
-            "✅ Build phase completed\n"
-            "✅ Test phase completed\n"
-            "✅ Review phase completed\n"
-            "✅ Documentation phase completed\n"
-            "✅ Ship phase completed\n\n"
-            "🚢 **Code has been automatically shipped to production!**",
-        )
-    except:
-        pass
+    safe_make_issue_comment(
+        issue_number,
+        f"{adw_id}_ops: 🎉 **Zero Touch Execution Complete!**\n\n"
+        "✅ Plan phase completed\n"
+        "✅ Build phase completed\n"
+        "✅ Test phase completed\n"
+        "✅ Review phase completed\n"
+        "✅ Documentation phase completed\n"
+        "✅ Ship phase completed\n\n"
+        "🚢 **Code has been automatically shipped to production!**",
+    )
 
 
 if __name__ == "__main__":
@@ -645,28 +645,15 @@ def run_e2e_tests_with_resolution(
     return results, passed_count, failed_count
 
 
-def main():
-    """Main entry point."""
+def run(issue_number: str, adw_id: str, skip_e2e: bool = False):
+    """Run the isolated testing phase for an issue.
+
+    Can be called in-process by composite workflows; failures exit via
+    sys.exit just as when the script is run directly.
+    """
     # Load environment variables
     load_dotenv()
     
-    # Check for --skip-e2e flag in args
-    skip_e2e = "--skip-e2e" in sys.argv
-    # Remove flag from args if present
-    if skip_e2e:
-        sys.argv.remove("--skip-e2e")
-    
-    # Parse command line args
-    # INTENTIONAL: adw-id is REQUIRED - we need it to find the worktree
-    if len(sys.argv) < 3:
-        print("Usage: uv run adw_test_iso.py <issue-number> <adw-id> [--skip-e2e]")
-        print("\nError: adw-id is required to locate the worktree")
-        print("Run adw_plan_iso.py or adw_patch_iso.py first to create the worktree")
-        sys.exit(1)
-    
-    issue_number = sys.argv[1]
-    adw_id = sys.argv[2]
-    
     # Try to load existing state
     temp_logger = setup_logger(adw_id, "adw_test_iso")
     state = ADWState.load(adw_id, temp_logger)
@@ -878,5 +865,25 @@ def main():
         )
 
 
+def main():
+    """Main entry point."""
+    # Check for --skip-e2e flag in args
+    skip_e2e = "--skip-e2e" in sys.argv[1:]
+    args = [arg for arg in sys.argv[1:] if arg != "--skip-e2e"]
+    
+    # Parse command line args
+    # INTENTIONAL: adw-id is REQUIRED - we need it to find the worktree
+    if len(args) < 2:
+        print("Usage: uv run adw_test_iso.py <issue-number> <adw-id> [--skip-e2e]")
+        print("\nError: adw-id is required to locate the worktree")
+        print("Run adw_plan_iso.py or adw_patch_iso.py first to create the worktree")
+        sys.exit(1)
+    
+    issue_number = args[0]
+    adw_id = args[1]
+
+    run(issue_number, adw_id, skip_e2e)
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
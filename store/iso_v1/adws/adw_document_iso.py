@@ -221,18 +221,13 @@ def track_agentic_kpis(
         )
 
 
-def main():
-    """Main entry point."""
-    load_dotenv()
+def run(issue_number: str, adw_id: str):
+    """Run the isolated documentation phase for an issue.
 
-    if len(sys.argv) < 3:
-        print("Usage: uv run adw_document_iso.py <issue-number> <adw-id>")
-        print("\nError: adw-id is required to locate the worktree")
-        print("Run adw_plan_iso.py or adw_patch_iso.py first to create the worktree")
-        sys.exit(1)
-
-    issue_number = sys.argv[1]
-    adw_id = sys.argv[2]
+    Can be called in-process by composite workflows; failures exit via
+    sys.exit just as when the script is run directly.
+    """
+    load_dotenv()
 
     temp_logger = setup_logger(adw_id, "adw_document_iso")
     state = ADWState.load(adw_id, temp_logger)
@@ -461,5 +456,19 @@ def main():
         )
 
 
+def main():
+    """Main entry point."""
+    if len(sys.argv) < 3:
+        print("Usage: uv run adw_document_iso.py <issue-number> <adw-id>")
+        print("\nError: adw-id is required to locate the worktree")
+        print("Run adw_plan_iso.py or adw_patch_iso.py first to create the worktree")
+        sys.exit(1)
+
+    issue_number = sys.argv[1]
+    adw_id = sys.argv[2]
+
+    run(issue_number, adw_id)
+
+
 if __name__ == "__main__":
     main()
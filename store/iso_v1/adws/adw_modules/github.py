@@ -13,12 +13,15 @@ This module contains all GitHub-related operations including:
 - Issue status management
 """
 
+import functools
 import subprocess
 import sys
 import os
 import json
+import re
 from typing import Dict, List, Optional
 from .data_types import GitHubIssue, GitHubIssueListItem, GitHubComment
+from .utils import swallow_errors
 
 # Bot identifier to prevent webhook loops and filter bot comments
 ADW_BOT_IDENTIFIER = "[ADW-AGENTS]"
@@ -54,12 +57,23 @@ def get_github_env() -> Optional[dict]:
 
 def get_repo_url() -> str:
     """Get GitHub repository URL from git remote."""
+    return _get_repo_url(os.getcwd())
+
+
+@functools.lru_cache(maxsize=8)
+def _get_repo_url(cwd: str) -> str:
+    """Look up the origin URL for a working directory once per process.
+
+    Every GitHub call resolves the repository first; caching saves a git
+    subprocess on each comment posted during a workflow.
+    """
     try:
         result = subprocess.run(
             ["git", "remote", "get-url", "origin"],
             capture_output=True,
             text=True,
             check=True,
+            cwd=cwd,
         )
         return result.stdout.strip()
     except subprocess.CalledProcessError:
@@ -123,8 +137,13 @@ def fetch_issue(issue_number: str, repo_path: str) -> GitHubIssue:
         sys.exit(1)
 
 
-def make_issue_comment(issue_id: str, comment: str) -> None:
-    """Post a comment to a GitHub issue using gh CLI."""
+def make_issue_comment(issue_id: str, comment: str) -> Optional[str]:
+    """Post a comment to a GitHub issue using gh CLI.
+
+    Returns:
+        The new comment's ID, for later edits with update_issue_comment(),
+        or None if gh did not report it
+    """
     # Get repo information from git remote
     github_repo_url = get_repo_url()
     repo_path = extract_repo_path(github_repo_url)
@@ -160,6 +179,43 @@ def make_issue_comment(issue_id: str, comment: str) -> None:
         print(f"Error posting comment: {e}", file=sys.stderr)
         raise
 
+    # gh prints the comment URL, ending in #issuecomment-<id>
+    match = re.search(r"#issuecomment-(\d+)", result.stdout)
+    return match.group(1) if match else None
+
+
+# make_issue_comment for status messages whose failure must not stop a workflow
+safe_make_issue_comment = swallow_errors(make_issue_comment)
+
+
+def update_issue_comment(comment_id: str, comment: str) -> None:
+    """Replace the body of an existing issue comment using gh CLI."""
+    # Get repo information from git remote
+    github_repo_url = get_repo_url()
+    repo_path = extract_repo_path(github_repo_url)
+
+    # Ensure comment has ADW_BOT_IDENTIFIER to prevent webhook loops
+    if not comment.startswith(ADW_BOT_IDENTIFIER):
+        comment = f"{ADW_BOT_IDENTIFIER} {comment}"
+
+    cmd = [
+        "gh",
+        "api",
+        "-X",
+        "PATCH",
+        f"repos/{repo_path}/issues/comments/{comment_id}",
+        "-f",
+        f"body={comment}",
+    ]
+
+    env = get_github_env()
+
+    result = subprocess.run(cmd, capture_output=True, text=True, env=env)
+    if result.returncode != 0:
+        print(f"Error updating comment: {result.stderr}", file=sys.stderr)
+        raise RuntimeError(f"Failed to update comment: {result.stderr}")
+    print(f"Successfully updated comment {comment_id}")
+
 
 def mark_issue_in_progress(issue_id: str) -> None:
     """Mark issue as in progress by adding label and comment."""
@@ -0,0 +1,58 @@
+"""Markdown templates for workflow progress comments.
+
+Composite workflows fill these in with substitute() when reporting a phase
+or finishing a run, so the wording can be changed here without touching the
+orchestration logic.
+"""
+
+from string import Template
+
+
+# Detail shown under a phase that failed
+PHASE_FAIL_TMPL = Template(
+    "**Return Code:** $rc\n"
+    "**Logs:** Check `agents/$adw_id/$agent/raw_output.jsonl` for details.\n"
+    "**Manual retry:** `cd trees/$adw_id && uv run --extra adws python "
+    "adws/adw_${phase}_iso.py $issue $adw_id`"
+)
+
+# Detail shown under a test phase that failed without stopping the workflow
+TEST_WARNING_TMPL = Template(
+    "Some tests failed, continuing with review. "
+    "Check `agents/$adw_id/tester/raw_output.jsonl` for details."
+)
+
+# Detail shown under a last phase that took over the workflow's process
+PHASE_HANDOFF_TMPL = Template(
+    "Running as the workflow process; `adw_${phase}_iso.py` posts its own results."
+)
+
+# Detail shown under a phase skipped because a checkpoint recorded it
+PHASE_SKIPPED_TMPL = Template("Skipped, already completed at $ts")
+
+# Summary shown when adw_plan_build_iso completes
+PLAN_BUILD_SUCCESS_TMPL = Template(
+    "**Status:** All phases completed successfully! 🎉\n\n"
+    "**Next Steps:**\n"
+    "- Review the changes in the worktree: `trees/$adw_id/`\n"
+    "- Check the pull request for the implementation\n"
+    "- To run tests: `uv run adws/adw_test_iso.py $issue $adw_id`"
+)
+
+# Summary shown when adw_plan_build_test_iso completes
+PLAN_BUILD_TEST_SUCCESS_TMPL = Template(
+    "**Status:** All phases completed successfully! 🎉"
+)
+
+# Summary shown when adw_sdlc_iso completes
+SDLC_SUCCESS_TMPL = Template(
+    "**Status:** All phases completed! 🎉\n\n"
+    "**Deliverables:**\n"
+    "- Implementation in worktree: `trees/$adw_id/`\n"
+    "- Pull request created with all changes\n"
+    "- Code reviewed and validated\n"
+    "- Documentation updated\n\n"
+    "**Next Steps:**\n"
+    "- Review and merge the pull request\n"
+    "- To clean up worktree: `./scripts/purge_tree.sh $adw_id`"
+)
@@ -0,0 +1,198 @@
+"""Workflow progress reporting in a single GitHub issue comment.
+
+Composite workflows report each phase transition through a StatusReporter
+instead of posting a new comment per transition. The first update posts a
+comment and later updates edit it, so the issue carries one comment that
+always shows the whole workflow.
+"""
+
+import hashlib
+import queue
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from adw_modules.github import make_issue_comment, update_issue_comment
+from adw_modules.utils import get_local_timestamp
+
+
+# Icons for each phase status shown in the progress comment
+STATUS_ICONS = {
+    "pending": "⬜",
+    "running": "🔄",
+    "done": "✅",
+    "warning": "⚠️",
+    "failed": "❌",
+}
+
+# Seconds between refreshes of the comment while a phase is running
+HEARTBEAT_INTERVAL = 300
+
+
+class StatusReporter:
+    """Single, edited issue comment showing the progress of a workflow.
+
+    Comments are sent by a background thread so the workflow never waits on
+    GitHub. When several updates queue up while a request is in flight only
+    the newest is sent, and a body identical to the last one sent is
+    dropped. While a phase runs the comment is refreshed every
+    heartbeat_interval seconds with its elapsed time, so long phases show
+    they are still alive. close() waits for the last update to be sent.
+
+    Without a comment ID there is nothing to edit: the heartbeat waits for
+    one, and if GitHub accepted the comment without reporting its ID, no
+    further comments are posted rather than a new one per update.
+    """
+
+    def __init__(
+        self,
+        issue_number: str,
+        adw_id: str,
+        title: str,
+        phases: List[str],
+        heartbeat_interval: float = HEARTBEAT_INTERVAL,
+    ):
+        """Initialize the reporter.
+
+        Args:
+            issue_number: Issue to comment on
+            adw_id: ADW ID shown in the comment
+            title: Workflow title, e.g. "ADW Plan+Build+Test Workflow"
+            phases: Phase names in the order they run
+            heartbeat_interval: Seconds between refreshes while a phase runs
+        """
+        self.issue_number = issue_number
+        self.adw_id = adw_id
+        self.title = title
+        self.heartbeat_interval = heartbeat_interval
+        self.comment_id: Optional[str] = None
+        # Set once a comment was posted whose ID is unknown
+        self._posting_stopped = False
+        # Digest of the last body GitHub accepted, to skip identical resends
+        self._sent_digest: Optional[bytes] = None
+        self.started = get_local_timestamp()
+        self.details: List[str] = []
+        self.summary: Optional[str] = None
+        # phase -> (status, timestamp, detail)
+        self.phases: Dict[str, Tuple[str, Optional[str], Optional[str]]] = {
+            phase: ("pending", None, None) for phase in phases
+        }
+        # phase -> time.monotonic() when it started running
+        self.running_since: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._queue: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._drain, daemon=True)
+        self._thread.start()
+
+    def add_detail(self, line: str):
+        """Add a line shown under the title, e.g. workflow options."""
+        with self._lock:
+            self.details.append(line)
+
+    def update(self, phase: str, status: str, detail: Optional[str] = None):
+        """Record a phase transition and queue the refreshed comment.
+
+        Args:
+            phase: Phase name passed to the constructor
+            status: One of pending, running, done, warning or failed
+            detail: Optional markdown shown under the phase
+        """
+        with self._lock:
+            self.phases[phase] = (status, get_local_timestamp(), detail)
+            if status == "running":
+                self.running_since[phase] = time.monotonic()
+            else:
+                self.running_since.pop(phase, None)
+            body = self.render()
+        self._queue.put(body)
+
+    def close(self, summary: Optional[str] = None):
+        """Send the final comment, with an optional summary, and wait for it."""
+        with self._lock:
+            self.summary = summary
+            body = self.render()
+        self._queue.put(body)
+        self._queue.put(None)
+        self._thread.join()
+
+    def render(self) -> str:
+        """Render the progress comment from the current phase states."""
+        statuses = [status for status, _, _ in self.phases.values()]
+        if "failed" in statuses:
+            state = "Failed"
+        elif all(status in ("done", "warning") for status in statuses):
+            state = "Completed"
+        else:
+            state = "Running"
+
+        lines = [
+            f"🤖 **{self.title} - {state}**",
+            "",
+            f"**Started:** {self.started}",
+            f"**ADW ID:** `{self.adw_id}`",
+            f"**Workflow:** {' → '.join(self.phases)}",
+        ]
+        lines.extend(self.details)
+        lines.append("")
+        for phase, (status, timestamp, detail) in self.phases.items():
+            line = f"- {STATUS_ICONS.get(status, '•')} **{phase}**"
+            if timestamp:
+                line += f" ({status}, {timestamp}"
+                if phase in self.running_since:
+                    minutes = int(time.monotonic() - self.running_since[phase]) // 60
+                    if minutes:
+                        line += f", {minutes}m elapsed"
+                line += ")"
+            lines.append(line)
+            if detail:
+                lines.extend(f"  {detail_line}" for detail_line in detail.splitlines())
+        if self.summary:
+            lines.extend(["", self.summary])
+        return "\n".join(lines)
+
+    def _drain(self):
+        """Send queued comment bodies until close() is called."""
+        stop = False
+        while not stop:
+            try:
+                body = self._queue.get(timeout=self.heartbeat_interval)
+            except queue.Empty:
+                # Heartbeat: refresh the elapsed time of running phases in
+                # the existing comment, never by posting a new one
+                with self._lock:
+                    if not self.running_since or self.comment_id is None:
+                        continue
+                    body = self.render()
+            if body is None:
+                break
+            # Coalesce: only the newest body needs to reach GitHub
+            while True:
+                try:
+                    newer = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if newer is None:
+                    stop = True
+                    break
+                body = newer
+            self._send(body)
+
+    def _send(self, body: str):
+        """Post the progress comment, or edit it once it exists."""
+        digest = hashlib.blake2b(body.encode(), digest_size=8).digest()
+        if digest == self._sent_digest or self._posting_stopped:
+            return
+        try:
+            if self.comment_id:
+                update_issue_comment(self.comment_id, body)
+            else:
+                self.comment_id = make_issue_comment(self.issue_number, body)
+                if self.comment_id is None:
+                    # Posted, but it cannot be edited; every later update
+                    # would add another comment to the issue
+                    self._posting_stopped = True
+                    print("WARNING: Progress comment ID unknown, not posting further progress updates")
+        except Exception as e:
+            print(f"WARNING: Failed to post progress comment to issue: {e}")
+            return
+        self._sent_digest = digest
@@ -1,24 +1,56 @@
 """Utility functions for ADW system."""
 
+import functools
 import json
 import logging
 import os
 import re
 import sys
+import time
 import uuid
 from datetime import datetime
-from typing import Any, TypeVar, Type, Union, Dict, Optional
+from typing import Any, Callable, TypeVar, Type, Union, Dict, Optional
 
 T = TypeVar('T')
 
+# Markdown code block around JSON: ```json\n...\n``` or ```\n...\n```
+CODE_BLOCK_PATTERN = re.compile(r'```(?:json)?\s*\n(.*?)\n```', re.DOTALL)
+
+
+@functools.lru_cache(maxsize=1)
+def _format_local_second(second: int) -> str:
+    """Format a whole epoch second; cached so calls within one second share it."""
+    return datetime.fromtimestamp(second).strftime("%Y-%m-%d %H:%M:%S")
+
 
 def get_local_timestamp() -> str:
     """Get current local timestamp in readable format.
 
+    Calls within the same second, such as one phase finishing and the next
+    starting, reuse a single formatted string.
+
     Returns:
         Timestamp string in format: "2025-01-15 14:32:45"
     """
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    return _format_local_second(int(time.time()))
+
+
+def swallow_errors(func: Callable[..., T]) -> Callable[..., Optional[T]]:
+    """Wrap a best-effort call so failures print a warning instead of raising.
+
+    For calls such as status comments whose failure must not stop a
+    workflow; the wrapped function returns None when func raises.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs) -> Optional[T]:
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            print(f"WARNING: {func.__name__} failed: {e}")
+            return None
+
+    return wrapper
 
 
 def make_adw_id() -> str:
@@ -114,9 +146,7 @@ def parse_json(text: str, target_type: Type[T] = None) -> Union[T, Any]:
         ValueError: If JSON cannot be parsed from the text
     """
     # Try to extract JSON from markdown code blocks
-    # Pattern matches ```json\n...\n``` or ```\n...\n```
-    code_block_pattern = r'```(?:json)?\s*\n(.*?)\n```'
-    match = re.search(code_block_pattern, text, re.DOTALL)
+    match = CODE_BLOCK_PATTERN.search(text)
     
     if match:
         json_str = match.group(1).strip()
@@ -1,12 +1,20 @@
 """Shared AI Developer Workflow (ADW) operations."""
 
 import glob
+import hashlib
+import importlib
 import json
 import logging
 import os
 import subprocess
 import re
-from typing import Tuple, Optional
+import shutil
+import sys
+import threading
+import time
+import tomllib
+import traceback
+from typing import Callable, Dict, Iterable, List, NoReturn, Tuple, Optional
 from adw_modules.data_types import (
     AgentTemplateRequest,
     GitHubIssue,
@@ -27,6 +35,30 @@ AGENT_CLASSIFIER = "issue_classifier"
 AGENT_BRANCH_GENERATOR = "branch_generator"
 AGENT_PR_CREATOR = "pr_creator"
 
+# Checkpoint of completed phases, kept next to adw_state.json
+CHECKPOINT_FILENAME = ".adw_checkpoint.json"
+
+# Checkpoints older than this (seconds) are ignored as stale
+CHECKPOINT_MAX_AGE = 24 * 60 * 60
+
+# Input file of a phase, as the ADW state key of its worktree-relative path,
+# whose change makes an earlier completion of the phase stale. Later phases
+# edit the worktree code, so only inputs nothing rewrites are tracked.
+PHASE_INPUT_FILES = {
+    "build": "plan_file",
+}
+
+# uv resolved once on PATH, used to launch isolated phases
+UV_EXECUTABLE = shutil.which("uv") or "uv"
+
+# Virtualenv shared by the isolated phases of one ADW ID, under agents/<adw_id>/
+PHASE_VENV_DIRNAME = ".adw_venv"
+
+# PEP 723 inline metadata block of a script (reference regex from the PEP)
+PEP723_SCRIPT_BLOCK_RE = re.compile(
+    r"(?m)^# /// script$\s(?P<content>(^#(| .*)$\s)+)^# ///$"
+)
+
 # Available ADW workflows for runtime validation
 AVAILABLE_ADW_WORKFLOWS = [
     # Isolated workflows (all workflows are now iso-based)
@@ -801,3 +833,299 @@ def create_and_implement_patch(
     )
 
     return patch_file_path, implement_response
+
+
+def phase_command(
+    script_name: str, issue_number: str, adw_id: str, python: Optional[str] = None, **opts
+) -> List[str]:
+    """Build the command line that runs a phase as its own process.
+
+    Uses the given python (see prepare_phase_env) or else `uv run`. Boolean
+    opts become flags, so skip_e2e becomes --skip-e2e.
+    """
+    adws_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    script_path = os.path.join(adws_dir, script_name)
+    if python:
+        cmd = [python, script_path, issue_number, adw_id]
+    else:
+        cmd = [UV_EXECUTABLE, "run", script_path, issue_number, adw_id]
+    cmd += ["--" + name.replace("_", "-") for name, value in opts.items() if value]
+    return cmd
+
+
+def run_phase(
+    script_name: str,
+    issue_number: str,
+    adw_id: str,
+    isolate: bool = False,
+    python: Optional[str] = None,
+    **opts,
+) -> int:
+    """Run one workflow phase and return its exit code.
+
+    Phases run in-process by default, saving a uv and Python start-up per
+    phase; with isolate they run as separate `uv run` processes, or with
+    the given python (see prepare_phase_env) so uv does not resolve the
+    script's dependencies again. Boolean opts are passed to the phase's
+    run() or, when isolated, as flags (skip_e2e becomes --skip-e2e).
+    """
+    if isolate:
+        cmd = phase_command(script_name, issue_number, adw_id, python, **opts)
+        print(f"Running: {' '.join(cmd)}")
+        # With an absolute executable and close_fds=False, CPython launches
+        # the phase with posix_spawn instead of fork_exec. Descriptors opened
+        # by Python are non-inheritable, so none leak into the phase.
+        return subprocess.run(cmd, close_fds=False).returncode
+
+    print(f"Running in-process: {script_name} {issue_number} {adw_id}")
+    phase = importlib.import_module(os.path.splitext(script_name)[0])
+    try:
+        phase.run(issue_number, adw_id, **opts)
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else 1
+    except Exception:
+        traceback.print_exc()
+        return 1
+    return 0
+
+
+def exec_phase(
+    script_name: str, issue_number: str, adw_id: str, python: Optional[str] = None, **opts
+) -> NoReturn:
+    """Replace the current process with a phase.
+
+    For the last phase of a workflow, when nothing is left to do after it:
+    the workflow's interpreter is released instead of waiting for the phase
+    to exit, and the phase's exit code becomes the process's. On Windows,
+    which cannot replace a process, the phase runs as a child instead.
+    """
+    cmd = phase_command(script_name, issue_number, adw_id, python, **opts)
+    print(f"Handing over to: {' '.join(cmd)}")
+    if os.name == "nt":
+        sys.exit(subprocess.run(cmd).returncode)
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.execvp(cmd[0], cmd)
+
+
+def get_script_dependencies(script_name: str) -> List[str]:
+    """Read the dependencies declared in a phase script's PEP 723 header.
+
+    The `# /// script` block is parsed as TOML, so multi-line arrays and
+    either quote style are read the way uv reads them.
+
+    Raises:
+        OSError: If the script cannot be read
+        ValueError: If the block is not valid TOML
+    """
+    adws_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    with open(os.path.join(adws_dir, script_name), "r") as f:
+        match = PEP723_SCRIPT_BLOCK_RE.search(f.read())
+    if not match:
+        return []
+    content = "".join(
+        line[2:] if line.startswith("# ") else line[1:]
+        for line in match.group("content").splitlines(keepends=True)
+    )
+    return tomllib.loads(content).get("dependencies", [])
+
+
+def prepare_phase_env(adw_id: str, script_names: Iterable[str]) -> Optional[str]:
+    """Install the dependencies of the given phases into one shared virtualenv.
+
+    Each `uv run` resolves its script's dependencies again; preparing the
+    environment once lets isolated phases start with its python instead.
+
+    Returns:
+        Path of the virtualenv's python, or None if it could not be created,
+        in which case phases fall back to `uv run`
+    """
+    project_root = os.path.dirname(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    )
+    venv_dir = os.path.join(project_root, "agents", adw_id, PHASE_VENV_DIRNAME)
+    if os.name == "nt":
+        python = os.path.join(venv_dir, "Scripts", "python.exe")
+    else:
+        python = os.path.join(venv_dir, "bin", "python")
+    print(f"Preparing phase environment: {venv_dir}")
+    try:
+        dependencies = sorted(
+            {dep for script_name in script_names for dep in get_script_dependencies(script_name)}
+        )
+        if not os.path.exists(python):
+            subprocess.run([UV_EXECUTABLE, "venv", "--quiet", venv_dir], check=True, close_fds=False)
+        subprocess.run(
+            [UV_EXECUTABLE, "pip", "install", "--quiet", "--python", python, *dependencies],
+            check=True,
+            close_fds=False,
+        )
+    except (OSError, ValueError, subprocess.CalledProcessError) as e:
+        print(f"WARNING: Could not prepare phase environment, using uv run per phase: {e}")
+        return None
+    return python
+
+
+# Serializes checkpoint reads and writes
+_checkpoint_lock = threading.Lock()
+
+
+def get_checkpoint_path(adw_id: str) -> str:
+    """Get path to the phase checkpoint file for an ADW ID."""
+    project_root = os.path.dirname(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    )
+    return os.path.join(project_root, "agents", adw_id, CHECKPOINT_FILENAME)
+
+
+def compute_phase_fingerprint(adw_id: str, phase: str) -> Optional[str]:
+    """Hash the input file of a phase listed in PHASE_INPUT_FILES.
+
+    Returns:
+        Hex digest of the file, or None when the phase has no tracked input
+        or the file cannot be found
+    """
+    key = PHASE_INPUT_FILES.get(phase)
+    state = ADWState.load(adw_id) if key else None
+    if not state or not state.get(key) or not state.get("worktree_path"):
+        return None
+    try:
+        with open(os.path.join(state.get("worktree_path"), state.get(key)), "rb") as f:
+            return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+    except OSError:
+        return None
+
+
+def _read_checkpoint(adw_id: str) -> Dict:
+    """Read the checkpoint file; empty when missing, unreadable or stale."""
+    try:
+        with open(get_checkpoint_path(adw_id), "r") as f:
+            checkpoint = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if time.time() - checkpoint.get("updated_at", 0) > CHECKPOINT_MAX_AGE:
+        return {}
+    return checkpoint
+
+
+def _write_checkpoint(adw_id: str, completed: Dict[str, str], fingerprints: Dict) -> None:
+    """Write the checkpoint file."""
+    path = get_checkpoint_path(adw_id)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(
+            {"completed": completed, "fingerprints": fingerprints, "updated_at": time.time()},
+            f,
+            indent=2,
+        )
+
+
+def load_checkpoint(adw_id: str) -> Dict[str, str]:
+    """Load the phases an earlier run of this ADW ID completed.
+
+    A phase whose input file (see PHASE_INPUT_FILES) changed since it
+    completed is dropped, together with every phase that completed after
+    it, since those built on its result. A missing input file, or a
+    completion recorded without a fingerprint, counts as changed.
+
+    Returns:
+        Mapping of phase name to completion timestamp; empty when there is
+        no checkpoint, it cannot be read, or it is older than
+        CHECKPOINT_MAX_AGE
+    """
+    with _checkpoint_lock:
+        checkpoint = _read_checkpoint(adw_id)
+        fingerprints = checkpoint.get("fingerprints", {})
+        completed = {}
+        # Phases are stored in the order they completed
+        for phase, timestamp in checkpoint.get("completed", {}).items():
+            if phase in PHASE_INPUT_FILES and (
+                fingerprints.get(phase) is None
+                or fingerprints[phase] != compute_phase_fingerprint(adw_id, phase)
+            ):
+                print(f"↻ Inputs of {phase} changed since it completed; rerunning it and later phases")
+                _write_checkpoint(
+                    adw_id,
+                    completed,
+                    {name: fingerprints.get(name) for name in completed},
+                )
+                break
+            completed[phase] = timestamp
+    return completed
+
+
+def save_checkpoint(adw_id: str, phase: str) -> None:
+    """Record that a phase of this ADW ID completed successfully."""
+    with _checkpoint_lock:
+        checkpoint = _read_checkpoint(adw_id)
+        completed = checkpoint.get("completed", {})
+        fingerprints = checkpoint.get("fingerprints", {})
+        # Re-insert so the stored order stays the order of completion
+        completed.pop(phase, None)
+        completed[phase] = get_local_timestamp()
+        fingerprints[phase] = compute_phase_fingerprint(adw_id, phase)
+        _write_checkpoint(adw_id, completed, fingerprints)
+
+
+def clear_checkpoint(adw_id: str) -> None:
+    """Forget completed phases so the next run starts from the beginning."""
+    try:
+        os.remove(get_checkpoint_path(adw_id))
+    except FileNotFoundError:
+        pass
+
+
+class PhaseDAG:
+    """Run workflow phases in order once the phases they depend on have succeeded.
+
+    Each phase is a callable returning an exit code. Phases run one after
+    another on the calling thread, in the order they were added as far as
+    their dependencies allow. A phase that fails stops everything that
+    depends on it unless it was added with allow_failure.
+    """
+
+    def __init__(self):
+        # name -> (phase, dependencies, allow_failure)
+        self.phases: Dict[str, Tuple[Callable[[], int], Tuple[str, ...], bool]] = {}
+
+    def add(
+        self,
+        name: str,
+        phase: Callable[[], int],
+        deps: Iterable[str] = (),
+        allow_failure: bool = False,
+    ):
+        """Add a phase that runs once all phases in deps have succeeded."""
+        self.phases[name] = (phase, tuple(deps), allow_failure)
+
+    @staticmethod
+    def _call(phase: Callable[[], int]) -> int:
+        """Run one phase, treating an exception as exit code 1."""
+        try:
+            return phase()
+        except Exception:
+            traceback.print_exc()
+            return 1
+
+    def run(self) -> Dict[str, int]:
+        """Run the phases and return the exit code of each phase that ran.
+
+        Phases that never ran, because a dependency failed, are missing
+        from the result.
+        """
+        results: Dict[str, int] = {}
+        pending = dict(self.phases)
+
+        def succeeded(name: str) -> bool:
+            return name in results and (results[name] == 0 or self.phases[name][2])
+
+        def ready() -> List[str]:
+            return [name for name, (_, deps, _) in pending.items() if all(succeeded(dep) for dep in deps)]
+
+        # Phases stay on the calling thread, so Ctrl-C interrupts the running
+        # phase directly and each phase reports its own failure before the
+        # next one starts
+        while names := ready():
+            for name in names:
+                results[name] = self._call(pending.pop(name)[0])
+        return results
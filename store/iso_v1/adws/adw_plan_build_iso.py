@@ -6,24 +6,24 @@
 """
 ADW Plan Build Iso - Compositional workflow for isolated planning and building
 
-Usage: uv run adw_plan_build_iso.py <issue-number> [adw-id]
+Usage: uv run adw_plan_build_iso.py <issue-number> [adw-id] [--isolate]
 
 This script runs:
 1. adw_plan_iso.py - Planning phase (isolated)
 2. adw_build_iso.py - Implementation phase (isolated)
 
 The scripts are chained together via persistent state (adw_state.json).
+Phases run in-process; --isolate runs each one as a separate `uv run`.
 """
 
-import subprocess
 import sys
 import os
 
 # Add the parent directory to Python path to import modules
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from adw_modules.workflow_ops import ensure_adw_id
-from adw_modules.github import make_issue_comment
-from adw_modules.utils import get_local_timestamp
+from adw_modules.workflow_ops import ensure_adw_id, prepare_phase_env, run_phase
+from adw_modules.status_reporter import StatusReporter
+from adw_modules.messages import PHASE_FAIL_TMPL, PLAN_BUILD_SUCCESS_TMPL
 from adw_modules.execution_log import (
     log_execution_start,
     log_execution_end,
@@ -34,15 +34,18 @@ from adw_modules.execution_log import (
 
 def main():
     """Main entry point."""
-    if len(sys.argv) < 2:
-        print("Usage: uv run adw_plan_build_iso.py <issue-number> [adw-id]")
+    isolate = "--isolate" in sys.argv[1:]
+    args = [arg for arg in sys.argv[1:] if arg != "--isolate"]
+
+    if len(args) < 1:
+        print("Usage: uv run adw_plan_build_iso.py <issue-number> [adw-id] [--isolate]")
         print("\nThis runs the isolated plan and build workflow:")
         print("  1. Plan (isolated)")
         print("  2. Build (isolated)")
         sys.exit(1)
 
-    issue_number = sys.argv[1]
-    adw_id = sys.argv[2] if len(sys.argv) > 2 else None
+    issue_number = args[0]
+    adw_id = args[1] if len(args) > 1 else None
 
     # Ensure ADW ID exists with initialized state
     adw_id = ensure_adw_id(issue_number, adw_id)
@@ -59,114 +62,59 @@ def main():
     success = True
     error_info = None
     subprocesses = []
+    summary = None
+    # Progress is shown in one comment, edited in the background at each phase
+    reporter = StatusReporter(issue_number, adw_id, "ADW Plan+Build Workflow", ["Plan", "Build"])
 
     try:
-        # Post workflow start notification
-        try:
-            timestamp = get_local_timestamp()
-            make_issue_comment(
-                issue_number,
-                f"🤖 **ADW Plan+Build Workflow Started**\n\n"
-                f"**Timestamp:** {timestamp}\n"
-                f"**ADW ID:** `{adw_id}`\n"
-                f"**Workflow:** Plan → Build\n\n"
-                f"📋 Phase 1/2: Planning..."
-            )
-        except Exception as e:
-            print(f"WARNING: Failed to post start comment to issue: {e}")
-
-        # Get the directory where this script is located
-        script_dir = os.path.dirname(os.path.abspath(__file__))
+        # Isolated phases share one environment instead of each resolving its own
+        phase_python = (
+            prepare_phase_env(adw_id, ["adw_plan_iso.py", "adw_build_iso.py"]) if isolate else None
+        )
 
         # Run isolated plan with the ADW ID
-        plan_cmd = ["uv", "run", os.path.join(script_dir, "adw_plan_iso.py"), issue_number, adw_id]
         print(f"\n=== ISOLATED PLAN PHASE ===")
-        print(f"Running: {' '.join(plan_cmd)}")
+        reporter.update("Plan", "running")
 
         plan_invocation = track_subprocess_start("adw_plan_iso.py")
-        plan = subprocess.run(plan_cmd)
-        plan_invocation = track_subprocess_end(plan_invocation, plan.returncode)
+        plan_returncode = run_phase("adw_plan_iso.py", issue_number, adw_id, isolate, phase_python)
+        plan_invocation = track_subprocess_end(plan_invocation, plan_returncode)
         subprocesses.append(plan_invocation)
 
-        if plan.returncode != 0:
-            timestamp = get_local_timestamp()
-            error_msg = (
-                f"❌ **ADW Plan Phase Failed**\n\n"
-                f"**Timestamp:** {timestamp}\n"
-                f"**ADW ID:** `{adw_id}`\n"
-                f"**Phase:** Planning\n"
-                f"**Return Code:** {plan.returncode}\n\n"
-                f"**Error:** The planning phase failed to complete successfully.\n\n"
-                f"**Logs:** Check `agents/{adw_id}/planner/raw_output.jsonl` for details."
+        if plan_returncode != 0:
+            print(f"Isolated plan phase failed (return code {plan_returncode})")
+            reporter.update(
+                "Plan",
+                "failed",
+                PHASE_FAIL_TMPL.substitute(
+                    phase="plan", rc=plan_returncode, agent="planner", adw_id=adw_id, issue=issue_number
+                ),
             )
-            print(error_msg)
-            try:
-                make_issue_comment(issue_number, error_msg)
-            except Exception as e:
-                print(f"ERROR: Failed to post error comment to issue: {e}")
             sys.exit(1)
-
-        # Post plan success and build start notification
-        try:
-            timestamp = get_local_timestamp()
-            make_issue_comment(
-                issue_number,
-                f"✅ **Plan Phase Completed**\n\n"
-                f"**Timestamp:** {timestamp}\n"
-                f"**ADW ID:** `{adw_id}`\n\n"
-                f"🔨 Phase 2/2: Building implementation..."
-            )
-        except Exception as e:
-            print(f"WARNING: Failed to post plan success comment to issue: {e}")
+        reporter.update("Plan", "done")
 
         # Run isolated build with the ADW ID
-        build_cmd = ["uv", "run", os.path.join(script_dir, "adw_build_iso.py"), issue_number, adw_id]
         print(f"\n=== ISOLATED BUILD PHASE ===")
-        print(f"Running: {' '.join(build_cmd)}")
+        reporter.update("Build", "running")
 
         build_invocation = track_subprocess_start("adw_build_iso.py")
-        build = subprocess.run(build_cmd)
-        build_invocation = track_subprocess_end(build_invocation, build.returncode)
+        build_returncode = run_phase("adw_build_iso.py", issue_number, adw_id, isolate, phase_python)
+        build_invocation = track_subprocess_end(build_invocation, build_returncode)
         subprocesses.append(build_invocation)
 
-        if build.returncode != 0:
-            timestamp = get_local_timestamp()
-            error_msg = (
-                f"❌ **ADW Build Phase Failed**\n\n"
-                f"**Timestamp:** {timestamp}\n"
-                f"**ADW ID:** `{adw_id}`\n"
-                f"**Phase:** Implementation\n"
-                f"**Return Code:** {build.returncode}\n\n"
-                f"**Error:** The implementation phase failed to complete successfully.\n\n"
-                f"**Status:** Plan was created successfully, but implementation failed.\n\n"
-                f"**Logs:** Check `agents/{adw_id}/implementor/raw_output.jsonl` for details."
+        if build_returncode != 0:
+            print(f"Isolated build phase failed (return code {build_returncode})")
+            reporter.update(
+                "Build",
+                "failed",
+                PHASE_FAIL_TMPL.substitute(
+                    phase="build", rc=build_returncode, agent="implementor", adw_id=adw_id, issue=issue_number
+                ),
             )
-            print(error_msg)
-            try:
-                make_issue_comment(issue_number, error_msg)
-            except Exception as e:
-                print(f"ERROR: Failed to post error comment to issue: {e}")
             sys.exit(1)
+        reporter.update("Build", "done")
 
-        # Post final success notification
-        try:
-            timestamp = get_local_timestamp()
-            make_issue_comment(
-                issue_number,
-                f"✅ **ADW Plan+Build Workflow Completed**\n\n"
-                f"**Timestamp:** {timestamp}\n"
-                f"**ADW ID:** `{adw_id}`\n"
-                f"**Status:** All phases completed successfully! 🎉\n\n"
-                f"**Phases Completed:**\n"
-                f"- ✅ Planning\n"
-                f"- ✅ Implementation\n\n"
-                f"**Next Steps:**\n"
-                f"- Review the changes in the worktree: `trees/{adw_id}/`\n"
-                f"- Check the pull request for the implementation\n"
-                f"- To run tests: `uv run adws/adw_test_iso.py {issue_number} {adw_id}`"
-            )
-        except Exception as e:
-            print(f"WARNING: Failed to post success comment to issue: {e}")
+        summary = PLAN_BUILD_SUCCESS_TMPL.substitute(adw_id=adw_id, issue=issue_number)
 
         print(f"\n=== ISOLATED WORKFLOW COMPLETED ===")
         print(f"ADW ID: {adw_id}")
@@ -184,6 +132,7 @@ def main():
         error_info = (type(e).__name__, str(e))
         raise
     finally:
+        reporter.close(summary)
         log_execution_end(
             start_entry=start_entry,
             exit_code=exit_code,
@@ -34,11 +34,10 @@ from adw_modules.execution_log import (
 def main():
     """Main entry point."""
     # Check for --skip-resolution flag
-    skip_resolution = "--skip-resolution" in sys.argv
-    if skip_resolution:
-        sys.argv.remove("--skip-resolution")
+    skip_resolution = "--skip-resolution" in sys.argv[1:]
+    args = [arg for arg in sys.argv[1:] if arg != "--skip-resolution"]
 
-    if len(sys.argv) < 2:
+    if len(args) < 1:
         print("Usage: uv run adw_plan_build_review_iso.py <issue-number> [adw-id] [--skip-resolution]")
         print("\nThis runs the isolated plan, build, and review workflow:")
         print("  1. Plan (isolated)")
@@ -46,8 +45,8 @@ def main():
         print("  3. Review (isolated)")
         sys.exit(1)
 
-    issue_number = sys.argv[1]
-    adw_id = sys.argv[2] if len(sys.argv) > 2 else None
+    issue_number = args[0]
+    adw_id = args[1] if len(args) > 1 else None
 
     # Ensure ADW ID exists with initialized state
     adw_id = ensure_adw_id(issue_number, adw_id)
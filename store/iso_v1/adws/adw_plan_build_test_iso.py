@@ -6,7 +6,7 @@
 """
 ADW Plan Build Test Iso - Compositional workflow for isolated planning, building, and testing
 
-Usage: uv run adw_plan_build_test_iso.py <issue-number> [adw-id] [--skip-e2e]
+Usage: uv run adw_plan_build_test_iso.py <issue-number> [adw-id] [--skip-e2e] [--isolate] [--restart] [--exec-tail]
 
 This script runs:
 1. adw_plan_iso.py - Planning phase (isolated)
@@ -14,17 +14,33 @@ This script runs:
 3. adw_test_iso.py - Testing phase (isolated)
 
 The scripts are chained together via persistent state (adw_state.json).
+Phases run in-process; --isolate runs each one as a separate `uv run`.
+Phases completed by an interrupted run are skipped; --restart runs them all.
+With --exec-tail the test phase replaces this process instead of running
+under it; it reports its own results and is not checkpointed.
 """
 
-import subprocess
 import sys
 import os
 
 # Add the parent directory to Python path to import modules
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from adw_modules.workflow_ops import ensure_adw_id
-from adw_modules.github import make_issue_comment
-from adw_modules.utils import get_local_timestamp
+from adw_modules.workflow_ops import (
+    clear_checkpoint,
+    ensure_adw_id,
+    exec_phase,
+    load_checkpoint,
+    prepare_phase_env,
+    run_phase,
+    save_checkpoint,
+)
+from adw_modules.status_reporter import StatusReporter
+from adw_modules.messages import (
+    PHASE_FAIL_TMPL,
+    PHASE_HANDOFF_TMPL,
+    PHASE_SKIPPED_TMPL,
+    PLAN_BUILD_TEST_SUCCESS_TMPL,
+)
 from adw_modules.execution_log import (
     log_execution_start,
     log_execution_end,
@@ -32,29 +48,47 @@ from adw_modules.execution_log import (
     track_subprocess_end,
 )
 
+# Phases in the order they run: (name, script)
+PHASES = (
+    ("plan", "adw_plan_iso.py"),
+    ("build", "adw_build_iso.py"),
+    ("test", "adw_test_iso.py"),
+)
+
 
 def main():
     """Main entry point."""
-    # Check for --skip-e2e flag
-    skip_e2e = "--skip-e2e" in sys.argv
-    if skip_e2e:
-        sys.argv.remove("--skip-e2e")
-
-    if len(sys.argv) < 2:
-        print("Usage: uv run adw_plan_build_test_iso.py <issue-number> [adw-id] [--skip-e2e]")
+    # Check for flags
+    skip_e2e = "--skip-e2e" in sys.argv[1:]
+    isolate = "--isolate" in sys.argv[1:]
+    restart = "--restart" in sys.argv[1:]
+    exec_tail = "--exec-tail" in sys.argv[1:]
+    args = [
+        arg
+        for arg in sys.argv[1:]
+        if arg not in ("--skip-e2e", "--isolate", "--restart", "--exec-tail")
+    ]
+
+    if len(args) < 1:
+        print("Usage: uv run adw_plan_build_test_iso.py <issue-number> [adw-id] [--skip-e2e] [--isolate] [--restart] [--exec-tail]")
         print("\nThis runs the isolated plan, build, and test workflow:")
         print("  1. Plan (isolated)")
         print("  2. Build (isolated)")
         print("  3. Test (isolated)")
         sys.exit(1)
 
-    issue_number = sys.argv[1]
-    adw_id = sys.argv[2] if len(sys.argv) > 2 else None
+    issue_number = args[0]
+    adw_id = args[1] if len(args) > 1 else None
 
     # Ensure ADW ID exists with initialized state
     adw_id = ensure_adw_id(issue_number, adw_id)
     print(f"Using ADW ID: {adw_id}")
 
+    # Phases completed by an earlier, interrupted run are skipped
+    if restart:
+        clear_checkpoint(adw_id)
+    completed = load_checkpoint(adw_id)
+
     # Start execution logging
     start_entry = log_execution_start(
         script_name="adw_plan_build_test_iso.py",
@@ -66,147 +100,68 @@ def main():
     success = True
     error_info = None
     subprocesses = []
+    summary = None
+    # Last phase, as (script, opts), left to take over the process with --exec-tail
+    tail = None
+    # Progress is shown in one comment, edited in the background at each phase
+    reporter = StatusReporter(
+        issue_number,
+        adw_id,
+        "ADW Plan+Build+Test Workflow",
+        [name.capitalize() for name, _ in PHASES],
+    )
+    reporter.add_detail(f"**E2E Tests:** {'Skipped' if skip_e2e else 'Included'}")
 
     try:
-        # Post workflow start notification
-        try:
-            timestamp = get_local_timestamp()
-            make_issue_comment(
-                issue_number,
-                f"🤖 **ADW Plan+Build+Test Workflow Started**\n\n"
-                f"**Timestamp:** {timestamp}\n"
-                f"**ADW ID:** `{adw_id}`\n"
-                f"**Workflow:** Plan → Build → Test\n"
-                f"**E2E Tests:** {'Skipped' if skip_e2e else 'Included'}\n\n"
-                f"📋 Phase 1/3: Planning..."
-            )
-        except Exception as e:
-            print(f"WARNING: Failed to post start comment to issue: {e}")
-
-        # Get the directory where this script is located
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-
-        # ===== PLAN PHASE =====
-        plan_cmd = ["uv", "run", os.path.join(script_dir, "adw_plan_iso.py"), issue_number, adw_id]
-        print(f"\n=== ISOLATED PLAN PHASE ===")
-        print(f"Running: {' '.join(plan_cmd)}")
-
-        plan_invocation = track_subprocess_start("adw_plan_iso.py")
-        plan = subprocess.run(plan_cmd)
-        plan_invocation = track_subprocess_end(plan_invocation, plan.returncode)
-        subprocesses.append(plan_invocation)
-
-        if plan.returncode != 0:
-            timestamp = get_local_timestamp()
-            error_msg = (
-                f"❌ **ADW Plan Phase Failed**\n\n"
-                f"**Timestamp:** {timestamp}\n"
-                f"**ADW ID:** `{adw_id}`\n"
-                f"**Phase:** 1/3 - Planning\n"
-                f"**Return Code:** {plan.returncode}"
-            )
-            print(error_msg)
-            try:
-                make_issue_comment(issue_number, error_msg)
-            except Exception as e:
-                print(f"ERROR: Failed to post error comment to issue: {e}")
-            sys.exit(1)
-
-        # Post plan success
-        try:
-            timestamp = get_local_timestamp()
-            make_issue_comment(
-                issue_number,
-                f"✅ **Plan Phase Completed** ({timestamp})\n\n🔨 Phase 2/3: Building implementation..."
-            )
-        except Exception as e:
-            print(f"WARNING: Failed to post plan success comment to issue: {e}")
-
-        # ===== BUILD PHASE =====
-        build_cmd = ["uv", "run", os.path.join(script_dir, "adw_build_iso.py"), issue_number, adw_id]
-        print(f"\n=== ISOLATED BUILD PHASE ===")
-        print(f"Running: {' '.join(build_cmd)}")
-
-        build_invocation = track_subprocess_start("adw_build_iso.py")
-        build = subprocess.run(build_cmd)
-        build_invocation = track_subprocess_end(build_invocation, build.returncode)
-        subprocesses.append(build_invocation)
-
-        if build.returncode != 0:
-            timestamp = get_local_timestamp()
-            error_msg = (
-                f"❌ **ADW Build Phase Failed**\n\n"
-                f"**Timestamp:** {timestamp}\n"
-                f"**ADW ID:** `{adw_id}`\n"
-                f"**Phase:** 2/3 - Implementation\n"
-                f"**Return Code:** {build.returncode}"
-            )
-            print(error_msg)
-            try:
-                make_issue_comment(issue_number, error_msg)
-            except Exception as e:
-                print(f"ERROR: Failed to post error comment to issue: {e}")
-            sys.exit(1)
-
-        # Post build success
-        try:
-            timestamp = get_local_timestamp()
-            make_issue_comment(
-                issue_number,
-                f"✅ **Build Phase Completed** ({timestamp})\n\n🧪 Phase 3/3: Running tests..."
-            )
-        except Exception as e:
-            print(f"WARNING: Failed to post build success comment to issue: {e}")
-
-        # ===== TEST PHASE =====
-        test_cmd = ["uv", "run", os.path.join(script_dir, "adw_test_iso.py"), issue_number, adw_id]
-        if skip_e2e:
-            test_cmd.append("--skip-e2e")
-
-        print(f"\n=== ISOLATED TEST PHASE ===")
-        print(f"Running: {' '.join(test_cmd)}")
-
-        test_invocation = track_subprocess_start("adw_test_iso.py")
-        test = subprocess.run(test_cmd)
-        test_invocation = track_subprocess_end(test_invocation, test.returncode)
-        subprocesses.append(test_invocation)
-
-        if test.returncode != 0:
-            timestamp = get_local_timestamp()
-            error_msg = (
-                f"❌ **ADW Test Phase Failed**\n\n"
-                f"**Timestamp:** {timestamp}\n"
-                f"**ADW ID:** `{adw_id}`\n"
-                f"**Phase:** 3/3 - Testing\n"
-                f"**Return Code:** {test.returncode}"
-            )
-            print(error_msg)
-            try:
-                make_issue_comment(issue_number, error_msg)
-            except Exception as e:
-                print(f"ERROR: Failed to post error comment to issue: {e}")
-            sys.exit(1)
-
-        # Post final success notification
-        try:
-            timestamp = get_local_timestamp()
-            make_issue_comment(
-                issue_number,
-                f"✅ **ADW Plan+Build+Test Workflow Completed**\n\n"
-                f"**Timestamp:** {timestamp}\n"
-                f"**ADW ID:** `{adw_id}`\n"
-                f"**Status:** All phases completed successfully! 🎉\n\n"
-                f"**Phases Completed:**\n"
-                f"- ✅ Planning\n"
-                f"- ✅ Implementation\n"
-                f"- ✅ Testing"
-            )
-        except Exception as e:
-            print(f"WARNING: Failed to post success comment to issue: {e}")
+        # Isolated phases share one environment instead of each resolving its own
+        phase_python = (
+            prepare_phase_env(adw_id, [script_name for _, script_name in PHASES]) if isolate else None
+        )
 
-        print(f"\n=== ISOLATED WORKFLOW COMPLETED ===")
-        print(f"ADW ID: {adw_id}")
-        print(f"All phases completed successfully!")
+        # Options passed to a phase's run()
+        phase_opts = {"test": {"skip_e2e": skip_e2e}}
+
+        # Run each isolated phase with the ADW ID
+        for name, script_name in PHASES:
+            title = name.capitalize()
+            print(f"\n=== ISOLATED {name.upper()} PHASE ===")
+            if name in completed:
+                print(f"↷ Skipping {title} (already completed at {completed[name]})")
+                reporter.update(title, "done", PHASE_SKIPPED_TMPL.substitute(ts=completed[name]))
+                continue
+            if exec_tail and name == PHASES[-1][0]:
+                # Nothing follows the last phase, so it takes over this process
+                # once the progress comment and execution log are finalized
+                reporter.update(title, "running", PHASE_HANDOFF_TMPL.substitute(phase=name))
+                tail = (script_name, phase_opts.get(name, {}))
+                break
+            reporter.update(title, "running")
+
+            invocation = track_subprocess_start(script_name)
+            returncode = run_phase(
+                script_name, issue_number, adw_id, isolate, phase_python, **phase_opts.get(name, {})
+            )
+            subprocesses.append(track_subprocess_end(invocation, returncode))
+
+            if returncode != 0:
+                print(f"Isolated {name} phase failed (return code {returncode})")
+                reporter.update(
+                    title,
+                    "failed",
+                    PHASE_FAIL_TMPL.substitute(
+                        phase=name, rc=returncode, agent=name, adw_id=adw_id, issue=issue_number
+                    ),
+                )
+                sys.exit(1)
+            save_checkpoint(adw_id, name)
+            reporter.update(title, "done")
+
+        if tail is None:
+            summary = PLAN_BUILD_TEST_SUCCESS_TMPL.substitute()
+
+            print(f"\n=== ISOLATED WORKFLOW COMPLETED ===")
+            print(f"ADW ID: {adw_id}")
+            print(f"All phases completed successfully!")
 
     except SystemExit as e:
         exit_code = e.code if isinstance(e.code, int) else 1
@@ -220,6 +175,7 @@ def main():
         error_info = (type(e).__name__, str(e))
         raise
     finally:
+        reporter.close(summary)
         log_execution_end(
             start_entry=start_entry,
             exit_code=exit_code,
@@ -229,6 +185,10 @@ def main():
             subprocesses=subprocesses,
         )
 
+    if tail:
+        script_name, opts = tail
+        exec_phase(script_name, issue_number, adw_id, phase_python, **opts)
+
 
 if __name__ == "__main__":
     main()
@@ -269,22 +269,13 @@ def build_review_summary(review_result: ReviewResult) -> str:
     return "\n".join(summary_parts)
 
 
-def main():
-    """Main entry point."""
-    load_dotenv()
+def run(issue_number: str, adw_id: str, skip_resolution: bool = False):
+    """Run the isolated review phase for an issue.
 
-    skip_resolution = "--skip-resolution" in sys.argv
-    if skip_resolution:
-        sys.argv.remove("--skip-resolution")
-
-    if len(sys.argv) < 3:
-        print("Usage: uv run adw_review_iso.py <issue-number> <adw-id> [--skip-resolution]")
-        print("\nError: adw-id is required to locate the worktree")
-        print("Run adw_plan_iso.py or adw_patch_iso.py first to create the worktree")
-        sys.exit(1)
-
-    issue_number = sys.argv[1]
-    adw_id = sys.argv[2]
+    Can be called in-process by composite workflows; failures exit via
+    sys.exit just as when the script is run directly.
+    """
+    load_dotenv()
 
     temp_logger = setup_logger(adw_id, "adw_review_iso")
     state = ADWState.load(adw_id, temp_logger)
@@ -497,5 +488,22 @@ def main():
         )
 
 
+def main():
+    """Main entry point."""
+    skip_resolution = "--skip-resolution" in sys.argv[1:]
+    args = [arg for arg in sys.argv[1:] if arg != "--skip-resolution"]
+
+    if len(args) < 2:
+        print("Usage: uv run adw_review_iso.py <issue-number> <adw-id> [--skip-resolution]")
+        print("\nError: adw-id is required to locate the worktree")
+        print("Run adw_plan_iso.py or adw_patch_iso.py first to create the worktree")
+        sys.exit(1)
+
+    issue_number = args[0]
+    adw_id = args[1]
+
+    run(issue_number, adw_id, skip_resolution)
+
+
 if __name__ == "__main__":
     main()
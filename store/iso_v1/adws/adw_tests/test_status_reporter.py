@@ -0,0 +1,151 @@
+"""
+Unit tests for the StatusReporter progress comment.
+
+Tests verify that the reporter:
+- Posts one comment and edits it for later updates
+- Renders every phase with its status
+- Keeps working when GitHub calls fail
+- Refreshes the comment while a phase runs
+- Does not resend an unchanged comment
+- Does not post a new comment per update when it has no comment ID
+"""
+
+import sys
+import time
+from unittest.mock import patch
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(__file__).rsplit('/', 2)[0])
+
+from adw_modules.status_reporter import StatusReporter
+
+
+class TestStatusReporter:
+    """Test suite for StatusReporter."""
+
+    @patch("adw_modules.status_reporter.update_issue_comment")
+    @patch("adw_modules.status_reporter.make_issue_comment", return_value="42")
+    def test_posts_once_then_edits(self, mock_make, mock_update):
+        """Test the first update posts a comment and later ones edit it."""
+        reporter = StatusReporter("7", "abc12345", "ADW Test Workflow", ["Plan", "Build"])
+        reporter.update("Plan", "running")
+        reporter.update("Plan", "done")
+        reporter.update("Build", "running")
+        reporter.close()
+
+        assert mock_make.call_count == 1
+        assert mock_make.call_args[0][0] == "7"
+        assert all(call[0][0] == "42" for call in mock_update.call_args_list)
+
+    @patch("adw_modules.status_reporter.update_issue_comment")
+    @patch("adw_modules.status_reporter.make_issue_comment", return_value="42")
+    def test_final_comment_shows_all_phases(self, mock_make, mock_update):
+        """Test the last comment sent reflects every phase and the summary."""
+        reporter = StatusReporter("7", "abc12345", "ADW Test Workflow", ["Plan", "Build"])
+        reporter.update("Plan", "done")
+        reporter.update("Build", "failed", "**Return Code:** 1")
+        reporter.close("Summary line")
+
+        calls = mock_update.call_args_list or mock_make.call_args_list
+        body = calls[-1][0][1]
+        assert "ADW Test Workflow - Failed" in body
+        assert "✅ **Plan**" in body
+        assert "❌ **Build**" in body
+        assert "**Return Code:** 1" in body
+        assert body.endswith("Summary line")
+
+    def test_render_pending_and_completed(self):
+        """Test the workflow state follows the phase statuses."""
+        with patch("adw_modules.status_reporter.make_issue_comment"):
+            reporter = StatusReporter("7", "abc12345", "ADW Test Workflow", ["Plan"])
+            assert "ADW Test Workflow - Running" in reporter.render()
+            assert "⬜ **Plan**" in reporter.render()
+            reporter.update("Plan", "done")
+            reporter.close()
+        assert "ADW Test Workflow - Completed" in reporter.render()
+
+    @patch("adw_modules.status_reporter.make_issue_comment", side_effect=RuntimeError("gh failed"))
+    def test_github_errors_do_not_raise(self, mock_make, capsys):
+        """Test a failing GitHub call is reported as a warning only."""
+        reporter = StatusReporter("7", "abc12345", "ADW Test Workflow", ["Plan"])
+        reporter.update("Plan", "running")
+        reporter.close()
+
+        assert reporter.comment_id is None
+        assert "Failed to post progress comment" in capsys.readouterr().out
+
+    @patch("adw_modules.status_reporter.update_issue_comment")
+    @patch("adw_modules.status_reporter.make_issue_comment", return_value="42")
+    def test_heartbeat_refreshes_running_phase(self, mock_make, mock_update):
+        """Test the comment is refreshed while a phase keeps running."""
+        reporter = StatusReporter(
+            "7", "abc12345", "ADW Test Workflow", ["Plan"], heartbeat_interval=0.01
+        )
+        reporter.update("Plan", "running")
+        # Pretend the phase started two minutes ago
+        reporter.running_since["Plan"] -= 120
+        time.sleep(0.1)
+        assert mock_update.called
+        reporter.close()
+
+        assert mock_make.call_count == 1
+        assert "2m elapsed" in mock_update.call_args_list[0][0][1]
+
+    @patch("adw_modules.status_reporter.update_issue_comment")
+    @patch("adw_modules.status_reporter.make_issue_comment", return_value="42")
+    def test_identical_body_not_resent(self, mock_make, mock_update):
+        """Test a body identical to the last one sent is dropped."""
+        reporter = StatusReporter("7", "abc12345", "ADW Test Workflow", ["Plan"])
+        reporter._send("first")
+        reporter._send("first")
+        reporter._send("second")
+        reporter._send("second")
+        reporter.close()
+
+        assert mock_make.call_count == 1
+        bodies = [call[0][1] for call in mock_update.call_args_list]
+        assert bodies.count("second") == 1
+
+    @patch("adw_modules.status_reporter.update_issue_comment")
+    @patch("adw_modules.status_reporter.make_issue_comment", side_effect=[RuntimeError("502"), "42"])
+    def test_failed_body_is_retried(self, mock_make, mock_update):
+        """Test a body that failed to send is not treated as sent."""
+        reporter = StatusReporter("7", "abc12345", "ADW Test Workflow", ["Plan"])
+        reporter._send("first")
+        reporter._send("first")
+        reporter.close()
+
+        assert mock_make.call_count == 2
+        assert reporter.comment_id == "42"
+
+    @patch("adw_modules.status_reporter.update_issue_comment")
+    @patch("adw_modules.status_reporter.make_issue_comment", return_value=None)
+    def test_unknown_comment_id_stops_posting(self, mock_make, mock_update):
+        """Test a comment posted without an ID is not followed by new ones."""
+        reporter = StatusReporter(
+            "7", "abc12345", "ADW Test Workflow", ["Plan", "Build"], heartbeat_interval=0.01
+        )
+        reporter.update("Plan", "running")
+        reporter.running_since["Plan"] -= 120
+        time.sleep(0.1)
+        reporter.update("Plan", "done")
+        reporter.update("Build", "running")
+        reporter.close("Summary line")
+
+        assert mock_make.call_count == 1
+        assert not mock_update.called
+
+    @patch("adw_modules.status_reporter.update_issue_comment")
+    @patch("adw_modules.status_reporter.make_issue_comment", side_effect=RuntimeError("gh failed"))
+    def test_heartbeat_waits_for_comment_id(self, mock_make, mock_update):
+        """Test the heartbeat does not try to post a comment that failed to post."""
+        reporter = StatusReporter(
+            "7", "abc12345", "ADW Test Workflow", ["Plan"], heartbeat_interval=0.01
+        )
+        reporter.update("Plan", "running")
+        reporter.running_since["Plan"] -= 120
+        time.sleep(0.1)
+
+        assert mock_make.call_count == 1
+        reporter.close()
+        assert not mock_update.called
@@ -0,0 +1,310 @@
+"""
+Unit tests for workflow_ops phase orchestration.
+
+Tests verify that PhaseDAG:
+- Runs phases in dependency order
+- Skips the dependents of a failed phase
+- Runs phases on the calling thread
+
+and that phase checkpoints:
+- Return completed phases in the order they completed
+- Are forgotten on --restart (clear_checkpoint)
+- Are ignored when expired or unreadable
+- Rerun build and every later phase when the plan file changed
+
+and that phase environments:
+- Read PEP 723 dependencies written the way uv accepts them
+- Fall back to uv run when a script header cannot be read
+"""
+
+import json
+import sys
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(__file__).rsplit('/', 2)[0])
+
+from adw_modules.workflow_ops import (
+    CHECKPOINT_FILENAME,
+    CHECKPOINT_MAX_AGE,
+    PhaseDAG,
+    clear_checkpoint,
+    get_script_dependencies,
+    load_checkpoint,
+    prepare_phase_env,
+    save_checkpoint,
+)
+
+
+def recording_phase(calls, name, returncode=0):
+    """Build a phase that records its name and returns returncode."""
+    def run():
+        calls.append(name)
+        return returncode
+    return run
+
+
+class TestPhaseDAG:
+    """Test suite for PhaseDAG."""
+
+    def test_dependency_order(self):
+        """Test phases wait for their dependencies, whatever the add order."""
+        calls = []
+        dag = PhaseDAG()
+        dag.add("document", recording_phase(calls, "document"), deps=["test", "review"])
+        dag.add("review", recording_phase(calls, "review"), deps=["build"])
+        dag.add("test", recording_phase(calls, "test"), deps=["build"])
+        dag.add("build", recording_phase(calls, "build"), deps=["plan"])
+        dag.add("plan", recording_phase(calls, "plan"))
+
+        results = dag.run()
+
+        assert calls[:2] == ["plan", "build"]
+        assert set(calls[2:4]) == {"test", "review"}
+        assert calls[4] == "document"
+        assert results == {name: 0 for name in calls}
+
+    def test_failure_skips_dependents(self):
+        """Test a failed phase stops everything that depends on it."""
+        calls = []
+        dag = PhaseDAG()
+        dag.add("plan", recording_phase(calls, "plan"))
+        dag.add("build", recording_phase(calls, "build", 2), deps=["plan"])
+        dag.add("test", recording_phase(calls, "test"), deps=["build"])
+        dag.add("lint", recording_phase(calls, "lint"), deps=["plan"])
+
+        results = dag.run()
+
+        assert calls == ["plan", "build", "lint"]
+        assert results == {"plan": 0, "build": 2, "lint": 0}
+
+    def test_allow_failure_continues(self):
+        """Test dependents still run after a phase added with allow_failure fails."""
+        calls = []
+        dag = PhaseDAG()
+        dag.add("test", recording_phase(calls, "test", 1), allow_failure=True)
+        dag.add("document", recording_phase(calls, "document"), deps=["test"])
+
+        results = dag.run()
+
+        assert calls == ["test", "document"]
+        assert results == {"test": 1, "document": 0}
+
+    def test_exception_counts_as_failure(self):
+        """Test a phase that raises is recorded as exit code 1."""
+        calls = []
+
+        def broken():
+            raise RuntimeError("boom")
+
+        dag = PhaseDAG()
+        dag.add("build", broken)
+        dag.add("test", recording_phase(calls, "test"), deps=["build"])
+
+        assert dag.run() == {"build": 1}
+        assert calls == []
+
+    def test_runs_on_calling_thread(self):
+        """Test phases are not handed to a worker thread."""
+        threads = []
+
+        def phase():
+            threads.append(threading.current_thread())
+            return 0
+
+        dag = PhaseDAG()
+        dag.add("plan", phase)
+        dag.add("build", phase, deps=["plan"])
+        dag.run()
+
+        assert threads == [threading.current_thread()] * 2
+
+
+class TestCheckpoint:
+    """Test suite for the phase checkpoint helpers."""
+
+    @pytest.fixture(autouse=True)
+    def checkpoint_dir(self, tmp_path):
+        """Keep checkpoints under a temporary agents directory."""
+        with patch(
+            "adw_modules.workflow_ops.get_checkpoint_path",
+            lambda adw_id: str(tmp_path / adw_id / CHECKPOINT_FILENAME),
+        ):
+            yield tmp_path
+
+    def test_no_checkpoint(self):
+        """Test a fresh ADW ID has no completed phases."""
+        assert load_checkpoint("abc12345") == {}
+
+    def test_saved_phases_are_loaded_in_order(self):
+        """Test completed phases come back in the order they completed."""
+        save_checkpoint("abc12345", "plan")
+        save_checkpoint("abc12345", "test")
+        save_checkpoint("abc12345", "review")
+
+        assert list(load_checkpoint("abc12345")) == ["plan", "test", "review"]
+
+    def test_checkpoints_are_per_adw_id(self):
+        """Test one run's checkpoint does not leak into another's."""
+        save_checkpoint("abc12345", "plan")
+
+        assert load_checkpoint("def67890") == {}
+
+    def test_restart_clears_completed_phases(self):
+        """Test clear_checkpoint (--restart) makes every phase run again."""
+        save_checkpoint("abc12345", "plan")
+        clear_checkpoint("abc12345")
+
+        assert load_checkpoint("abc12345") == {}
+        # Clearing twice, or with nothing saved, is harmless
+        clear_checkpoint("abc12345")
+
+    def test_completed_phases_are_skipped(self):
+        """Test a resumed run only runs the phases not recorded as completed."""
+        save_checkpoint("abc12345", "plan")
+        completed = load_checkpoint("abc12345")
+        calls = []
+
+        def phase(name):
+            def run():
+                if name not in completed:
+                    calls.append(name)
+                    save_checkpoint("abc12345", name)
+                return 0
+            return run
+
+        dag = PhaseDAG()
+        dag.add("plan", phase("plan"))
+        dag.add("test", phase("test"), deps=["plan"])
+        dag.run()
+
+        assert calls == ["test"]
+        assert list(load_checkpoint("abc12345")) == ["plan", "test"]
+
+    def test_expired_checkpoint_is_ignored(self, checkpoint_dir):
+        """Test a checkpoint older than CHECKPOINT_MAX_AGE counts as empty."""
+        save_checkpoint("abc12345", "plan")
+        path = checkpoint_dir / "abc12345" / CHECKPOINT_FILENAME
+        with open(path) as f:
+            checkpoint = json.load(f)
+        checkpoint["updated_at"] = time.time() - CHECKPOINT_MAX_AGE - 1
+        with open(path, "w") as f:
+            json.dump(checkpoint, f)
+
+        assert load_checkpoint("abc12345") == {}
+
+    def test_unreadable_checkpoint_is_ignored(self, checkpoint_dir):
+        """Test a corrupt checkpoint file counts as empty."""
+        save_checkpoint("abc12345", "plan")
+        with open(checkpoint_dir / "abc12345" / CHECKPOINT_FILENAME, "w") as f:
+            f.write("{not json")
+
+        assert load_checkpoint("abc12345") == {}
+
+
+class TestCheckpointFingerprint:
+    """Test suite for invalidating checkpoints whose phase inputs changed."""
+
+    @pytest.fixture(autouse=True)
+    def worktree(self, tmp_path):
+        """Give abc12345 a worktree with a plan file and a temporary checkpoint."""
+        worktree = tmp_path / "trees" / "abc12345"
+        (worktree / "specs").mkdir(parents=True)
+        (worktree / "specs" / "plan.md").write_text("# Plan\n")
+        state = {"plan_file": "specs/plan.md", "worktree_path": str(worktree)}
+        with patch(
+            "adw_modules.workflow_ops.get_checkpoint_path",
+            lambda adw_id: str(tmp_path / "agents" / adw_id / CHECKPOINT_FILENAME),
+        ), patch("adw_modules.workflow_ops.ADWState") as mock_state:
+            mock_state.load.return_value = state
+            yield worktree
+
+    def complete_all(self):
+        """Record plan through review as completed, in order."""
+        for phase in ("plan", "build", "test", "review"):
+            save_checkpoint("abc12345", phase)
+
+    def test_unchanged_input_skips_phase(self):
+        """Test build stays completed while its plan file is unchanged."""
+        self.complete_all()
+
+        assert list(load_checkpoint("abc12345")) == ["plan", "build", "test", "review"]
+
+    def test_changed_plan_reruns_build_and_later_phases(self, worktree):
+        """Test editing the plan drops build and everything completed after it."""
+        self.complete_all()
+        (worktree / "specs" / "plan.md").write_text("# Plan\n\nRevised\n")
+
+        assert list(load_checkpoint("abc12345")) == ["plan"]
+        # The stale phases are pruned from the file, not just ignored once
+        (worktree / "specs" / "plan.md").write_text("# Plan\n")
+        assert list(load_checkpoint("abc12345")) == ["plan"]
+
+    def test_missing_input_is_stale(self, worktree):
+        """Test build reruns when its plan file no longer exists."""
+        self.complete_all()
+        (worktree / "specs" / "plan.md").unlink()
+
+        assert list(load_checkpoint("abc12345")) == ["plan"]
+
+    def test_missing_fingerprint_is_stale(self, tmp_path):
+        """Test a build completion recorded without a fingerprint is rerun."""
+        self.complete_all()
+        path = tmp_path / "agents" / "abc12345" / CHECKPOINT_FILENAME
+        checkpoint = json.loads(path.read_text())
+        del checkpoint["fingerprints"]["build"]
+        path.write_text(json.dumps(checkpoint))
+
+        assert list(load_checkpoint("abc12345")) == ["plan"]
+
+
+class TestPhaseEnv:
+    """Test suite for reading phase dependencies and preparing their environment."""
+
+    @pytest.fixture
+    def adws_dir(self, tmp_path):
+        """Point workflow_ops at a temporary adws directory."""
+        modules_dir = tmp_path / "adws" / "adw_modules"
+        modules_dir.mkdir(parents=True)
+        with patch("adw_modules.workflow_ops.__file__", str(modules_dir / "workflow_ops.py")):
+            yield tmp_path / "adws"
+
+    def test_single_line_dependencies(self, adws_dir):
+        """Test the one-line header used by the phase scripts."""
+        (adws_dir / "phase.py").write_text(
+            '# /// script\n# dependencies = ["python-dotenv", "pydantic"]\n# ///\n'
+        )
+        assert get_script_dependencies("phase.py") == ["python-dotenv", "pydantic"]
+
+    def test_multi_line_dependencies(self, adws_dir):
+        """Test a multi-line array with single quotes is read in full."""
+        (adws_dir / "phase.py").write_text(
+            "#!/usr/bin/env -S uv run\n"
+            "# /// script\n"
+            "# requires-python = '>=3.11'\n"
+            "# dependencies = [\n"
+            "#   'python-dotenv',\n"
+            "#   'pydantic>=2',\n"
+            "# ]\n"
+            "# ///\n"
+        )
+        assert get_script_dependencies("phase.py") == ["python-dotenv", "pydantic>=2"]
+
+    def test_no_header(self, adws_dir):
+        """Test a script without inline metadata has no dependencies."""
+        (adws_dir / "phase.py").write_text("print('hi')\n")
+        assert get_script_dependencies("phase.py") == []
+
+    @pytest.mark.parametrize("header", [None, "# /// script\n# dependencies = [oops\n# ///\n"])
+    def test_unreadable_header_falls_back(self, adws_dir, header, capsys):
+        """Test a missing script or invalid header makes phases use uv run."""
+        if header is not None:
+            (adws_dir / "phase.py").write_text(header)
+        with patch("adw_modules.workflow_ops.subprocess.run") as mock_run:
+            assert prepare_phase_env("abc12345", ["phase.py"]) is None
+        assert not mock_run.called
+        assert "using uv run per phase" in capsys.readouterr().out
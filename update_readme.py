@@ -1,43 +1,71 @@
 #!/usr/bin/env python3
 """Update README.md with gitignore documentation"""
 
-# Read README
-with open('README.md', 'r', encoding='utf-8') as f:
-    content = f.read()
+import re
 
-# Read gitignore section
-with open('README_gitignore_section.md', 'r', encoding='utf-8') as f:
-    gitignore_section = f.read()
+# Markers showing an edit was already applied
+gitignore_heading = '## GitIgnore Management'
+gitignore_option = '| `--gitignore`'
 
-# Insert GitIgnore section before 'Usage Examples'
-if '## GitIgnore Management' not in content:
-    content = content.replace('## Usage Examples', gitignore_section + '\n\n## Usage Examples')
-    print("Added GitIgnore Management section")
-else:
-    print("GitIgnore Management section already exists")
+# Insertion point for the GitIgnore section
+usage_heading = '## Usage Examples'
 
-# Update command-line options table
+# Command-line options table lines to update
 old_line = '| `--mode` | `-m` | Setup mode: `basic` or `iso` (required) |'
 new_line = '| `--mode` | `-m` | Setup mode: `basic` or `iso` (required for artifact mode) |'
-content = content.replace(old_line, new_line)
 
 old_execute = '| `--execute` | `-e` | Actually copy files (default: dry-run) |'
 new_execute = '| `--execute` | `-e` | Actually perform operations (default: dry-run) |'
-content = content.replace(old_execute, new_execute)
 
-# Add gitignore options after overwrite
 overwrite_line = '| `--overwrite` | `-o` | Overwrite existing files (default: skip) |'
-if '| `--gitignore`' not in content:
-    gitignore_lines = '''| `--overwrite` | `-o` | Overwrite existing files (default: skip) |
+gitignore_lines = '''| `--overwrite` | `-o` | Overwrite existing files (default: skip) |
 | `--gitignore` | | Manage .gitignore for specified language (e.g., `python`, `csharp`) |
 | `--gitignore_execute` | | GitIgnore operation: `compare`, `merge`, or `replace` (default: compare) |'''
-    content = content.replace(overwrite_line, gitignore_lines)
-    print("Added gitignore options to command-line table")
-else:
-    print("Gitignore options already in table")
-
-# Write back
-with open('README.md', 'w', encoding='utf-8') as f:
-    f.write(content)
+
+# Finds markers and edit targets in a single scan of the README
+pattern = re.compile('|'.join(map(re.escape, [
+    gitignore_heading, gitignore_option, usage_heading, old_line, old_execute, overwrite_line,
+])))
+
+# Read gitignore section
+with open('README_gitignore_section.md', 'r', encoding='utf-8') as f:
+    gitignore_section = f.read()
+
+with open('README.md', 'r+', encoding='utf-8') as f:
+    content = f.read()
+    matches = list(pattern.finditer(content))
+    found = {match.group(0) for match in matches}
+
+    # Map each line to edit to its replacement
+    replacements = {old_line: new_line, old_execute: new_execute}
+
+    # Insert GitIgnore section before 'Usage Examples'
+    if gitignore_heading not in found:
+        replacements[usage_heading] = gitignore_section + '\n\n' + usage_heading
+        print("Added GitIgnore Management section")
+    else:
+        print("GitIgnore Management section already exists")
+
+    # Add gitignore options after overwrite
+    if gitignore_option not in found:
+        replacements[overwrite_line] = gitignore_lines
+        print("Added gitignore options to command-line table")
+    else:
+        print("Gitignore options already in table")
+
+    # Splice the replacements in at the recorded offsets
+    parts = []
+    position = 0
+    for match in matches:
+        if match.group(0) in replacements:
+            parts.append(content[position:match.start()])
+            parts.append(replacements[match.group(0)])
+            position = match.end()
+    parts.append(content[position:])
+
+    # Write back
+    f.seek(0)
+    f.write(''.join(parts))
+    f.truncate()
 
 print('README.md updated successfully')